@@ -1,5 +1,14 @@
+import time
+
 import streamlit as st
-import math
+
+from unit_converter import categories, convert_to_all, metrics
+from unit_converter.cache import cached_conversion, memoized_conversion
+from unit_converter.formatting import LOCALES, MAX_DIGITS, NOTATIONS, format_array, format_value, number_format
+from unit_converter.history import HistoryStore
+
+# Time the whole script run (Streamlit reruns it on every interaction)
+rerun_started = time.perf_counter()
 
 # Set page configuration
 st.set_page_config(
@@ -8,8 +17,10 @@ st.set_page_config(
     layout="wide"
 )
 
-# Add custom CSS for styling
-st.markdown("""
+# Static tables are built once per server process and shared by all sessions
+@st.cache_resource
+def load_page_css():
+    return """
 <style>
     .stApp {
         background-color:rgb(247, 44, 91) !important;
@@ -56,445 +67,34 @@ st.markdown("""
         color: black;
     }
 </style>
-""", unsafe_allow_html=True)
-
-# Define conversion functions
-def length_conversion(value, from_unit, to_unit):
-    # Conversion factors to meters
-    to_meter = {
-        "Meter": 1,
-        "Kilometer": 1000,
-        "Centimeter": 0.01,
-        "Millimeter": 0.001,
-        "Mile": 1609.34,
-        "Yard": 0.9144,
-        "Foot": 0.3048,
-        "Inch": 0.0254,
-        "Nautical Mile": 1852
-    }
-    
-    # Convert to meters first, then to target unit
-    meters = value * to_meter[from_unit]
-    result = meters / to_meter[to_unit]
-    
-    # Create formula text
-    formula = f"{value} {from_unit} = {result:.6g} {to_unit}"
-    if from_unit != to_unit:
-        formula += f" (Conversion: {value} × {to_meter[from_unit]:.6g} ÷ {to_meter[to_unit]:.6g})"
-    
-    return result, formula
-
-def weight_conversion(value, from_unit, to_unit):
-    # Conversion factors to grams
-    to_gram = {
-        "Kilogram": 1000,
-        "Gram": 1,
-        "Milligram": 0.001,
-        "Pound": 453.592,
-        "Ounce": 28.3495,
-        "Ton (Metric)": 1000000,
-        "Ton (US)": 907185,
-        "Stone": 6350.29
-    }
-    
-    # Convert to grams first, then to target unit
-    grams = value * to_gram[from_unit]
-    result = grams / to_gram[to_unit]
-    
-    # Create formula text
-    formula = f"{value} {from_unit} = {result:.6g} {to_unit}"
-    if from_unit != to_unit:
-        formula += f" (Conversion: {value} × {to_gram[from_unit]:.6g} ÷ {to_gram[to_unit]:.6g})"
-    
-    return result, formula
-
-def temperature_conversion(value, from_unit, to_unit):
-    result = 0
-    formula = ""
-    
-    # Direct conversions
-    if from_unit == "Celsius" and to_unit == "Fahrenheit":
-        result = (value * 9/5) + 32
-        formula = f"{value}°C = ({value} × 9/5) + 32 = {result:.6g}°F"
-    elif from_unit == "Celsius" and to_unit == "Kelvin":
-        result = value + 273.15
-        formula = f"{value}°C = {value} + 273.15 = {result:.6g}K"
-    elif from_unit == "Fahrenheit" and to_unit == "Celsius":
-        result = (value - 32) * 5/9
-        formula = f"{value}°F = ({value} - 32) × 5/9 = {result:.6g}°C"
-    elif from_unit == "Fahrenheit" and to_unit == "Kelvin":
-        result = (value - 32) * 5/9 + 273.15
-        formula = f"{value}°F = ({value} - 32) × 5/9 + 273.15 = {result:.6g}K"
-    elif from_unit == "Kelvin" and to_unit == "Celsius":
-        result = value - 273.15
-        formula = f"{value}K = {value} - 273.15 = {result:.6g}°C"
-    elif from_unit == "Kelvin" and to_unit == "Fahrenheit":
-        result = (value - 273.15) * 9/5 + 32
-        formula = f"{value}K = ({value} - 273.15) × 9/5 + 32 = {result:.6g}°F"
-    else:  # Same unit
-        result = value
-        formula = f"{value} {from_unit} = {result} {to_unit}"
-        
-    return result, formula
-
-def area_conversion(value, from_unit, to_unit):
-    # Conversion factors to square meters
-    to_sq_meter = {
-        "Square Meter": 1,
-        "Square Kilometer": 1000000,
-        "Square Mile": 2590000,
-        "Hectare": 10000,
-        "Acre": 4046.86,
-        "Square Foot": 0.092903,
-        "Square Inch": 0.00064516,
-        "Square Yard": 0.836127
-    }
-    
-    # Convert to square meters first, then to target unit
-    sq_meters = value * to_sq_meter[from_unit]
-    result = sq_meters / to_sq_meter[to_unit]
-    
-    # Create formula text
-    formula = f"{value} {from_unit} = {result:.6g} {to_unit}"
-    if from_unit != to_unit:
-        formula += f" (Conversion: {value} × {to_sq_meter[from_unit]:.6g} ÷ {to_sq_meter[to_unit]:.6g})"
-    
-    return result, formula
+"""
 
-def volume_conversion(value, from_unit, to_unit):
-    # Conversion factors to milliliters
-    to_ml = {
-        "Cubic Meter": 1000000,
-        "Liter": 1000,
-        "Milliliter": 1,
-        "Gallon (US)": 3785.41,
-        "Gallon (UK)": 4546.09,
-        "Quart (US)": 946.353,
-        "Pint (US)": 473.176,
-        "Cup": 236.588,
-        "Fluid Ounce (US)": 29.5735,
-        "Tablespoon": 14.7868,
-        "Teaspoon": 4.92892,
-        "Cubic Inch": 16.3871,
-        "Cubic Foot": 28316.8
-    }
-    
-    # Convert to milliliters first, then to target unit
-    ml = value * to_ml[from_unit]
-    result = ml / to_ml[to_unit]
-    
-    # Create formula text
-    formula = f"{value} {from_unit} = {result:.6g} {to_unit}"
-    if from_unit != to_unit:
-        formula += f" (Conversion: {value} × {to_ml[from_unit]:.6g} ÷ {to_ml[to_unit]:.6g})"
-    
-    return result, formula
-
-def time_conversion(value, from_unit, to_unit):
-    # Conversion factors to seconds
-    to_second = {
-        "Second": 1,
-        "Minute": 60,
-        "Hour": 3600,
-        "Day": 86400,
-        "Week": 604800,
-        "Month (30 days)": 2592000,
-        "Year (365 days)": 31536000,
-        "Millisecond": 0.001,
-        "Microsecond": 0.000001,
-        "Nanosecond": 0.000000001
-    }
-    
-    # Convert to seconds first, then to target unit
-    seconds = value * to_second[from_unit]
-    result = seconds / to_second[to_unit]
-    
-    # Create formula text
-    formula = f"{value} {from_unit} = {result:.6g} {to_unit}"
-    if from_unit != to_unit:
-        formula += f" (Conversion: {value} × {to_second[from_unit]:.6g} ÷ {to_second[to_unit]:.6g})"
-    
-    return result, formula
-
-def speed_conversion(value, from_unit, to_unit):
-    # Conversion factors to meters per second
-    to_mps = {
-        "Meter/Second": 1,
-        "Kilometer/Hour": 0.277778,
-        "Mile/Hour": 0.44704,
-        "Foot/Second": 0.3048,
-        "Knot": 0.514444,
-        "Mach (at sea level)": 340.29
-    }
-    
-    # Convert to meters per second first, then to target unit
-    mps = value * to_mps[from_unit]
-    result = mps / to_mps[to_unit]
-    
-    # Create formula text
-    formula = f"{value} {from_unit} = {result:.6g} {to_unit}"
-    if from_unit != to_unit:
-        formula += f" (Conversion: {value} × {to_mps[from_unit]:.6g} ÷ {to_mps[to_unit]:.6g})"
-    
-    return result, formula
-
-def pressure_conversion(value, from_unit, to_unit):
-    # Conversion factors to pascals
-    to_pascal = {
-        "Pascal": 1,
-        "Kilopascal": 1000,
-        "Bar": 100000,
-        "PSI": 6894.76,
-        "Atmosphere": 101325,
-        "Torr": 133.322,
-        "Millimeter of Mercury": 133.322
-    }
-    
-    # Convert to pascals first, then to target unit
-    pascals = value * to_pascal[from_unit]
-    result = pascals / to_pascal[to_unit]
-    
-    # Create formula text
-    formula = f"{value} {from_unit} = {result:.6g} {to_unit}"
-    if from_unit != to_unit:
-        formula += f" (Conversion: {value} × {to_pascal[from_unit]:.6g} ÷ {to_pascal[to_unit]:.6g})"
-    
-    return result, formula
-
-def energy_conversion(value, from_unit, to_unit):
-    # Conversion factors to joules
-    to_joule = {
-        "Joule": 1,
-        "Kilojoule": 1000,
-        "Calorie": 4.184,
-        "Kilocalorie": 4184,
-        "Watt-hour": 3600,
-        "Kilowatt-hour": 3600000,
-        "Electronvolt": 1.602176634e-19,
-        "British Thermal Unit": 1055.06,
-        "Foot-pound": 1.35582
-    }
-    
-    # Convert to joules first, then to target unit
-    joules = value * to_joule[from_unit]
-    result = joules / to_joule[to_unit]
-    
-    # Create formula text
-    formula = f"{value} {from_unit} = {result:.6g} {to_unit}"
-    if from_unit != to_unit:
-        formula += f" (Conversion: {value} × {to_joule[from_unit]:.6g} ÷ {to_joule[to_unit]:.6g})"
-    
-    return result, formula
-
-def power_conversion(value, from_unit, to_unit):
-    # Conversion factors to watts
-    to_watt = {
-        "Watt": 1,
-        "Kilowatt": 1000,
-        "Megawatt": 1000000,
-        "Horsepower": 745.7,
-        "Foot-pound/minute": 0.0225969,
-        "BTU/hour": 0.29307107
-    }
-    
-    # Convert to watts first, then to target unit
-    watts = value * to_watt[from_unit]
-    result = watts / to_watt[to_unit]
-    
-    # Create formula text
-    formula = f"{value} {from_unit} = {result:.6g} {to_unit}"
-    if from_unit != to_unit:
-        formula += f" (Conversion: {value} × {to_watt[from_unit]:.6g} ÷ {to_watt[to_unit]:.6g})"
-    
-    return result, formula
-
-def data_conversion(value, from_unit, to_unit):
-    # Conversion factors to bytes (using binary prefixes)
-    to_byte = {
-        "Bit": 0.125,
-        "Byte": 1,
-        "Kilobyte (KB)": 1024,
-        "Megabyte (MB)": 1024**2,
-        "Gigabyte (GB)": 1024**3,
-        "Terabyte (TB)": 1024**4,
-        "Petabyte (PB)": 1024**5,
-        "Kibibyte (KiB)": 1024,
-        "Mebibyte (MiB)": 1024**2,
-        "Gibibyte (GiB)": 1024**3,
-        "Tebibyte (TiB)": 1024**4,
-        "Pebibyte (PiB)": 1024**5
-    }
-    
-    # Convert to bytes first, then to target unit
-    bytes_value = value * to_byte[from_unit]
-    result = bytes_value / to_byte[to_unit]
-    
-    # Create formula text
-    formula = f"{value} {from_unit} = {result:.6g} {to_unit}"
-    if from_unit != to_unit:
-        formula += f" (Conversion: {value} × {to_byte[from_unit]:.6g} ÷ {to_byte[to_unit]:.6g})"
-    
-    return result, formula
+@st.cache_resource
+def load_category_options():
+    category_icons = {cat: data["icon"] for cat, data in categories.items()}
+    category_options = [f"{category_icons[cat]} {cat}" for cat in categories.keys()]
+    return category_options
 
-def angle_conversion(value, from_unit, to_unit):
-    # Conversion factors to radians
-    to_radian = {
-        "Radian": 1,
-        "Degree": math.pi/180,
-        "Gradian": math.pi/200,
-        "Minute of Arc": math.pi/(180*60),
-        "Second of Arc": math.pi/(180*3600),
-        "Turn/Revolution": 2*math.pi
-    }
-    
-    # Convert to radians first, then to target unit
-    radians = value * to_radian[from_unit]
-    result = radians / to_radian[to_unit]
-    
-    # Create formula text
-    formula = f"{value} {from_unit} = {result:.6g} {to_unit}"
-    if from_unit != to_unit:
-        formula += f" (Conversion through radians)"
-    
-    return result, formula
+# One history store (and writer thread) per server process
+@st.cache_resource
+def load_history_store():
+    return HistoryStore()
 
-def fuel_economy_conversion(value, from_unit, to_unit):
-    # First convert everything to kilometers per liter
-    if from_unit == "Miles per Gallon (US)":
-        kpl = value * 0.425144
-    elif from_unit == "Miles per Gallon (UK)":
-        kpl = value * 0.354006
-    elif from_unit == "Kilometers per Liter":
-        kpl = value
-    elif from_unit == "Liters per 100 Kilometers":
-        kpl = 100 / value if value != 0 else float('inf')
-    
-    # Then convert to the target unit
-    if to_unit == "Miles per Gallon (US)":
-        result = kpl / 0.425144
-    elif to_unit == "Miles per Gallon (UK)":
-        result = kpl / 0.354006
-    elif to_unit == "Kilometers per Liter":
-        result = kpl
-    elif to_unit == "Liters per 100 Kilometers":
-        result = 100 / kpl if kpl != 0 else float('inf')
-    
-    # Create formula text
-    formula = f"{value} {from_unit} = {result:.6g} {to_unit}"
-    
-    return result, formula
+# Add custom CSS for styling
+st.markdown(load_page_css(), unsafe_allow_html=True)
 
-def currency_conversion(value, from_unit, to_unit):
-    # Exchange rates (as of a recent date)
-    # In a real app, you would use an API to get current rates
-    exchange_rates = {
-        "USD": 1.0,
-        "EUR": 0.92,
-        "GBP": 0.79,
-        "JPY": 149.5,
-        "CAD": 1.35,
-        "AUD": 1.52,
-        "INR": 83.1,
-        "CNY": 7.2,
-        "PKR": 278.5,  # Pakistani Rupee
-        "SAR": 3.75,    # Saudi Riyal
-        "AED": 3.67     # UAE Dirham
-    }
-    
-    # Convert to USD first, then to target currency
-    usd_amount = value / exchange_rates[from_unit]
-    result = usd_amount * exchange_rates[to_unit]
-    
-    # Create formula text
-    formula = f"{value} {from_unit} = {result:.6g} {to_unit}"
-    if from_unit != to_unit:
-        formula += f" (Via USD: {value}/{exchange_rates[from_unit]} × {exchange_rates[to_unit]})"
-    
-    return result, formula
+# Per-session state is kept small: the unit pair picked in each visited category
+# (everything else - unit tables, formulas, caches - is shared by all sessions)
+if 'unit_pairs' not in st.session_state:
+    st.session_state['unit_pairs'] = {}
 
-# Define conversion categories and their units
-categories = {
-    "Length": {
-        "units": ["Meter", "Kilometer", "Centimeter", "Millimeter", "Mile", "Yard", "Foot", "Inch", "Nautical Mile"],
-        "conversion_function": length_conversion,
-        "icon": "📏"
-    },
-    "Weight/Mass": {
-        "units": ["Kilogram", "Gram", "Milligram", "Pound", "Ounce", "Ton (Metric)", "Ton (US)", "Stone"],
-        "conversion_function": weight_conversion,
-        "icon": "⚖️"
-    },
-    "Temperature": {
-        "units": ["Celsius", "Fahrenheit", "Kelvin"],
-        "conversion_function": temperature_conversion,
-        "icon": "🌡️"
-    },
-    "Area": {
-        "units": ["Square Meter", "Square Kilometer", "Square Mile", "Hectare", "Acre", "Square Foot", "Square Inch", "Square Yard"],
-        "conversion_function": area_conversion,
-        "icon": "📐"
-    },
-    "Volume": {
-        "units": ["Cubic Meter", "Liter", "Milliliter", "Gallon (US)", "Gallon (UK)", "Quart (US)", "Pint (US)", 
-                 "Cup", "Fluid Ounce (US)", "Tablespoon", "Teaspoon", "Cubic Inch", "Cubic Foot"],
-        "conversion_function": volume_conversion,
-        "icon": "🧪"
-    },
-    "Time": {
-        "units": ["Second", "Minute", "Hour", "Day", "Week", "Month (30 days)", "Year (365 days)", 
-                 "Millisecond", "Microsecond", "Nanosecond"],
-        "conversion_function": time_conversion,
-        "icon": "⏱️"
-    },
-    "Speed": {
-        "units": ["Meter/Second", "Kilometer/Hour", "Mile/Hour", "Foot/Second", "Knot", "Mach (at sea level)"],
-        "conversion_function": speed_conversion,
-        "icon": "🚀"
-    },
-    "Pressure": {
-        "units": ["Pascal", "Kilopascal", "Bar", "PSI", "Atmosphere", "Torr", "Millimeter of Mercury"],
-        "conversion_function": pressure_conversion,
-        "icon": "🔄"
-    },
-    "Energy": {
-        "units": ["Joule", "Kilojoule", "Calorie", "Kilocalorie", "Watt-hour", "Kilowatt-hour", 
-                 "Electronvolt", "British Thermal Unit", "Foot-pound"],
-        "conversion_function": energy_conversion,
-        "icon": "⚡"
-    },
-    "Power": {
-        "units": ["Watt", "Kilowatt", "Megawatt", "Horsepower", "Foot-pound/minute", "BTU/hour"],
-        "conversion_function": power_conversion,
-        "icon": "💪"
-    },
-    "Data": {
-        "units": ["Bit", "Byte", "Kilobyte (KB)", "Megabyte (MB)", "Gigabyte (GB)", "Terabyte (TB)", "Petabyte (PB)",
-                 "Kibibyte (KiB)", "Mebibyte (MiB)", "Gibibyte (GiB)", "Tebibyte (TiB)", "Pebibyte (PiB)"],
-        "conversion_function": data_conversion,
-        "icon": "💾"
-    },
-    "Angle": {
-        "units": ["Degree", "Radian", "Gradian", "Minute of Arc", "Second of Arc", "Turn/Revolution"],
-        "conversion_function": angle_conversion,
-        "icon": "📐"
-    },
-    "Fuel Economy": {
-        "units": ["Miles per Gallon (US)", "Miles per Gallon (UK)", "Kilometers per Liter", "Liters per 100 Kilometers"],
-        "conversion_function": fuel_economy_conversion,
-        "icon": "⛽"
-    },
-    "Currency": {
-        "units": ["USD", "EUR", "GBP", "JPY", "CAD", "AUD", "INR", "CNY", "PKR", "SAR", "AED"],
-        "conversion_function": currency_conversion,
-        "icon": "💰"
-    }
-}
+# Initialize per-session performance counters
+if 'perf' not in st.session_state:
+    st.session_state['perf'] = {"reruns": 0, "total_ms": 0.0, "last_ms": 0.0, "cache_hits": 0, "cache_misses": 0,
+                                "partial_reruns": 0, "partial_total_ms": 0.0, "partial_last_ms": 0.0}
 
-# Initialize session state for swap functionality
-if 'from_unit' not in st.session_state:
-    st.session_state['from_unit'] = {}
-if 'to_unit' not in st.session_state:
-    st.session_state['to_unit'] = {}
+# Tells the converter fragment whether it runs inside a full rerun or on its own
+st.session_state['perf']['full_run'] = True
 
 # Main app
 def main():
@@ -503,10 +103,7 @@ def main():
     st.markdown("Convert between different units of measurement with ease and precision.")
     
     # Category selection
-    category_icons = {cat: data["icon"] for cat, data in categories.items()}
-    category_options = [f"{category_icons[cat]} {cat}" for cat in categories.keys()]
-    
-    selected_category_with_icon = st.selectbox("Select Category", category_options)
+    selected_category_with_icon = st.selectbox("Select Category", load_category_options())
     selected_category = selected_category_with_icon.split(" ", 1)[1]  # Remove the icon
     
     # Get the selected category data
@@ -515,6 +112,67 @@ def main():
     # Display category title
     st.markdown(f'<p class="category-title">{category_data["icon"]} {selected_category} Conversion</p>', unsafe_allow_html=True)
     
+    # Start each category on its favorite or most used unit pair from the history
+    history_store = load_history_store()
+    unit_pairs = st.session_state['unit_pairs']
+    if selected_category not in unit_pairs:
+        preferred = history_store.preferred_pair(selected_category)
+        if preferred and all(unit in category_data["units"] for unit in preferred):
+            unit_pairs[selected_category] = tuple(preferred)
+        else:
+            to_unit_index = 1 if len(category_data["units"]) > 1 else 0
+            unit_pairs[selected_category] = (category_data["units"][0], category_data["units"][to_unit_index])
+    
+    # The widgets use one set of keys for every category; recreate the unit
+    # pickers with this category's pair when the category changes
+    if st.session_state.get('category') != selected_category:
+        st.session_state.pop("from_unit_select", None)
+        st.session_state.pop("to_unit_select", None)
+        st.session_state['category'] = selected_category
+    
+    # Value, units, result and formula (reruns on its own when they change)
+    converter_fragment(selected_category)
+    
+    # List favorites and recent pairs in the sidebar
+    show_history(selected_category)
+    
+    # Add information about the category
+    st.subheader("About this conversion")
+    st.write(category_data["description"])
+
+    # Footer
+    st.markdown("---")
+    st.markdown("### How to use this converter")
+    st.write("1. Select a category from the dropdown menu")
+    st.write("2. Enter a value in the 'From' section")
+    st.write("3. Select the units you want to convert from and to")
+    st.write("4. The result will be displayed automatically")
+    st.write("5. Use the 'Swap Units' button to quickly reverse the conversion")
+    st.write("6. Turn on 'Show in all units' to see the value in every unit of the category")
+
+@st.fragment
+def converter_fragment(category):
+    # Time the converter on its own when only the fragment reruns
+    started = time.perf_counter()
+    show_converter(category)
+    perf = st.session_state['perf']
+    if not perf['full_run']:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        perf["partial_reruns"] += 1
+        perf["partial_total_ms"] += elapsed_ms
+        perf["partial_last_ms"] = elapsed_ms
+
+def show_converter(category):
+    # Value input, unit pickers, result, formula and the all-units table
+    category_data = categories[category]
+    from_unit, to_unit = st.session_state['unit_pairs'][category]
+    # The format controls are drawn below the result; read their current values first
+    result_format = number_format(
+        int(st.session_state.get("format_digits", 6)),
+        st.session_state.get("format_notation", NOTATIONS[0]),
+        st.session_state.get("format_locale", next(iter(LOCALES))),
+    )
+    
     # Create two columns for input and output
     col1, col2 = st.columns(2)
     
@@ -524,63 +182,60 @@ def main():
             "Enter value",
             value=1.0,
             format="%.6g",
-            key=f"from_value_{selected_category}"
+            key="from_value"
         )
         
-        # Initialize default from_unit if not set for this category
-        if selected_category not in st.session_state['from_unit']:
-            st.session_state['from_unit'][selected_category] = category_data["units"][0]
-        
         from_unit = st.selectbox(
             "From unit",
             options=category_data["units"],
-            index=category_data["units"].index(st.session_state['from_unit'][selected_category]),
-            key=f"from_unit_select_{selected_category}"
+            index=category_data["units"].index(from_unit),
+            key="from_unit_select"
         )
-        # Update session state
-        st.session_state['from_unit'][selected_category] = from_unit
     
     with col2:
         st.subheader("To")
         
-        # Initialize default to_unit if not set for this category
-        if selected_category not in st.session_state['to_unit']:
-            to_unit_index = 1 if len(category_data["units"]) > 1 else 0
-            st.session_state['to_unit'][selected_category] = category_data["units"][to_unit_index]
-        
         to_unit = st.selectbox(
             "To unit",
             options=category_data["units"],
-            index=category_data["units"].index(st.session_state['to_unit'][selected_category]),
-            key=f"to_unit_select_{selected_category}"
+            index=category_data["units"].index(to_unit),
+            key="to_unit_select"
         )
         # Update session state
-        st.session_state['to_unit'][selected_category] = to_unit
+        st.session_state['unit_pairs'][category] = (from_unit, to_unit)
         
         # Calculate conversion
         try:
-            result, formula = category_data["conversion_function"](from_value, from_unit, to_unit)
+            hits_before = cached_conversion.cache_info().hits
+            result, formula = memoized_conversion(category, from_unit, to_unit, from_value, result_format)
+            # Approximate per-session hit rate (the cache is shared by all sessions)
+            if cached_conversion.cache_info().hits > hits_before:
+                st.session_state['perf']['cache_hits'] += 1
+            else:
+                st.session_state['perf']['cache_misses'] += 1
+            
+            # Record new conversions (queued; written to disk off the render path)
+            conversion_key = (category, from_unit, to_unit, from_value)
+            if st.session_state.get('last_recorded') != conversion_key:
+                load_history_store().record(category, from_unit, to_unit, from_value, result)
+                st.session_state['last_recorded'] = conversion_key
             
             # Display result
             st.markdown('<div class="result-box">' + 
-                       f'<span class="result-value">{result:.6g}</span>' +
+                       f'<span class="result-value">{format_value(result, result_format)}</span>' +
                        '</div>', 
                        unsafe_allow_html=True)
         except Exception as e:
             st.error(f"Error in conversion: {str(e)}")
             result, formula = 0, "Error in conversion"
     
-    # Swap button
-    if st.button("↔️ Swap Units", key=f"swap_{selected_category}"):
-        # Swap the units in session state
-        temp_from = st.session_state['from_unit'][selected_category]
-        temp_to = st.session_state['to_unit'][selected_category]
-        
-        st.session_state['from_unit'][selected_category] = temp_to
-        st.session_state['to_unit'][selected_category] = temp_from
-        
-        # Use st.rerun() instead of experimental_rerun
-        st.rerun()
+    # Swap button (the callback runs before the fragment redraws, so one partial rerun is enough)
+    st.button("↔️ Swap Units", key="swap", on_click=use_pair, args=(category, to_unit, from_unit))
+    
+    # Favorite button
+    if st.button("⭐ Add to Favorites", key="favorite"):
+        load_history_store().add_favorite(category, from_unit, to_unit)
+        st.toast(f"Saved {from_unit} → {to_unit} to favorites")
     
     # Display formula
     st.markdown('<div class="formula-box">' + 
@@ -588,50 +243,96 @@ def main():
                '</div>', 
                unsafe_allow_html=True)
     
-    # Add information about the category
-    st.subheader("About this conversion")
-    if selected_category == "Length":
-        st.write("Length is a measure of distance. In this converter, all length units are converted through meters as the base unit.")
-    elif selected_category == "Weight/Mass":
-        st.write("Weight (or mass) is a measure of how heavy an object is. All weight units are converted through grams as the base unit.")
-    elif selected_category == "Temperature":
-        st.write("Temperature is a measure of how hot or cold something is. Temperature conversions use specific formulas rather than simple multiplication.")
-    elif selected_category == "Area":
-        st.write("Area is a measure of the size of a surface. All area units are converted through square meters as the base unit.")
-    elif selected_category == "Volume":
-        st.write("Volume is a measure of the three-dimensional space occupied by a substance. All volume units are converted through milliliters as the base unit.")
-    elif selected_category == "Time":
-        st.write("Time is a measure of duration. All time units are converted through seconds as the base unit.")
-    elif selected_category == "Speed":
-        st.write("Speed is a measure of how quickly something moves. All speed units are converted through meters per second as the base unit.")
-    elif selected_category == "Pressure":
-        st.write("Pressure is force per unit area. All pressure units are converted through pascals as the base unit.")
-    elif selected_category == "Energy":
-        st.write("Energy is the capacity to do work. All energy units are converted through joules as the base unit.")
-    elif selected_category == "Power":
-        st.write("Power is the rate at which energy is transferred. All power units are converted through watts as the base unit.")
-    elif selected_category == "Data":
-        st.write("Data storage units measure digital information. All data units are converted through bytes as the base unit.")
-    elif selected_category == "Angle":
-        st.write("Angle measures rotation or orientation. All angle units are converted through radians as the base unit.")
-    elif selected_category == "Fuel Economy":
-        st.write("Fuel economy measures the efficiency of fuel consumption. Units are converted through kilometers per liter as an intermediate step.")
-    elif selected_category == "Currency":
-        st.write("Currency conversion is based on exchange rates. Note: These rates are approximations and may not reflect current market values.")
+    show_number_format()
+    
+    # Show the value in every unit of the category at once
+    if st.toggle("Show in all units", key="all_units"):
+        all_values = convert_to_all(from_value, category, from_unit)
+        # Format the whole column in one vectorized pass
+        formatted = format_array(list(all_values.values()), result_format)
+        st.dataframe(
+            {"Unit": list(all_values), "Value": [text.decode() for text in formatted.tolist()]},
+            hide_index=True,
+            width="stretch"
+        )
 
-    # Footer
-    st.markdown("---")
-    st.markdown("### How to use this converter")
-    st.write("1. Select a category from the dropdown menu")
-    st.write("2. Enter a value in the 'From' section")
-    st.write("3. Select the units you want to convert from and to")
-    st.write("4. The result will be displayed automatically")
-    st.write("5. Use the 'Swap Units' button to quickly reverse the conversion")
+# Wrap once here: fragment reruns call it again without re-running the script
+show_converter = metrics.instrument(show_converter, "unit_converter_converter_seconds")
+
+def show_number_format():
+    # Significant digits, notation and separators for results, formulas and the all-units table
+    with st.expander("Number format"):
+        col1, col2, col3 = st.columns(3)
+        col1.number_input("Significant digits", min_value=1, max_value=MAX_DIGITS,
+                          value=6, step=1, key="format_digits")
+        col2.selectbox("Notation", NOTATIONS, key="format_notation")
+        col3.selectbox("Separators", list(LOCALES), key="format_locale")
+
+def use_pair(category, from_unit, to_unit):
+    # Select a saved unit pair (the unit widgets are recreated with the new defaults)
+    st.session_state['unit_pairs'][category] = (from_unit, to_unit)
+    st.session_state.pop("from_unit_select", None)
+    st.session_state.pop("to_unit_select", None)
+
+def show_history(category):
+    # This category's favorite and recently used unit pairs, one click to reuse
+    history_store = load_history_store()
+    with st.sidebar.expander("Favorites & recent", expanded=True):
+        favorites = [pair[1:] for pair in history_store.favorites(category)]
+        recent = [pair for pair in history_store.recent(category, limit=5) if pair not in favorites]
+        if not favorites and not recent:
+            st.caption("Conversions you make will show up here.")
+        for i, (from_unit, to_unit) in enumerate(favorites):
+            st.button(f"⭐ {from_unit} → {to_unit}", key=f"use_favorite_{i}",
+                      on_click=use_pair, args=(category, from_unit, to_unit))
+        for i, (from_unit, to_unit) in enumerate(recent):
+            st.button(f"{from_unit} → {to_unit}", key=f"use_recent_{i}",
+                      on_click=use_pair, args=(category, from_unit, to_unit))
+
+def show_performance():
+    # Per-session rerun timings and conversion cache hit rates
+    perf = st.session_state['perf']
+    lookups = perf["cache_hits"] + perf["cache_misses"]
+    hit_rate = perf["cache_hits"] / lookups if lookups else 0.0
+    mean_ms = perf["total_ms"] / perf["reruns"] if perf["reruns"] else 0.0
+    partial_mean_ms = perf["partial_total_ms"] / perf["partial_reruns"] if perf["partial_reruns"] else 0.0
+    info = cached_conversion.cache_info()
+    
+    with st.sidebar.expander("Performance"):
+        st.write(f"Reruns this session: {perf['reruns']}")
+        st.write(f"Last rerun: {perf['last_ms']:.1f} ms (mean {mean_ms:.1f} ms)")
+        st.write(f"Converter-only reruns: {perf['partial_reruns']}, "
+                 f"last {perf['partial_last_ms']:.1f} ms (mean {partial_mean_ms:.1f} ms)")
+        st.write(f"Conversion cache hit rate (this session): {hit_rate:.0%} of {lookups}")
+        st.write(f"Shared cache: {info.currsize}/{info.maxsize} entries, {info.hits} hits, {info.misses} misses")
+
+def show_diagnostics():
+    # Hidden panel (?diagnostics=1) with the opt-in conversion metrics
+    if st.query_params.get("diagnostics") != "1":
+        return
+    with st.sidebar.expander("Diagnostics", expanded=True):
+        if not metrics.enabled:
+            st.caption("Set UNIT_CONVERTER_METRICS=1 to collect timings.")
+            return
+        st.dataframe(metrics.summary(), hide_index=True)
+        st.download_button("Download metrics", metrics.render(), file_name="metrics.txt")
+
+def record_rerun():
+    # Update this session's rerun timing counters
+    perf = st.session_state['perf']
+    elapsed_ms = (time.perf_counter() - rerun_started) * 1000
+    perf["reruns"] += 1
+    perf["total_ms"] += elapsed_ms
+    perf["last_ms"] = elapsed_ms
+    perf["full_run"] = False
 
 # Run the app
 if __name__ == "__main__":
     try:
-        main()
+        metrics.instrument(main, "unit_converter_main_seconds")()
+        show_performance()
+        show_diagnostics()
     except Exception as e:
         st.error(f"An unexpected error occurred: {str(e)}")
         st.info("Please report this error to the developer.")
+    record_rerun()
@@ -0,0 +1,44 @@
+"""Benchmark the "all units" table: one matrix row versus one call per unit.
+
+For every category this computes the full from→to matrix (every unit
+converted to every other unit), once with convert_to_all() per source
+unit and once with a separate conversion function call per pair, which is
+what rendering each target unit on its own costs. Run from the repository
+root:
+
+    python benchmarks/all_units.py --number 2000
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unit_converter import categories, convert_to_all  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="full matrices per measurement")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'category':<16}{'units':>6}{'per-pair µs':>13}{'row µs':>9}{'speedup':>9}")
+    for category, data in categories.items():
+        convert = data["conversion_function"]
+        units = data["units"]
+
+        def per_pair():
+            return [[convert(12.5, from_unit, to_unit).value for to_unit in units] for from_unit in units]
+
+        def by_row():
+            return [convert_to_all(12.5, category, from_unit) for from_unit in units]
+
+        pair_us = min(timeit.repeat(per_pair, number=args.number, repeat=args.repeat)) / args.number * 1e6
+        row_us = min(timeit.repeat(by_row, number=args.number, repeat=args.repeat)) / args.number * 1e6
+        print(f"{category:<16}{len(units):>6}{pair_us:>13.1f}{row_us:>9.1f}{pair_us / row_us:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Throughput of memory-mapped bulk conversion versus the CSV path.
+
+Writes a multi-gigabyte raw float64 file (plus a float32 copy and an Arrow
+IPC file of the same values), then converts it through memory maps into a
+second file, in place, and from Arrow IPC to Arrow IPC. A CSV file with a
+slice of the same data goes through the streaming column converter for
+comparison. Rates are in GB of float64 payload per second (and values per
+second), with dirty pages flushed to disk before each run and the
+best of --repeat runs reported. Run from the repository
+root:
+
+    python benchmarks/bulk_io.py --gigabytes 4
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unit_converter.binary import convert_arrow, convert_raw  # noqa: E402
+from unit_converter.cli import convert_file  # noqa: E402
+
+CHUNK = 1 << 24
+PAIR = ("Pressure", "PSI", "Pascal")
+
+
+def write_inputs(directory, values_count, csv_values):
+    """Write the raw float64/float32, Arrow IPC and CSV inputs chunk by chunk."""
+    import pyarrow as pa
+
+    rng = np.random.default_rng(0)
+    paths = {name: os.path.join(directory, name) for name in ("in.f64", "in.f32", "in.arrow", "in.csv")}
+    schema = pa.schema([("pressure", pa.float64())])
+    with open(paths["in.f64"], "wb") as f64, open(paths["in.f32"], "wb") as f32, \
+            pa.ipc.new_file(paths["in.arrow"], schema) as arrow:
+        for start in range(0, values_count, CHUNK):
+            chunk = rng.uniform(0, 5000, min(CHUNK, values_count - start))
+            chunk.tofile(f64)
+            chunk.astype(np.float32).tofile(f32)
+            arrow.write_batch(pa.record_batch([pa.array(chunk)], schema=schema))
+    with open(paths["in.csv"], "w") as f:
+        f.write("pressure\n")
+        np.savetxt(f, np.fromfile(paths["in.f64"], count=csv_values), fmt="%.17g")
+    return paths
+
+
+def report(name, seconds, values_count):
+    gigabytes = values_count * 8 / 1e9
+    print(f"{name:<28}{seconds:>9.2f}{gigabytes / seconds:>9.2f}{values_count / seconds / 1e6:>12.1f}")
+    return values_count / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--gigabytes", type=float, default=4.0, help="size of the float64 input")
+    parser.add_argument("--csv-values", type=int, default=5000000, help="values in the CSV comparison")
+    parser.add_argument("--repeat", type=int, default=2, help="runs per path (the best is reported)")
+    parser.add_argument("--dir", help="scratch directory (default: a temporary directory)")
+    args = parser.parse_args()
+
+    directory = args.dir or tempfile.mkdtemp(prefix="bulk-io-")
+    values_count = int(args.gigabytes * 1e9) // 8
+    try:
+        paths = write_inputs(directory, values_count, min(args.csv_values, values_count))
+        output = os.path.join(directory, "out")
+        print(f"{'path':<28}{'seconds':>9}{'GB/s':>9}{'Mvalues/s':>12}")
+
+        timings = {}
+        # Flush the freshly written inputs so their writeback isn't timed
+        os.sync()
+        for name, run in [
+            ("raw float64 -> new file", lambda: convert_raw(paths["in.f64"], *PAIR, output_path=output + ".f64")),
+            ("raw float64 in place", lambda: convert_raw(paths["in.f64"], *PAIR)),
+            ("raw float32 -> new file", lambda: convert_raw(paths["in.f32"], *PAIR, output_path=output + ".f32")),
+            ("Arrow IPC -> Arrow IPC", lambda: convert_arrow(paths["in.arrow"], output + ".arrow",
+                                                             [("pressure",) + PAIR])),
+        ]:
+            seconds = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                run()
+                seconds.append(time.perf_counter() - start)
+                os.sync()
+            timings[name] = report(name, min(seconds), values_count)
+
+        csv_values = min(args.csv_values, values_count)
+        start = time.perf_counter()
+        convert_file(paths["in.csv"], output + ".csv", [("pressure",) + PAIR])
+        csv_rate = report("CSV -> CSV (slice)", time.perf_counter() - start, csv_values)
+        print(f"raw mmap is {timings['raw float64 -> new file'] / csv_rate:.0f}x the CSV rate")
+    finally:
+        if not args.dir:
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
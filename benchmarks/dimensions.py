@@ -0,0 +1,60 @@
+"""Benchmark cached dimensional-analysis plans against the direct functions.
+
+For a set of unit pairs this times the existing category function, a
+cached dimensional_conversion of the same pair, and compound pairs that
+only the dimensional engine can express. Run from the repository root:
+
+    python benchmarks/dimensions.py --number 200000
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unit_converter import categories  # noqa: E402
+from unit_converter.dimensions import dimensional_conversion, static_plan  # noqa: E402
+
+DIRECT_PAIRS = [
+    ("Length", "Mile", "Kilometer"),
+    ("Pressure", "PSI", "Pascal"),
+    ("Energy", "Kilowatt-hour", "Joule"),
+    ("Temperature", "Fahrenheit", "Celsius"),
+    ("Fuel Economy", "Miles per Gallon (US)", "Liters per 100 Kilometers"),
+]
+
+COMPOUND_PAIRS = [
+    ("kg/m³", "g/cm³"),
+    ("N·m", "ft-lb"),
+    ("GB/s", "MiB/min"),
+    ("kWh/km", "J/m"),
+]
+
+
+def per_call_ns(function, number, repeat):
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'pair':<58}{'direct ns':>11}{'plan ns':>10}")
+    for category, from_unit, to_unit in DIRECT_PAIRS:
+        function = categories[category]["conversion_function"]
+        direct = per_call_ns(lambda: function(12.5, from_unit, to_unit).value, args.number, args.repeat)
+        planned = per_call_ns(lambda: dimensional_conversion(12.5, from_unit, to_unit), args.number, args.repeat)
+        print(f"{from_unit + ' -> ' + to_unit:<58}{direct:>11.0f}{planned:>10.0f}")
+
+    for from_expr, to_expr in COMPOUND_PAIRS:
+        static_plan.cache_clear()
+        first = per_call_ns(lambda: dimensional_conversion(12.5, from_expr, to_expr), 1, 1)
+        planned = per_call_ns(lambda: dimensional_conversion(12.5, from_expr, to_expr), args.number, args.repeat)
+        print(f"{from_expr + ' -> ' + to_expr + f' (first call {first / 1000:.0f} µs)':<58}{'-':>11}{planned:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Throughput of vectorized number formatting against per-value formatting.
+
+Formats a column of values spanning many orders of magnitude with
+format_array() and compares it with a per-value loop (the ``:.6g``
+f-string for the default format, format_value() for the others). Every
+output is checked against format_value(). Run from the repository root:
+
+    python benchmarks/formatting.py --values 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unit_converter.formatting import format_array, format_lines, format_value, number_format  # noqa: E402
+
+# (label, digits, notation, locale)
+FORMATS = [
+    ("default (.6g)", 6, "general", "plain"),
+    ("general 9 en", 9, "general", "en"),
+    ("scientific 4", 4, "scientific", "plain"),
+    ("engineering 9 de", 9, "engineering", "de"),
+    ("si 4 fr", 4, "si", "fr"),
+]
+
+# Half-way ties whose rounding carries into an extra figure (99999.95 -> 99999.9, not 100000)
+EDGE_VALUES = [99999.95, 99.99995, 9.999995, 0.9999995, -99999.95, 9.9999995e20, 9.9999995e-20]
+
+
+def best_of(repeat, function, *args):
+    """Return (best seconds, last result) of calling function repeatedly."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--values", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal(args.values) * 10.0 ** rng.integers(-30, 31, args.values)
+    values[:len(EDGE_VALUES)] = EDGE_VALUES
+    as_list = values.tolist()
+
+    print(f"{'format':<18}{'vectorized s':>14}{'per-value s':>13}{'speedup':>9}{'lines s':>9}{'mismatches':>12}")
+    for label, digits, notation, locale in FORMATS:
+        nf = number_format(digits, notation, locale)
+        vectorized, formatted = best_of(args.repeat, format_array, values, nf)
+        if label.startswith("default"):
+            scalar, expected = best_of(args.repeat, lambda: [f"{value:.6g}" for value in as_list])
+        else:
+            scalar, expected = best_of(args.repeat, lambda: [format_value(value, nf) for value in as_list])
+        lines, _ = best_of(args.repeat, format_lines, values, nf)
+        mismatches = sum(text.decode() != want for text, want in zip(formatted.tolist(), expected))
+        print(f"{label:<18}{vectorized:>14.3f}{scalar:>13.3f}{scalar / vectorized:>8.1f}x"
+              f"{lines:>9.3f}{mismatches:>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Micro-benchmark: value-only conversions versus rendering the formula.
+
+For every category this times a conversion that only reads ``.value`` and
+one that also renders ``.formula``, cycling through all unit pairs. Run
+from the repository root:
+
+    python benchmarks/formula.py --number 20000
+"""
+import argparse
+import itertools
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unit_converter import categories  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="conversions per measurement")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'category':<16}{'value ns':>12}{'formula ns':>12}{'ratio':>8}")
+    for category, data in categories.items():
+        convert = data["conversion_function"]
+        pairs = itertools.cycle(itertools.product(data["units"], repeat=2))
+
+        def value_only():
+            from_unit, to_unit = next(pairs)
+            return convert(12.5, from_unit, to_unit).value
+
+        def with_formula():
+            from_unit, to_unit = next(pairs)
+            return convert(12.5, from_unit, to_unit).formula
+
+        value_ns = min(timeit.repeat(value_only, number=args.number, repeat=args.repeat)) / args.number * 1e9
+        formula_ns = min(timeit.repeat(with_formula, number=args.number, repeat=args.repeat)) / args.number * 1e9
+        print(f"{category:<16}{value_ns:>12.0f}{formula_ns:>12.0f}{formula_ns / value_ns:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
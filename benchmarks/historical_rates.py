@@ -0,0 +1,95 @@
+"""As-of lookups in a 20-year historical exchange-rate store.
+
+Writes a synthetic long-form CSV with one quote per business day for every
+currency in ``exchange_rates`` (a random walk around today's rate), loads
+it into a RateHistory, then converts a column of random transactions, each
+at the rates of its own date (weekend dates fall back to Friday's quote).
+The scalar path with its same-day cache is timed on a slice and checked
+against the vectorized results. Run from the repository root:
+
+    python benchmarks/historical_rates.py --transactions 10000000 --years 20
+"""
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unit_converter import exchange_rates  # noqa: E402
+from unit_converter.rate_history import BASE_CURRENCY, RateHistory  # noqa: E402
+
+END = np.datetime64("2025-12-31")
+
+
+def write_history(path, years, rng):
+    """Write one quote per business day per currency; returns the row count."""
+    days = np.arange(END - np.timedelta64(365 * years, "D"), END + 1)
+    days = days[np.is_busday(days)]
+    rows = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["date", "currency", "rate"])
+        for currency, rate in exchange_rates.items():
+            if currency == BASE_CURRENCY:
+                continue
+            walk = rate * np.exp(np.cumsum(rng.normal(0, 0.004, len(days))))
+            writer.writerows(zip(days.astype(str), [currency] * len(days), walk.round(6)))
+            rows += len(days)
+    return rows, days[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=10000000)
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3, help="best of this many vectorized runs")
+    parser.add_argument("--scalar-transactions", type=int, default=200000, help="transactions for the scalar path")
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "rates.csv")
+        rows, first_day = write_history(path, args.years, rng)
+        start = time.perf_counter()
+        history = RateHistory.from_csv(path)
+        elapsed = time.perf_counter() - start
+    print(f"load: {rows:,} quotes for {len(history.currencies()) - 1} currencies in {elapsed:.2f} s")
+
+    # Transactions on any calendar day after the first quote, in random order
+    span = int((END - first_day) // np.timedelta64(1, "D")) + 1
+    dates = first_day + rng.integers(0, span, args.transactions).astype("timedelta64[D]")
+    codes = np.array(history.currencies())
+    from_codes = codes[rng.integers(0, len(codes), args.transactions)]
+    to_codes = codes[rng.integers(0, len(codes), args.transactions)]
+    amounts = rng.uniform(1, 10000, args.transactions)
+
+    # Best of several runs: the first one also pays for faulting in fresh pages
+    elapsed = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        converted = history.convert_many(amounts, dates, from_codes, to_codes)
+        elapsed = min(elapsed, time.perf_counter() - start)
+    print(f"vectorized: {args.transactions:,} transactions in {elapsed:.2f} s "
+          f"({args.transactions / elapsed / 1e6:.1f} M/s)")
+
+    n = min(args.scalar_transactions, args.transactions)
+    scalar_rows = list(zip(amounts[:n].tolist(), from_codes[:n].tolist(), to_codes[:n].tolist(),
+                           dates[:n].astype(str).tolist()))
+    start = time.perf_counter()
+    scalar = [history.convert(*row) for row in scalar_rows]
+    elapsed = time.perf_counter() - start
+    cache = history.rate_on.cache_info()
+    print(f"scalar: {n:,} transactions in {elapsed:.2f} s ({n / elapsed / 1e3:.0f} k/s, "
+          f"same-day cache {cache.hits:,} hits / {cache.misses:,} misses)")
+
+    mismatches = int(np.count_nonzero(~np.isclose(scalar, converted[:n], rtol=1e-12)))
+    print(f"scalar vs vectorized: {mismatches} mismatches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark the SQLite history store at millions of rows.
+
+Records conversions through HistoryStore.record() (what the UI calls on the
+render path), waits for the background writer, then times the recent,
+frequent and favorite-pair queries used to prefill the unit selectboxes.
+Run from the repository root:
+
+    python benchmarks/history.py --rows 2000000
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unit_converter import categories  # noqa: E402
+from unit_converter.history import HistoryStore  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000000, help="history rows to write")
+    parser.add_argument("--batch-size", type=int, default=5000, help="rows per writer transaction")
+    parser.add_argument("--path", help="database file (default: a temporary file)")
+    args = parser.parse_args()
+
+    path = args.path or os.path.join(tempfile.mkdtemp(), "history.db")
+    store = HistoryStore(path, batch_size=args.batch_size)
+    pairs = [
+        (category, from_unit, to_unit)
+        for category, data in categories.items()
+        for from_unit, to_unit in itertools.permutations(data["units"], 2)
+    ]
+    # Operators repeat a few hundred conversions, so skew the choice heavily
+    rng = random.Random(0)
+    weights = [1 / (rank + 1) for rank in range(len(pairs))]
+    chosen = rng.choices(pairs, weights, k=args.rows)
+
+    start = time.perf_counter()
+    for category, from_unit, to_unit in chosen:
+        store.record(category, from_unit, to_unit, 12.5, 1.0)
+    queued = time.perf_counter() - start
+    store.flush()
+    written = time.perf_counter() - start
+    print(f"record(): {queued / args.rows * 1e6:.2f} µs per call on the caller's thread")
+    print(f"writer:   {args.rows:,} rows in {written:.1f} s ({args.rows / written:,.0f} rows/s)")
+    print(f"database: {os.path.getsize(path) / 1e6:.0f} MB")
+
+    store.add_favorite("Length", "Mile", "Kilometer")
+    for name, query in [
+        ("recent(Length)", lambda: store.recent("Length", limit=5)),
+        ("frequent(Length)", lambda: store.frequent("Length", limit=5)),
+        ("preferred_pair(Volume)", lambda: store.preferred_pair("Volume")),
+        ("history(Length)", lambda: store.history("Length", limit=20)),
+    ]:
+        seconds = min(timeit.repeat(query, number=200, repeat=5)) / 200
+        print(f"{name:<24}{seconds * 1e6:>9.1f} µs")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
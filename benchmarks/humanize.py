@@ -0,0 +1,78 @@
+"""Throughput of automatic best-unit selection ("humanize").
+
+Humanizes a column of byte counts and one of durations in seconds, both
+spread over many orders of magnitude, with humanize_array(). The scalar
+humanize() and a naive trial conversion into every unit are timed on a
+slice, and the vectorized units are checked against humanize(). Run from
+the repository root:
+
+    python benchmarks/humanize.py --values 10000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unit_converter.humanize import humanize, humanize_array, ladder_units  # noqa: E402
+from unit_converter.registry import registry  # noqa: E402
+
+# (category, from unit, lowest and highest power of ten in the column)
+COLUMNS = [
+    ("Data", "Byte", 0, 18),
+    ("Time", "Second", -9, 9),
+]
+
+
+def trial_humanize(value, category, from_unit, units):
+    """Convert into every unit and keep the largest that stays at or above 1."""
+    best = None
+    for unit in units:
+        converted = value * registry.factor(category, from_unit, unit)
+        if abs(converted) >= 1 and (best is None or abs(converted) < abs(best[0])):
+            best = (converted, unit)
+    return best or (value * registry.factor(category, from_unit, units[0]), units[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--values", type=int, default=10000000)
+    parser.add_argument("--scalar-values", type=int, default=500000, help="values for the scalar paths")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'column':<14}{'vectorized':>12}{'M values/s':>12}{'scalar M/s':>12}{'trial M/s':>11}{'mismatches':>12}")
+    for category, from_unit, low, high in COLUMNS:
+        values = rng.random(args.values) * 10.0 ** rng.integers(low, high, args.values)
+        out = np.empty_like(values)
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            _, unit_index, names = humanize_array(values, category, from_unit, out=out)
+            best = min(best, time.perf_counter() - start)
+
+        sample = values[:args.scalar_values].tolist()
+        start = time.perf_counter()
+        expected = [humanize(value, category, from_unit) for value in sample]
+        scalar = time.perf_counter() - start
+        units = ladder_units(category, from_unit)
+        start = time.perf_counter()
+        for value in sample:
+            trial_humanize(value, category, from_unit, units)
+        trial = time.perf_counter() - start
+
+        converted = zip(out[:len(sample)].tolist(), unit_index[:len(sample)].tolist())
+        mismatches = sum(
+            names[position] != unit or result != value
+            for (value, unit), (result, position) in zip(expected, converted)
+        )
+        print(f"{category + ' ' + from_unit:<14}{best:>11.3f}s{args.values / best / 1e6:>12.1f}"
+              f"{len(sample) / scalar / 1e6:>12.2f}{len(sample) / trial / 1e6:>11.2f}{mismatches:>12,}")
+
+
+if __name__ == "__main__":
+    main()
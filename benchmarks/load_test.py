@@ -0,0 +1,142 @@
+"""Load test for the HTTP conversion service.
+
+Opens a fixed number of keep-alive connections and sends requests back to
+back for a fixed duration, then reports requests/sec and p50/p99 latency.
+By default a local server is started on a free port. Run from the
+repository root:
+
+    python benchmarks/load_test.py --concurrency 64 --duration 10
+    python benchmarks/load_test.py --mode batch --batch-size 5000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from unit_converter import categories  # noqa: E402
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def random_item(rng):
+    category = rng.choice(list(categories))
+    units = categories[category]["units"]
+    return [round(rng.uniform(1, 1000), 3), category, rng.choice(units), rng.choice(units)]
+
+
+def build_request(mode, host, rng, batch_size):
+    """Return raw HTTP request bytes for one request."""
+    if mode == "batch":
+        body = json.dumps({"items": [random_item(rng) for _ in range(batch_size)]}).encode()
+        path = "/batch"
+    else:
+        value, category, from_unit, to_unit = random_item(rng)
+        body = json.dumps({"value": value, "category": category, "from": from_unit, "to": to_unit}).encode()
+        path = "/convert"
+    return (
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode() + body
+
+
+async def read_response(reader):
+    status_line = await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+
+async def client(host, port, requests, deadline, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    i = 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        writer.write(requests[i % len(requests)])
+        await writer.drain()
+        status = await read_response(reader)
+        latencies.append(time.perf_counter() - start)
+        if status != 200:
+            errors.append(status)
+        i += 1
+    writer.close()
+
+
+async def run(args):
+    rng = random.Random(42)
+    # Pre-build a pool of request payloads so the client measures the server
+    requests = [build_request(args.mode, args.host, rng, args.batch_size) for _ in range(256 if args.mode == "single" else 8)]
+    latencies, errors = [], []
+    start = time.perf_counter()
+    deadline = start + args.duration
+    await asyncio.gather(*(
+        client(args.host, args.port, requests, deadline, latencies, errors)
+        for _ in range(args.concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    print(f"mode={args.mode} concurrency={args.concurrency} duration={elapsed:.1f}s")
+    print(f"requests: {len(latencies):,}  errors: {len(errors)}")
+    print(f"requests/sec: {len(latencies) / elapsed:,.0f}")
+    if args.mode == "batch":
+        print(f"conversions/sec: {len(latencies) * args.batch_size / elapsed:,.0f}")
+    print(f"latency p50: {p50:.2f} ms  p99: {p99:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="use an already running server on this port")
+    parser.add_argument("--mode", choices=["single", "batch"], default="single")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    server = None
+    if args.port is None:
+        args.port = free_port()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "unit_converter.server", "--host", args.host, "--port", str(args.port)],
+            cwd=REPO_ROOT,
+            stdout=subprocess.DEVNULL,
+        )
+        # Wait until the server accepts connections
+        for _ in range(100):
+            try:
+                socket.create_connection((args.host, args.port), timeout=0.1).close()
+                break
+            except OSError:
+                time.sleep(0.05)
+    try:
+        asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark the cost of the opt-in metrics instrumentation.
+
+Runs the same conversion loop in three child processes: metrics disabled
+(the default), metrics enabled, and enabled with formulas rendered. With
+metrics disabled the conversion functions must be the original,
+unwrapped functions, so the disabled timings are the uninstrumented ones.
+Run from the repository root:
+
+    python benchmarks/metrics.py --number 100000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def measure(number, repeat, with_formula):
+    """Child process: time one conversion per category, return ns per call."""
+    from unit_converter import categories, conversions, metrics
+
+    timings = {}
+    for category, data in categories.items():
+        function = data["conversion_function"]
+        if not metrics.enabled and function is not getattr(conversions, function.__name__):
+            raise SystemExit(f"{category}: conversion function is wrapped with metrics disabled")
+        from_unit, to_unit = data["units"][0], data["units"][-1]
+        if with_formula:
+            def call():
+                return function(12.5, from_unit, to_unit).formula
+        else:
+            def call():
+                return function(12.5, from_unit, to_unit).value
+        timings[category] = min(timeit.repeat(call, number=number, repeat=repeat)) / number * 1e9
+    return {"wrapped": any(hasattr(data["conversion_function"], "__wrapped__") for data in categories.values()),
+            "timings": timings}
+
+
+def run_child(enabled, args, with_formula=False):
+    env = dict(os.environ, UNIT_CONVERTER_METRICS="1" if enabled else "0")
+    command = [sys.executable, __file__, "--child", "--number", str(args.number), "--repeat", str(args.repeat)]
+    if with_formula:
+        command.append("--formula")
+    output = subprocess.run(command, env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100000, help="conversions per measurement")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--formula", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.number, args.repeat, args.formula)))
+        return
+
+    disabled = run_child(False, args)
+    enabled = run_child(True, args)
+    enabled_formula = run_child(True, args, with_formula=True)
+    print(f"wrapped when disabled: {disabled['wrapped']}, when enabled: {enabled['wrapped']}")
+    print(f"{'category':<16}{'off ns':>9}{'on ns':>9}{'overhead':>10}{'on+formula ns':>15}")
+    for category, off in disabled["timings"].items():
+        on = enabled["timings"][category]
+        print(f"{category:<16}{off:>9.0f}{on:>9.0f}{on - off:>+10.0f}{enabled_formula['timings'][category]:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Scaling benchmark for the shared-memory parallel converter.
+
+Converts the same shared array with 1..N worker processes and reports
+throughput and speedup against a single-process NumPy pass. Run from the
+repository root:
+
+    python benchmarks/parallel_scaling.py --size 200000000 --max-workers 16
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from unit_converter.batch import batch_conversion  # noqa: E402
+from unit_converter.parallel import ParallelConverter, SharedArray  # noqa: E402
+
+
+def best_time(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=50_000_000, help="values per conversion")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--pair", default="Temperature:Fahrenheit:Celsius",
+                        help="Category:From:To to convert (default: Temperature:Fahrenheit:Celsius)")
+    args = parser.parse_args()
+    category, from_unit, to_unit = args.pair.split(":")
+
+    values = np.random.default_rng(0).uniform(-100, 100, args.size)
+    baseline = best_time(lambda: batch_conversion(values, category, from_unit, to_unit, out=values), args.repeat)
+    gb = args.size * 8 / 1e9
+    print(f"{args.size:,} values ({gb:.2f} GB), {category}: {from_unit} -> {to_unit}")
+    print(f"{'workers':>8}{'seconds':>10}{'Mvalues/s':>12}{'GB/s':>8}{'speedup':>9}")
+    print(f"{'numpy':>8}{baseline:>10.3f}{args.size / baseline / 1e6:>12.1f}{gb / baseline:>8.2f}{1.0:>8.2f}x")
+
+    with SharedArray.from_values(values) as shared:
+        del values
+        # Powers of two up to the maximum, plus the maximum itself
+        counts = sorted({2 ** i for i in range(args.max_workers.bit_length()) if 2 ** i <= args.max_workers}
+                        | {args.max_workers})
+        for workers in counts:
+            with ParallelConverter(workers=workers) as converter:
+                # Warm the pool so process start-up isn't measured
+                converter.convert_inplace(shared, category, from_unit, to_unit)
+                seconds = best_time(
+                    lambda: converter.convert_inplace(shared, category, from_unit, to_unit), args.repeat
+                )
+            print(f"{workers:>8}{seconds:>10.3f}{args.size / seconds / 1e6:>12.1f}"
+                  f"{gb / seconds:>8.2f}{baseline / seconds:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
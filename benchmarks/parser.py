@@ -0,0 +1,59 @@
+"""Benchmark the quantity parser on a synthetic log corpus.
+
+Generates log lines with quantities in assorted units and notations, then
+reports lines per minute for line-by-line parsing (parse_many) and for a
+single scan over the whole text (parse_bulk). Run from the repository root:
+
+    python benchmarks/parser.py --lines 2000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unit_converter.parser import abbreviations, parse_bulk, parse_many  # noqa: E402
+
+TEMPLATES = [
+    "2024-05-01T12:00:{s:02d}Z sensor-{n} reading={q} status=ok",
+    "INFO worker {n} transferred {q} in {t} ms",
+    "WARN temperature at node {n} reached {q}",
+    "DEBUG request id={n} completed without measurements",
+]
+
+
+def synthetic_corpus(lines, seed=0):
+    rng = random.Random(seed)
+    aliases = [alias for units in abbreviations.values() for names in units.values() for alias in names]
+    corpus = []
+    for i in range(lines):
+        quantity = f"{rng.uniform(0, 10000):.{rng.randint(0, 3)}f}{rng.choice(['', ' '])}{rng.choice(aliases)}"
+        template = rng.choice(TEMPLATES)
+        corpus.append(template.format(s=i % 60, n=rng.randint(1, 999), q=quantity, t=rng.randint(1, 500)))
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    corpus = synthetic_corpus(args.lines)
+    text = "\n".join(corpus)
+    print(f"{args.lines:,} lines, {len(text) / 1e6:.1f} MB")
+
+    start = time.perf_counter()
+    parsed = sum(1 for quantity in parse_many(corpus) if quantity is not None)
+    elapsed = time.perf_counter() - start
+    print(f"parse_many: {elapsed:.2f} s, {args.lines / elapsed * 60:,.0f} lines/min, {parsed:,} quantities")
+
+    start = time.perf_counter()
+    values, _, _ = parse_bulk(text)
+    elapsed = time.perf_counter() - start
+    print(f"parse_bulk: {elapsed:.2f} s, {args.lines / elapsed * 60:,.0f} lines/min, {len(values):,} quantities")
+
+
+if __name__ == "__main__":
+    main()
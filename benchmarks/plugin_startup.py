@@ -0,0 +1,126 @@
+"""Startup benchmark: importing the core with a large set of plugin units.
+
+Writes a synthetic definition set (new categories plus units added to
+built-in ones, split across TOML and JSON files) and imports
+unit_converter in fresh interpreters three ways: without plugins, with a
+cold cache (the files are parsed, validated and compiled on every run)
+and with a warm cache. Run from the repository root:
+
+    python benchmarks/plugin_startup.py --units 10000 --runs 5
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Code run in the child interpreter: time the import, then report peak RSS and the unit count
+PROBE = """
+import resource, time
+start = time.perf_counter()
+import unit_converter
+elapsed = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, rss_kb, len(unit_converter.registry))
+"""
+
+
+def write_definitions(directory, units, category_size, files):
+    """Write about `units` synthetic units into `files` plugin files; return the unit count."""
+    categories = {}
+    written = 0
+    # A few hundred units extend built-in categories; the rest form new ones
+    for builtin in ("Length", "Energy", "Data"):
+        categories[builtin] = {"units": {f"Custom {builtin} {i}": 1.5 ** (i % 40) for i in range(100)}}
+        written += 100
+    index = 0
+    while written < units:
+        size = min(category_size, units - written)
+        table = {f"Plugin unit {index}.{i}": 10.0 ** ((i % 24) - 12) * (1 + i / size) for i in range(size)}
+        if index % 10 == 9:
+            # Some categories have an offset unit, which makes them transform-based
+            table[f"Plugin unit {index}.offset"] = {"factor": 1.8, "offset": 32}
+        categories[f"Plugin category {index}"] = {"icon": "🧩", "description": "Synthetic units", "units": table}
+        written += len(table)
+        index += 1
+
+    names = list(categories)
+    for file_index in range(files):
+        chunk = {name: categories[name] for name in names[file_index::files]}
+        if file_index % 2:
+            with open(os.path.join(directory, f"units{file_index:02d}.json"), "w", encoding="utf-8") as f:
+                json.dump({"categories": chunk}, f)
+        else:
+            with open(os.path.join(directory, f"units{file_index:02d}.toml"), "w", encoding="utf-8") as f:
+                f.write(to_toml(chunk))
+    return written
+
+
+def to_toml(categories):
+    """Render a categories table as TOML (enough for the synthetic set)."""
+    lines = []
+    for name, body in categories.items():
+        lines.append(f"[categories.{json.dumps(name)}]")
+        for key in ("icon", "description"):
+            if key in body:
+                lines.append(f"{key} = {json.dumps(body[key], ensure_ascii=False)}")
+        lines.append(f"[categories.{json.dumps(name)}.units]")
+        for unit, spec in body["units"].items():
+            if isinstance(spec, dict):
+                spec = "{ " + ", ".join(f"{key} = {value!r}" for key, value in spec.items()) + " }"
+            lines.append(f"{json.dumps(unit)} = {spec!r}" if not isinstance(spec, str) else f"{json.dumps(unit)} = {spec}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def measure(env, clear_cache=None):
+    """Import the core in a fresh interpreter and return (seconds, rss_kb, units)."""
+    if clear_cache:
+        shutil.rmtree(clear_cache, ignore_errors=True)
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True,
+    ).stdout.split()
+    return float(output[0]), int(output[1]), int(output[2])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--units", type=int, default=10000, help="plugin units to define")
+    parser.add_argument("--category-size", type=int, default=250, help="units per new category")
+    parser.add_argument("--files", type=int, default=8, help="definition files to split them across")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per case")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="unit_plugins_")
+    try:
+        plugins = os.path.join(workdir, "plugins")
+        cache = os.path.join(workdir, "cache")
+        os.mkdir(plugins)
+        count = write_definitions(plugins, args.units, args.category_size, args.files)
+        size = sum(os.path.getsize(os.path.join(plugins, name)) for name in os.listdir(plugins))
+        print(f"{count:,} plugin units in {args.files} files ({size / 1e6:.1f} MB)")
+
+        base_env = {key: value for key, value in os.environ.items() if key != "UNIT_CONVERTER_PLUGINS"}
+        plugin_env = dict(base_env, UNIT_CONVERTER_PLUGINS=plugins, UNIT_CONVERTER_CACHE=cache)
+        cases = [
+            ("no plugins", base_env, None),
+            ("plugins, cold cache", plugin_env, cache),
+            ("plugins, warm cache", plugin_env, None),
+        ]
+        print(f"{'case':<24}{'import ms':>12}{'peak RSS MB':>14}{'units':>9}")
+        for label, env, clear_cache in cases:
+            samples = [measure(env, clear_cache) for _ in range(args.runs)]
+            import_ms = statistics.median(s[0] for s in samples) * 1000
+            rss_mb = statistics.median(s[1] for s in samples) / 1024
+            print(f"{label:<24}{import_ms:>12.1f}{rss_mb:>14.1f}{samples[-1][2]:>9,}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
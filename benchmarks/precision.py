@@ -0,0 +1,59 @@
+"""Benchmark: throughput cost of the exact and decimal precision modes.
+
+For every category this measures conversions/sec in "float", "exact" and
+"decimal" mode over all unit pairs, plus the worst relative drift of the
+float factor table against the exact definitions. Run from the repository
+root:
+
+    python benchmarks/precision.py --number 20000
+"""
+import argparse
+import itertools
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unit_converter import categories  # noqa: E402
+from unit_converter.exact import PRECISIONS, convert  # noqa: E402
+
+
+def max_drift(category, units):
+    """Largest relative difference between the float and exact results for 1 unit."""
+    worst = 0.0
+    for from_unit, to_unit in itertools.product(units, repeat=2):
+        exact = float(convert(1, category, from_unit, to_unit, precision="exact"))
+        if exact:
+            approx = convert(1, category, from_unit, to_unit)
+            worst = max(worst, abs(approx - exact) / abs(exact))
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="conversions per measurement")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    header = "".join(f"{mode + ' conv/s':>16}" for mode in PRECISIONS)
+    print(f"{'category':<16}{header}{'exact cost':>12}{'float drift':>14}")
+    for category, data in categories.items():
+        units = data["units"]
+        rates = {}
+        for precision in PRECISIONS:
+            pairs = itertools.cycle(itertools.product(units, repeat=2))
+
+            def run():
+                from_unit, to_unit = next(pairs)
+                return convert(12.5, category, from_unit, to_unit, precision=precision)
+
+            seconds = min(timeit.repeat(run, number=args.number, repeat=args.repeat))
+            rates[precision] = args.number / seconds
+        columns = "".join(f"{rates[mode]:>16,.0f}" for mode in PRECISIONS)
+        cost = rates["float"] / rates["exact"]
+        print(f"{category:<16}{columns}{cost:>11.1f}x{max_drift(category, units):>14.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Performance regression check against a saved baseline.
+
+Measures every category in ``categories`` (scalar conversions/sec, batch
+values/sec and peak batch memory) and compares with a JSON baseline. A
+category that gets slower (or hungrier) than the baseline by more than
+--tolerance fails the run.
+
+The first run on a machine saves the baseline (it is not committed, since
+absolute speeds are machine-specific); later runs compare with it. The
+machine-independent gate that runs with the test suite is
+tests/test_performance.py, which checks the same paths as ratios.
+The exit status is non-zero when any check fails. The golden values in
+benchmarks/golden.json (every unit pair at a few inputs) are checked by
+tests/test_regression.py, together with round trips and the fuel economy
+edge cases; --update-golden rewrites them from the current results. Run
+from the repository root:
+
+    python benchmarks/regression.py                   # check performance
+    python benchmarks/regression.py --save-baseline   # accept current speed
+    python benchmarks/regression.py --update-golden   # accept current values
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from unit_converter import batch_conversion, categories  # noqa: E402
+
+GOLDEN_PATH = os.path.join(HERE, "golden.json")
+BASELINE_PATH = os.path.join(HERE, "baseline.json")
+GOLDEN_INPUTS = (1.0, 12.5, -40.0, 0.0)  # also in tests/test_regression.py
+
+
+def golden_values():
+    """Return {category: {from_unit: {to_unit: [results for GOLDEN_INPUTS]}}}."""
+    table = {}
+    for category, data in categories.items():
+        convert = data["conversion_function"]
+        table[category] = {
+            from_unit: {
+                to_unit: [convert(value, from_unit, to_unit).value for value in GOLDEN_INPUTS]
+                for to_unit in data["units"]
+            }
+            for from_unit in data["units"]
+        }
+    return table
+
+
+def measure(number, batch_size, repeat):
+    """Return {category: {"scalar_per_sec", "batch_per_sec", "batch_peak_mb"}}."""
+    results = {}
+    values = np.random.default_rng(0).uniform(1, 1000, batch_size)
+    for category, data in categories.items():
+        convert = data["conversion_function"]
+        pairs = itertools.cycle(itertools.product(data["units"], repeat=2))
+
+        def scalar():
+            from_unit, to_unit = next(pairs)
+            return convert(12.5, from_unit, to_unit).value
+
+        scalar_seconds = min(timeit.repeat(scalar, number=number, repeat=repeat)) / number
+        from_unit, to_unit = data["units"][0], data["units"][-1]
+        batch_seconds = min(timeit.repeat(
+            lambda: batch_conversion(values, category, from_unit, to_unit), number=1, repeat=repeat
+        ))
+        tracemalloc.start()
+        batch_conversion(values, category, from_unit, to_unit)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[category] = {
+            "scalar_per_sec": 1 / scalar_seconds,
+            "batch_per_sec": batch_size / batch_seconds,
+            "batch_peak_mb": peak / 1e6,
+        }
+    return results
+
+
+def compare(current, baseline, tolerance):
+    failures = []
+    for category, now in current.items():
+        before = baseline.get(category)
+        if before is None:
+            continue
+        for metric in ("scalar_per_sec", "batch_per_sec"):
+            if now[metric] < before[metric] * (1 - tolerance):
+                failures.append(f"{category}: {metric} {now[metric]:,.0f} < baseline {before[metric]:,.0f}")
+        if now["batch_peak_mb"] > before["batch_peak_mb"] * (1 + tolerance) + 0.1:
+            failures.append(
+                f"{category}: batch_peak_mb {now['batch_peak_mb']:.1f} > baseline {before['batch_peak_mb']:.1f}"
+            )
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="scalar conversions per measurement")
+    parser.add_argument("--batch-size", type=int, default=1000000, help="values per batch conversion")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="performance baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="overwrite the baseline with this run")
+    parser.add_argument("--update-golden", action="store_true", help="rewrite golden.json from current results")
+    args = parser.parse_args()
+
+    if args.update_golden:
+        with open(GOLDEN_PATH, "w", encoding="utf-8") as f:
+            json.dump(golden_values(), f, indent=1, ensure_ascii=False)
+        print(f"Wrote {GOLDEN_PATH}")
+        return
+
+    failures = []
+    current = measure(args.number, args.batch_size, args.repeat)
+    print(f"{'category':<16}{'scalar conv/s':>15}{'batch Mval/s':>14}{'batch MB':>10}")
+    for category, now in current.items():
+        print(f"{category:<16}{now['scalar_per_sec']:>15,.0f}{now['batch_per_sec'] / 1e6:>14.1f}"
+              f"{now['batch_peak_mb']:>10.1f}")
+    if args.save_baseline or not os.path.exists(args.baseline):
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    else:
+        with open(args.baseline, encoding="utf-8") as f:
+            failures = compare(current, json.load(f), args.tolerance)
+        print(f"performance against {args.baseline}: {len(failures)} regressions")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Startup benchmark: import time and memory of the core versus the UI.
+
+Each target is imported in a fresh interpreter so nothing is cached between
+runs. Run from the repository root:
+
+    python benchmarks/startup.py --runs 10
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Code run in the child interpreter: time the import, then report peak RSS
+PROBE = """
+import resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, rss_kb, len(sys.modules))
+"""
+
+TARGETS = {
+    "python (baseline)": "sys",
+    "unit_converter (core)": "unit_converter",
+    "unit_converter.batch (core + NumPy)": "unit_converter.batch",
+    "app (Streamlit UI)": "app",
+}
+
+
+def measure(module):
+    """Import a module in a fresh interpreter and return (seconds, rss_kb, modules)."""
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return float(output[0]), int(output[1]), int(output[2])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per target")
+    args = parser.parse_args()
+
+    print(f"{'target':<38}{'import ms':>12}{'peak RSS MB':>14}{'modules':>10}")
+    for label, module in TARGETS.items():
+        samples = [measure(module) for _ in range(args.runs)]
+        import_ms = statistics.median(s[0] for s in samples) * 1000
+        rss_mb = statistics.median(s[1] for s in samples) / 1024
+        modules = samples[-1][2]
+        print(f"{label:<38}{import_ms:>12.2f}{rss_mb:>14.1f}{modules:>10}")
+
+
+if __name__ == "__main__":
+    main()
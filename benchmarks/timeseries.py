@@ -0,0 +1,81 @@
+"""Throughput of the streaming time-series normalizer and resampler.
+
+Generates a synthetic pressure series chunk by chunk (so memory stays
+constant) in which the unit switches from PSI to Bar halfway through, as
+after a firmware update, and every tenth chunk mixes units per point.
+The points are normalized to pascals and aggregated into one-minute
+windows. The scalar generators are timed on a smaller slice. Run from the
+repository root:
+
+    python benchmarks/timeseries.py --points 100000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unit_converter.timeseries import normalize, normalize_chunks, resample, resample_chunks  # noqa: E402
+
+UNITS = np.array(["PSI", "Bar"])
+
+
+def synthetic_chunks(points, chunk_size, rate_hz=10):
+    """Yield (timestamps, values, units) chunks of a sampled pressure series."""
+    rng = np.random.default_rng(0)
+    for index, start in enumerate(range(0, points, chunk_size)):
+        n = min(chunk_size, points - start)
+        timestamps = (start + np.arange(n)) / rate_hz
+        if index % 10 == 9:
+            # Mixed units within one chunk (per-point unit names)
+            units = UNITS[rng.integers(0, 2, n)]
+            values = np.where(units == "PSI", 30.0, 2.0) + rng.standard_normal(n)
+        elif start < points // 2:
+            units, values = "PSI", 30.0 + rng.standard_normal(n)
+        else:
+            units, values = "Bar", 2.0 + rng.standard_normal(n)
+        yield timestamps, values, units
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=100000000)
+    parser.add_argument("--chunk-size", type=int, default=1 << 20)
+    parser.add_argument("--scalar-points", type=int, default=1000000, help="points for the generator path")
+    parser.add_argument("--interval", type=float, default=60.0, help="window length in seconds")
+    args = parser.parse_args()
+
+    # Time input generation alone so it can be subtracted
+    start = time.perf_counter()
+    for _ in synthetic_chunks(args.points, args.chunk_size):
+        pass
+    generate = time.perf_counter() - start
+
+    start = time.perf_counter()
+    windows = 0
+    chunks = synthetic_chunks(args.points, args.chunk_size)
+    for _ in resample_chunks(normalize_chunks(chunks, "Pressure", "Pascal"), args.interval):
+        windows += 1
+    total = time.perf_counter() - start
+    work = total - generate
+    print(f"chunked: {args.points:,} points -> {windows:,} windows in {work:.2f} s "
+          f"({args.points / work / 1e6:.1f} M points/s, input generation {generate:.2f} s excluded)")
+
+    records = [
+        (timestamp, value, unit)
+        for timestamps, values, units in synthetic_chunks(args.scalar_points, args.scalar_points // 4)
+        if isinstance(units, str)
+        for timestamp, value, unit in zip(timestamps.tolist(), values.tolist(), [units] * len(values))
+    ]
+    start = time.perf_counter()
+    windows = sum(1 for _ in resample(normalize(iter(records), "Pressure", "Pascal"), args.interval))
+    elapsed = time.perf_counter() - start
+    print(f"generator: {len(records):,} points -> {windows:,} windows in {elapsed:.2f} s "
+          f"({len(records) / elapsed / 1e6:.2f} M points/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark mixed-unit batches for the transform-based categories.
+
+Generates values whose source unit varies per element, then converts them
+to one target unit with a Python loop over the scalar functions and with
+the vectorized mixed_conversion(), given unit names or integer unit IDs. Run from the repository root:
+
+    python benchmarks/transforms.py --size 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unit_converter import categories, registry  # noqa: E402
+from unit_converter.batch import mixed_conversion  # noqa: E402
+
+TARGETS = {"Temperature": "Celsius", "Fuel Economy": "Liters per 100 Kilometers"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1000000, help="values per batch")
+    parser.add_argument("--loop-size", type=int, default=100000, help="values for the scalar loop")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'category':<16}{'loop Mval/s':>13}{'names Mval/s':>14}{'ids Mval/s':>12}{'speedup':>9}")
+    for category, to_unit in TARGETS.items():
+        units = registry.units(category)
+        values = rng.uniform(1, 400, args.size)
+        positions = rng.integers(0, len(units), args.size)
+        names = np.array(units)[positions]
+
+        convert = categories[category]["conversion_function"]
+        start = time.perf_counter()
+        expected = [
+            convert(value, unit, to_unit).value
+            for value, unit in zip(values[:args.loop_size].tolist(), names[:args.loop_size].tolist())
+        ]
+        loop_rate = args.loop_size / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        result = mixed_conversion(values, category, names, to_unit)
+        names_rate = args.size / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        mixed_conversion(values, category, positions, to_unit)
+        ids_rate = args.size / (time.perf_counter() - start)
+
+        if not np.allclose(result[:args.loop_size], expected):
+            raise SystemExit(f"{category}: vectorized results differ from the scalar functions")
+        print(f"{category:<16}{loop_rate / 1e6:>13.2f}{names_rate / 1e6:>14.1f}{ids_rate / 1e6:>12.1f}"
+              f"{ids_rate / loop_rate:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
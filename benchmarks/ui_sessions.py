@@ -0,0 +1,238 @@
+"""Load test for the Streamlit app: many concurrent browser sessions.
+
+Starts ``streamlit run app.py`` on a free port (with a throwaway history
+database) and opens --sessions WebSocket connections to it, speaking the
+same protocol as the browser. Every session loads the page, then makes
+--reruns interactions, cycling through a new value, a click on Swap
+Units, another new value and another category. Changes to widgets inside
+a fragment rerun just that fragment, as in the browser. At most
+--concurrency reruns are in flight at once. Reports latency, script runs
+and elements redrawn per interaction, and the server's resident memory
+per open session. Run from the repository root:
+
+    python benchmarks/ui_sessions.py --sessions 300 --reruns 10
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from streamlit.proto.Alert_pb2 import Alert
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from websockets.asyncio.client import connect
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rss_mb(pid):
+    """Return the resident set size of a process in MB (Linux /proc)."""
+    with open(f"/proc/{pid}/status", encoding="ascii") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+class Session:
+    """One browser tab: a WebSocket plus the widget values it would send."""
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.widgets = {}    # label -> widget proto from the last run
+        self.fragments = {}  # label -> id of the fragment drawing the widget ("" for none)
+        self.states = {}     # widget id -> WidgetState, resent on every rerun like the browser does
+        self.errors = 0
+
+    async def rerun(self, **changes):
+        """Rerun with widgets (by label) changed; returns (seconds, elements drawn, script runs).
+
+        Like the browser, a change to widgets inside one fragment reruns only
+        that fragment.
+        """
+        for label, value in changes.items():
+            widget_id = self.widgets[label].id
+            self.states[widget_id] = WidgetState(id=widget_id, **value)
+        fragments = {self.fragments[label] for label in changes}
+        fragment = fragments.pop() if len(fragments) == 1 else ""
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        message.rerun_script.fragment_id = fragment
+        message.rerun_script.widget_states.widgets.extend(self.states.values())
+        start = time.perf_counter()
+        await self.websocket.send(message.SerializeToString())
+        # Button clicks are sent once, not resent with later reruns
+        self.states = {key: state for key, state in self.states.items() if not state.trigger_value}
+        widgets, fragments, elements, runs = {}, {}, 0, 1
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.websocket.recv())
+            kind = forward.WhichOneof("type")
+            if kind == "script_finished":
+                # st.rerun() ends the run early and starts another one
+                if forward.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    break
+                runs += 1
+            if kind != "delta" or forward.delta.WhichOneof("type") != "new_element":
+                continue
+            elements += 1
+            element = forward.delta.new_element
+            element_type = element.WhichOneof("type")
+            if element_type == "exception" or (element_type == "alert" and element.alert.format == Alert.ERROR):
+                self.errors += 1
+            widget = getattr(element, element_type)
+            if getattr(widget, "id", ""):
+                widgets[widget.label] = widget
+                fragments[widget.label] = forward.delta.fragment_id
+        elapsed = time.perf_counter() - start
+        if fragment:
+            # Widgets outside the fragment were not redrawn and are still there
+            for label, widget in self.widgets.items():
+                if self.fragments[label] != fragment:
+                    widgets[label] = widget
+                    fragments[label] = self.fragments[label]
+        # Forget the values of widgets that are gone
+        live = {widget.id for widget in widgets.values()}
+        self.states = {key: state for key, state in self.states.items() if key in live}
+        self.widgets, self.fragments = widgets, fragments
+        return elapsed, elements, runs
+
+
+async def run_session(url, index, args, limit, barrier, latencies):
+    """Load the page, wait for every session, interact, then stay open until the end."""
+    rng = random.Random(index)
+    try:
+        async with connect(url, subprotocols=["streamlit"], max_size=None) as websocket:
+            session = Session(websocket)
+            async with limit:
+                latencies["load"].append(await session.rerun())
+            await barrier.wait()
+            for i in range(args.reruns):
+                if i % 4 == 1:
+                    kind = "swap"
+                    change = {"↔️ Swap Units": {"trigger_value": True}}
+                elif i % 4 == 3:
+                    kind = "category"
+                    options = session.widgets["Select Category"].options
+                    change = {"Select Category": {"string_value": rng.choice(options)}}
+                else:
+                    kind = "value"
+                    change = {"Enter value": {"double_value": round(rng.uniform(1, 1000), 2)}}
+                async with limit:
+                    latencies[kind].append(await session.rerun(**change))
+            # Keep the server-side session alive while memory is measured
+            await barrier.wait()
+            await barrier.wait()
+            return session.errors
+    except Exception:
+        await barrier.abort()
+        raise
+
+
+def describe(samples):
+    """Summarize (seconds, elements, runs) samples: latency percentiles, elements drawn, runs."""
+    seconds = sorted(elapsed for elapsed, _, _ in samples)
+    p50 = statistics.median(seconds) * 1000
+    p99 = seconds[min(len(seconds) - 1, int(len(seconds) * 0.99))] * 1000
+    elements = statistics.mean(count for _, count, _ in samples)
+    runs = statistics.mean(count for _, _, count in samples)
+    return f"p50 {p50:.1f} ms, p99 {p99:.1f} ms, {runs:.1f} script runs, {elements:.0f} elements drawn"
+
+
+async def run(args, server_pid):
+    url = f"ws://{args.host}:{args.port}/_stcore/stream"
+    limit = asyncio.Semaphore(args.concurrency)
+    memory = (lambda: rss_mb(server_pid)) if server_pid else (lambda: float("nan"))
+
+    # Warm up with one session so imports and shared caches are not counted per session
+    async with connect(url, subprotocols=["streamlit"], max_size=None) as websocket:
+        await Session(websocket).rerun()
+    await asyncio.sleep(1)
+    baseline = memory()
+
+    barrier = asyncio.Barrier(args.sessions + 1)
+    latencies = {"load": [], "value": [], "swap": [], "category": []}
+    start = time.perf_counter()
+    tasks = [
+        asyncio.create_task(run_session(url, i, args, limit, barrier, latencies))
+        for i in range(args.sessions)
+    ]
+    try:
+        await barrier.wait()
+        loaded = time.perf_counter() - start
+        opened = memory()
+        start = time.perf_counter()
+        await barrier.wait()
+        elapsed = time.perf_counter() - start
+        final = memory()
+        await barrier.wait()
+    except asyncio.BrokenBarrierError:
+        pass
+    errors = sum(await asyncio.gather(*tasks))
+
+    reruns = sum(len(samples) for kind, samples in latencies.items() if kind != "load")
+    print(f"sessions: {args.sessions}, reruns per session: {args.reruns}, concurrency: {args.concurrency}")
+    print(f"page loads in {loaded:.1f} s: {describe(latencies['load'])}")
+    print(f"interactions in {elapsed:.1f} s ({reruns / elapsed:.0f}/s):")
+    print(f"  new value:       {describe(latencies['value'])}")
+    print(f"  swap units:      {describe(latencies['swap'])}")
+    print(f"  category change: {describe(latencies['category'])}")
+    print(f"errors shown in the app: {errors}")
+    if server_pid:
+        print(f"server RSS: {baseline:.1f} MB after warm-up, {opened:.1f} MB with every session open, "
+              f"{final:.1f} MB after the reruns")
+        print(f"memory per session: {(final - baseline) / args.sessions * 1024:.0f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="use an already running server on this port (no memory figures)")
+    parser.add_argument("--sessions", type=int, default=300)
+    parser.add_argument("--reruns", type=int, default=10, help="interactions per session")
+    parser.add_argument("--concurrency", type=int, default=16, help="reruns in flight at once")
+    args = parser.parse_args()
+
+    server = None
+    with tempfile.TemporaryDirectory() as directory:
+        if args.port is None:
+            args.port = free_port()
+            server = subprocess.Popen(
+                [sys.executable, "-m", "streamlit", "run", os.path.join(REPO_ROOT, "app.py"),
+                 "--server.headless", "true", "--server.address", args.host, "--server.port", str(args.port),
+                 "--browser.gatherUsageStats", "false"],
+                cwd=directory,
+                env=dict(os.environ, UNIT_CONVERTER_HISTORY=os.path.join(directory, "history.db")),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            # Wait until the server accepts connections
+            for _ in range(600):
+                try:
+                    socket.create_connection((args.host, args.port), timeout=0.1).close()
+                    break
+                except OSError:
+                    time.sleep(0.05)
+        try:
+            asyncio.run(run(args, server.pid if server else None))
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import math
+
+import numpy as np
+import pytest
+
+from unit_converter.batch import batch_conversion, mixed_conversion
+from unit_converter.conversions import categories
+
+
+@pytest.mark.parametrize("category, to_unit", [
+    ("Temperature", "Kelvin"),
+    ("Temperature", "Fahrenheit"),
+    ("Fuel Economy", "Kilometers per Liter"),
+    ("Fuel Economy", "Liters per 100 Kilometers"),
+    ("Length", "Meter"),
+])
+def test_mixed_matches_batch_per_element(category, to_unit):
+    units = categories[category]["units"]
+    rng = np.random.default_rng(0)
+    positions = rng.integers(0, len(units), 500)
+    values = rng.uniform(-50, 300, 500)
+    values[:3] = [0.0, math.inf, 1.0]
+    expected = np.array([
+        batch_conversion([value], category, units[position], to_unit)[0]
+        for value, position in zip(values.tolist(), positions.tolist())
+    ])
+    names = np.array(units)[positions]
+    np.testing.assert_allclose(mixed_conversion(values, category, names, to_unit), expected, rtol=1e-12)
+    np.testing.assert_allclose(mixed_conversion(values, category, positions, to_unit), expected, rtol=1e-12)
+    np.testing.assert_allclose(mixed_conversion(values, category, list(names), to_unit), expected, rtol=1e-12)
+
+
+def test_mixed_fuel_economy_edges():
+    units = ["Liters per 100 Kilometers", "Kilometers per Liter", "Liters per 100 Kilometers"]
+    result = mixed_conversion([0.0, 0.0, math.inf], "Fuel Economy", units, "Kilometers per Liter")
+    np.testing.assert_array_equal(result, [math.inf, 0.0, 0.0])
+
+
+def test_mixed_unknown_unit():
+    with pytest.raises(KeyError, match="unknown Temperature unit 'Kelvins'"):
+        mixed_conversion([1.0, 2.0], "Temperature", ["Kelvin", "Kelvins"], "Celsius")
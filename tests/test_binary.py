@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from unit_converter.batch import batch_conversion
+from unit_converter.binary import convert_arrow, convert_raw
+
+PSI_TO_PA = ("Pressure", "PSI", "Pascal")
+
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(0).uniform(0, 100, 10000)
+
+
+def test_raw_to_new_file(tmp_path, values):
+    source, target = tmp_path / "psi.f64", tmp_path / "pa.f64"
+    values.astype("<f8").tofile(source)
+    assert convert_raw(str(source), *PSI_TO_PA, output_path=str(target), chunk_elements=4096) == len(values)
+    np.testing.assert_allclose(np.fromfile(target, "<f8"), batch_conversion(values, *PSI_TO_PA), rtol=1e-15)
+    np.testing.assert_array_equal(np.fromfile(source, "<f8"), values)
+
+
+@pytest.mark.parametrize("same_output", [False, True])
+def test_raw_in_place(tmp_path, values, same_output):
+    path = tmp_path / "temps.f32"
+    values.astype("<f4").tofile(path)
+    output = str(tmp_path / "." / "temps.f32") if same_output else None
+    convert_raw(str(path), "Temperature", "Fahrenheit", "Celsius", output_path=output)
+    expected = batch_conversion(values.astype(np.float32).astype(float), "Temperature", "Fahrenheit", "Celsius")
+    np.testing.assert_allclose(np.fromfile(path, "<f4"), expected, rtol=1e-6, atol=1e-4)
+
+
+def test_raw_rejects_partial_values(tmp_path):
+    path = tmp_path / "bad.f64"
+    path.write_bytes(b"\0" * 12)
+    with pytest.raises(ValueError, match="whole number"):
+        convert_raw(str(path), *PSI_TO_PA)
+    with pytest.raises(ValueError, match="element type"):
+        convert_raw(str(tmp_path / "bad.bin"), *PSI_TO_PA)
+
+
+def test_arrow(tmp_path, values):
+    pa = pytest.importorskip("pyarrow")
+    source, target = str(tmp_path / "in.arrow"), str(tmp_path / "out.arrow")
+    table = pa.table({"psi": pa.array(values, mask=values < 10), "id": np.arange(len(values))})
+    with pa.ipc.new_file(source, table.schema) as writer:
+        writer.write_table(table, max_chunksize=3000)
+    assert convert_arrow(source, target, [("psi", *PSI_TO_PA)]) == len(values)
+    with pa.memory_map(target) as f:
+        result = pa.ipc.open_file(f).read_all()
+    assert result.column("psi").null_count == np.count_nonzero(values < 10)
+    np.testing.assert_allclose(result.column("psi").to_numpy(zero_copy_only=False)[values >= 10],
+                               batch_conversion(values[values >= 10], *PSI_TO_PA))
+    assert result.column("id").to_pylist() == list(range(len(values)))
+    with pytest.raises(ValueError, match="in place"):
+        convert_arrow(source, source, [("psi", *PSI_TO_PA)])
+
+
+def test_arrow_integer_column_becomes_float(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    source, target = str(tmp_path / "in.arrow"), str(tmp_path / "out.arrow")
+    table = pa.table({"psi": pa.array([1, 2, None, 100], pa.int64()), "id": pa.array([1, 2, 3, 4], pa.int64())})
+    with pa.ipc.new_file(source, table.schema) as writer:
+        writer.write_table(table)
+    assert convert_arrow(source, target, [("psi", *PSI_TO_PA)]) == 4
+    with pa.memory_map(target) as f:
+        result = pa.ipc.open_file(f).read_all()
+    assert result.schema.field("psi").type == pa.float64()
+    assert result.schema.field("id").type == pa.int64()
+    np.testing.assert_allclose(result.column("psi").to_pylist()[:2], batch_conversion([1, 2], *PSI_TO_PA))
+    assert result.column("psi").null_count == 1
+
+
+def test_arrow_failure_removes_output(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    source, target = str(tmp_path / "in.arrow"), str(tmp_path / "out.arrow")
+    table = pa.table({"psi": pa.array(["1", "x"])})
+    with pa.ipc.new_file(source, table.schema) as writer:
+        writer.write_table(table)
+    with pytest.raises(pa.ArrowInvalid):
+        convert_arrow(source, target, [("psi", *PSI_TO_PA)])
+    assert not (tmp_path / "out.arrow").exists()
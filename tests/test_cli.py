@@ -0,0 +1,61 @@
+import json
+import math
+
+import numpy as np
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+csv = pytest.importorskip("pyarrow.csv")
+
+from unit_converter.cli import convert_file, json_lines, main  # noqa: E402
+
+FUEL_SPEC = ("kpl", "Fuel Economy", "Kilometers per Liter", "Liters per 100 Kilometers")
+
+
+@pytest.fixture
+def readings(tmp_path):
+    path = tmp_path / "readings.csv"
+    path.write_text("id,psi,kpl,note\n1,14.7,0,a\n2,,12.5,\"quoted \"\"b\"\"\"\n3,100,20,\n")
+    return path
+
+
+@pytest.mark.parametrize("extension", ["csv", "jsonl", "parquet", "arrow"])
+def test_convert_file_round_trip(readings, tmp_path, extension):
+    output = tmp_path / f"out.{extension}"
+    rows = convert_file(str(readings), str(output), [("psi", "Pressure", "PSI", "Pascal"), FUEL_SPEC])
+    assert rows == 3
+    back = tmp_path / "back.csv"
+    convert_file(str(output), str(back), [("psi", "Pressure", "Pascal", "PSI")])
+    table = csv.read_csv(back)
+    np.testing.assert_allclose(table.column("psi").to_pylist()[::2], [14.7, 100.0])
+    assert table.column("psi").null_count == 1
+    kpl = table.column("kpl").to_pylist()
+    # 0 km/L is infinite consumption, which JSON can only hold as null
+    assert (kpl[0] is None) if extension == "jsonl" else kpl[0] == math.inf
+    assert kpl[1:] == [8.0, 5.0]
+
+
+def test_json_lines_match_json_dumps():
+    batch = pa.record_batch({
+        "value": pa.array([1.5, 2.0, math.inf, math.nan, None, 1e-300]),
+        "count": pa.array([1, None, 3, 4, 5, -6]),
+        "flag": pa.array([True, False, None, True, True, False]),
+        "text": pa.array(['say "hi"', "back\\slash", "two\nlines", "ünïcode", None, "\x07bell"]),
+        "unit": pa.array(["Byte", "KiB", "Byte", None, "MiB", "KiB"]).dictionary_encode(),
+    })
+    rows = [json.loads(line) for line in bytes(json_lines(batch)).decode().splitlines()]
+    expected = [
+        {key: None if isinstance(value, float) and not math.isfinite(value) else value for key, value in row.items()}
+        for row in batch.to_pylist()
+    ]
+    assert rows == expected
+    assert bytes(json_lines(batch.slice(1, 1))) == b'{"value": 2.0, "count": null, "flag": false, ' \
+                                                   b'"text": "back\\\\slash", "unit": "KiB"}\n'
+
+
+def test_main_formats_text(readings, tmp_path, capsys):
+    output = tmp_path / "out.jsonl"
+    assert main([str(readings), str(output), "-c", "psi:Pressure:PSI:Kilopascal", "--digits", "3"]) == 0
+    assert [json.loads(line)["psi"] for line in output.read_text().splitlines()] == ["101", None, "689"]
+    assert main([str(readings), str(output), "-c", "missing:Pressure:PSI:Pascal"]) == 1
+    assert "missing" in capsys.readouterr().err
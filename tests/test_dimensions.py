@@ -0,0 +1,49 @@
+import pytest
+
+from unit_converter.conversions import categories, currency_conversion
+from unit_converter.dimensions import dimensional_conversion
+from unit_converter.rates import StaticRateProvider, exchange_rates, set_rate_provider
+
+
+@pytest.mark.parametrize("from_expr, to_expr, expected", [
+    ("kg/m³", "g/L", 1.0),
+    ("g/cm³", "kg/m³", 1000.0),
+    ("N·m", "Joule", 1.0),
+    ("GB/s", "MB/min", 61440.0),
+    ("kg·m/s^2", "N", 1.0),
+    ("kg*m**2", "g·cm²", 1e7),
+    ("m**-1", "1/km", 1000.0),
+    ("m/s", "km/s", 0.001),
+])
+def test_compound_conversions(from_expr, to_expr, expected):
+    assert dimensional_conversion(1, from_expr, to_expr) == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("category", ["Temperature", "Fuel Economy", "Pressure"])
+def test_same_category_matches_category_conversion(category):
+    function = categories[category]["conversion_function"]
+    units = categories[category]["units"]
+    for from_unit in units:
+        for to_unit in units:
+            expected = function(12.5, from_unit, to_unit).value
+            assert dimensional_conversion(12.5, from_unit, to_unit) == pytest.approx(expected, rel=1e-12)
+
+
+def test_incompatible_dimensions():
+    with pytest.raises(ValueError, match="cannot convert"):
+        dimensional_conversion(1, "kg/m³", "m/s")
+    with pytest.raises(ValueError, match="unknown unit"):
+        dimensional_conversion(1, "kg/parsec", "kg/m")
+
+
+@pytest.fixture
+def rates():
+    yield
+    set_rate_provider(StaticRateProvider())
+
+
+def test_currency_follows_the_rate_provider(rates):
+    assert dimensional_conversion(1, "USD", "EUR") == pytest.approx(exchange_rates["EUR"])
+    set_rate_provider(StaticRateProvider(dict(exchange_rates, EUR=2.0)))
+    assert dimensional_conversion(1, "USD", "EUR") == pytest.approx(2.0)
+    assert currency_conversion(1, "USD", "EUR").value == pytest.approx(2.0)
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from unit_converter.formatting import DEFAULT_FORMAT, format_array, format_lines, format_value, number_format
+
+FORMATS = [
+    DEFAULT_FORMAT,
+    number_format(9, "general", "en"),
+    number_format(4, "scientific"),
+    number_format(9, "engineering", "de"),
+    number_format(4, "si", "fr"),
+]
+
+
+def formatted(values, nf):
+    return [text.decode() for text in format_array(np.asarray(values, dtype=float), nf).tolist()]
+
+
+def test_default_matches_g_format():
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal(20000) * 10.0 ** rng.integers(-30, 31, 20000)
+    assert formatted(values, DEFAULT_FORMAT) == [f"{value:.6g}" for value in values.tolist()]
+
+
+@pytest.mark.parametrize("nf", FORMATS)
+def test_array_matches_scalar(nf):
+    rng = np.random.default_rng(1)
+    values = rng.standard_normal(5000) * 10.0 ** rng.integers(-30, 31, 5000)
+    values = np.concatenate([values, [0.0, -0.0, np.inf, -np.inf, np.nan, 1e308, 5e-324]])
+    assert formatted(values, nf) == [format_value(value, nf) for value in values.tolist()]
+
+
+@pytest.mark.parametrize("value", [99999.95, 99.99995, 9.999995, -99999.95, 9.9999995e20])
+def test_ties_that_carry_match_scalar(value):
+    assert formatted([value], DEFAULT_FORMAT) == [f"{value:.6g}"]
+    for nf in FORMATS:
+        assert formatted([value], nf) == [format_value(value, nf)]
+
+
+def test_format_lines_joins_without_padding():
+    assert format_lines([1.5, 1234567.0, -0.001], DEFAULT_FORMAT) == b"1.5\n1.23457e+06\n-0.001\n"
@@ -0,0 +1,62 @@
+import math
+
+import pytest
+
+from unit_converter.history import HistoryStore, connect
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.db"), flush_interval=0.01)
+    yield store
+    store.close()
+
+
+def test_record_and_query(store):
+    store.record("Length", "Mile", "Kilometer", 1.0, 1.609344)
+    store.record("Length", "Mile", "Kilometer", 2.0, 3.218688)
+    store.record("Length", "Foot", "Meter", 1.0, 0.3048)
+    store.flush()
+    assert store.written == 3
+    assert store.frequent("Length") == [("Mile", "Kilometer", 2), ("Foot", "Meter", 1)]
+    assert store.recent("Length", limit=1) == [("Foot", "Meter")]
+
+
+def test_favorite_is_preferred_pair(store):
+    store.record("Length", "Mile", "Kilometer", 1.0, 1.609344)
+    store.flush()
+    assert store.preferred_pair("Length") == ("Mile", "Kilometer")
+    store.add_favorite("Length", "Inch", "Centimeter")
+    assert store.preferred_pair("Length") == ("Inch", "Centimeter")
+    store.remove_favorite("Length", "Inch", "Centimeter")
+    assert store.favorites() == []
+
+
+def test_non_finite_values(store):
+    with pytest.raises(ValueError, match="non-finite"):
+        store.record("Length", "Mile", "Kilometer", math.nan, 1.0)
+    with pytest.raises(ValueError, match="non-finite"):
+        store.record("Length", "Mile", "Kilometer", math.inf, 1.0)
+    store.record("Fuel Economy", "L/100km", "km/L", 0.0, math.inf)
+    store.flush()
+    assert store.history(limit=1)[0][4:] == (0.0, None)
+
+
+def test_failed_batch_keeps_the_writer_running(store):
+    with connect(store.path) as connection:
+        connection.execute("DROP TABLE history")
+    store.record("Length", "Mile", "Kilometer", 1.0, 1.609344)
+    store.flush()
+    assert store.failed == 1 and store.written == 0
+
+    with connect(store.path) as connection:
+        connection.execute("CREATE TABLE history (id INTEGER PRIMARY KEY, used_at REAL, category TEXT, "
+                           "from_unit TEXT, to_unit TEXT, value REAL, result REAL)")
+    store.record("Length", "Mile", "Kilometer", 1.0, 1.609344)
+    store.flush()
+    assert store.written == 1
+
+
+def test_flush_after_close_returns(store):
+    store.close()
+    store.flush()
@@ -0,0 +1,71 @@
+import math
+
+import numpy as np
+import pytest
+
+from unit_converter.humanize import HUMANIZE_UNITS, SCAN_UNITS, humanize, humanize_array, ladder_units
+
+
+@pytest.mark.parametrize("value, category, from_unit, expected", [
+    (1073741824, "Data", "Byte", (1.0, "Gibibyte (GiB)")),
+    (0.25, "Time", "Second", (250.0, "Millisecond")),
+    (90, "Time", "Minute", (1.5, "Hour")),
+    (2000, "Length", "Meter", (2.0, "Kilometer")),
+    (2, "Length", "Mile", (2.0, "Mile")),
+    (24, "Length", "Inch", (2.0, "Foot")),
+    (0.5, "Weight/Mass", "Kilogram", (500.0, "Gram")),
+    (32, "Weight/Mass", "Ounce", (2.0, "Pound")),
+    (0.0, "Data", "Byte", (0.0, "Byte")),
+    (-2048, "Data", "Byte", (-2.0, "Kibibyte (KiB)")),
+])
+def test_humanize(value, category, from_unit, expected):
+    result, unit = humanize(value, category, from_unit)
+    assert unit == expected[1]
+    assert result == pytest.approx(expected[0], rel=1e-6)
+
+
+@pytest.mark.parametrize("category", sorted(HUMANIZE_UNITS))
+def test_ladders_stay_in_one_system(category):
+    for ladder in HUMANIZE_UNITS[category]:
+        for unit in ladder:
+            assert ladder_units(category, unit) == ladder
+            assert humanize(1, category, unit)[1] in ladder
+
+
+def test_humanize_errors():
+    with pytest.raises(ValueError, match="no fixed factors"):
+        humanize(1, "Temperature", "Celsius")
+    with pytest.raises(ValueError, match="no unit ladder"):
+        humanize(1, "Speed", "Knot")
+
+
+def test_humanize_nan_uses_smallest_unit():
+    result, unit = humanize(math.nan, "Data", "Kibibyte (KiB)")
+    assert math.isnan(result) and unit == "Byte"
+
+
+@pytest.mark.parametrize("category, from_unit, units", [
+    ("Data", "Byte", None),
+    ("Length", "Foot", None),
+    ("Time", "Second", None),
+    # A ladder longer than SCAN_UNITS takes the binary-search path
+    ("Time", "Second", ("Second",) * (SCAN_UNITS + 1) + ("Minute", "Hour")),
+])
+def test_humanize_array_matches_scalar(category, from_unit, units):
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal(5000) * 10.0 ** rng.integers(-10, 19, 5000)
+    values[:3] = [0.0, math.nan, -0.0]
+    out, unit_index, names = humanize_array(values, category, from_unit, units)
+    expected = [humanize(value, category, from_unit, units) for value in values.tolist()]
+    assert [names[i] for i in unit_index.tolist()] == [unit for _, unit in expected]
+    np.testing.assert_array_equal(out, [value for value, _ in expected])
+
+
+def test_humanize_array_out_and_shape():
+    values = np.array([[1.0, 2048.0], [3 * 1024.0 ** 3, 0.5]])
+    out = np.empty_like(values)
+    result, unit_index, names = humanize_array(values, "Data", "Byte", out=out)
+    assert result is out and unit_index.shape == (2, 2)
+    assert [[names[i] for i in row] for row in unit_index.tolist()] == [
+        ["Byte", "Kibibyte (KiB)"], ["Gibibyte (GiB)", "Byte"]]
+    np.testing.assert_allclose(out, [[1.0, 2.0], [3.0, 0.5]])
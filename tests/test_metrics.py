@@ -0,0 +1,41 @@
+import pytest
+
+from unit_converter import metrics
+
+
+@pytest.fixture
+def histograms(monkeypatch):
+    monkeypatch.setattr(metrics, "histograms", {})
+    monkeypatch.setattr(metrics, "enabled", True)
+    return metrics.histograms
+
+
+@pytest.mark.parametrize("value, escaped", [
+    ("Length", "Length"),
+    ('12" pipe', '12\\" pipe'),
+    ("C:\\units", "C:\\\\units"),
+    ("two\nlines", "two\\nlines"),
+    ('\\"\n', '\\\\\\"\\n'),
+])
+def test_escape_label(value, escaped):
+    assert metrics.escape_label(value) == escaped
+
+
+def test_render_escapes_label_values(histograms):
+    metrics.instrument(lambda: None, "unit_converter_test_seconds", category='Odd "name"\\\n')()
+    text = metrics.render()
+    assert 'unit_converter_test_seconds_count{category="Odd \\"name\\"\\\\\\n"} 1' in text
+    # Every sample stays on one line
+    assert all(line.startswith(("#", "unit_converter_test_")) for line in text.splitlines())
+
+
+def test_instrument_counts_errors(histograms):
+    def fail():
+        raise ValueError("boom")
+
+    timed = metrics.instrument(fail, "unit_converter_test_seconds")
+    with pytest.raises(ValueError):
+        timed()
+    stats = metrics.histogram("unit_converter_test_seconds")
+    assert (stats.calls, stats.errors) == (1, 1)
+    assert "unit_converter_test_errors_total 1" in metrics.render()
@@ -0,0 +1,54 @@
+import os
+
+import numpy as np
+import pytest
+
+from unit_converter import parallel
+from unit_converter.batch import batch_conversion
+from unit_converter.parallel import ParallelConverter, SharedArray, parallel_conversion
+
+pytestmark = pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="needs POSIX shared memory in /dev/shm")
+
+
+def shared_blocks():
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")}
+
+
+def failing_slice(*args):
+    raise RuntimeError("worker failed")
+
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(0).uniform(-100, 100, 10001)
+
+
+def test_matches_batch_conversion(values):
+    before = shared_blocks()
+    with ParallelConverter(workers=2, chunk_size=1000) as converter:
+        assert len(converter.slices(len(values))) == 11
+        for pair in [("Pressure", "PSI", "Pascal"), ("Temperature", "Fahrenheit", "Celsius"),
+                     ("Fuel Economy", "Kilometers per Liter", "Liters per 100 Kilometers")]:
+            np.testing.assert_array_equal(converter.convert(values, *pair), batch_conversion(values, *pair))
+    np.testing.assert_array_equal(parallel_conversion(values[:10], "Length", "Mile", "Meter", workers=2),
+                                  batch_conversion(values[:10], "Length", "Mile", "Meter"))
+    assert shared_blocks() == before
+
+
+def test_convert_inplace(values):
+    before = shared_blocks()
+    with ParallelConverter(workers=2, chunk_size=4096) as converter, SharedArray.from_values(values) as shared:
+        result = converter.convert_inplace(shared, "Length", "Mile", "Meter")
+        assert result is shared.array
+        np.testing.assert_array_equal(result, batch_conversion(values, "Length", "Mile", "Meter"))
+    assert shared_blocks() == before
+
+
+def test_worker_exception_releases_shared_memory(values, monkeypatch):
+    before = shared_blocks()
+    # Worker processes are forked after the patch, so they run the failing task too
+    monkeypatch.setattr(parallel, "convert_slice", failing_slice)
+    with ParallelConverter(workers=2, chunk_size=1000) as converter:
+        with pytest.raises(RuntimeError, match="worker failed"):
+            converter.convert(values, "Pressure", "PSI", "Pascal")
+    assert shared_blocks() == before
@@ -0,0 +1,55 @@
+import pytest
+
+from unit_converter.parser import Quantity, find_quantities, parse_bulk, parse_many, parse_quantity
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("12.5 mi", Quantity(12.5, "Mile", "Length")),
+    ("disk usage 500 MiB", Quantity(500.0, "Mebibyte (MiB)", "Data")),
+    ("72°F", Quantity(72.0, "Fahrenheit", "Temperature")),
+    ("1,500.5 kWh", Quantity(1500.5, "Kilowatt-hour", "Energy")),
+    ("-3e2 Pa", Quantity(-300.0, "Pascal", "Pressure")),
+    ("1 µs", Quantity(1.0, "Microsecond", "Time")),
+    ("1 μs", Quantity(1.0, "Microsecond", "Time")),
+    ("3 Miles", Quantity(3.0, "Mile", "Length")),
+    ("3 miles", Quantity(3.0, "Mile", "Length")),
+    ("2 Nautical Miles", Quantity(2.0, "Nautical Mile", "Length")),
+    ("7 gallons", Quantity(7.0, "Gallon (US)", "Volume")),
+    ("2 fluid ounces", Quantity(2.0, "Fluid Ounce (US)", "Volume")),
+    ("a 12 in", Quantity(12.0, "Inch", "Length")),
+    ("10 inches", Quantity(10.0, "Inch", "Length")),
+    ("6 in²", Quantity(6.0, "Square Inch", "Area")),
+])
+def test_parse_quantity(text, expected):
+    assert parse_quantity(text) == expected
+
+
+@pytest.mark.parametrize("text", ["3 in the box", "no numbers here", "5 parsecs", "12 kgm"])
+def test_parse_quantity_without_unit(text):
+    with pytest.raises(ValueError, match="no quantity"):
+        parse_quantity(text)
+
+
+def test_in_before_a_number():
+    assert parse_quantity("put 3 in 2 boxes") == Quantity(3.0, "Inch", "Length")
+    assert find_quantities("3 in the box, 4 kg") == [Quantity(4.0, "Kilogram", "Weight/Mass")]
+
+
+def test_parse_many():
+    lines = ["took 250 ms", "nothing", "3 in the box", "flight of 1,200 km then 3 mi", "5 in"]
+    assert list(parse_many(lines)) == [
+        Quantity(250.0, "Millisecond", "Time"),
+        None,
+        None,
+        Quantity(1200.0, "Kilometer", "Length"),
+        Quantity(5.0, "Inch", "Length"),
+    ]
+
+
+def test_parse_bulk():
+    text = "read 512 MiB in 3 s\nboard of 12 in\n3 in the box\n20 °C"
+    values, units, categories = parse_bulk(text)
+    assert values == [512.0, 3.0, 12.0, 20.0]
+    assert units == ["Mebibyte (MiB)", "Second", "Inch", "Celsius"]
+    assert categories == ["Data", "Time", "Length", "Temperature"]
+    assert parse_bulk(text) == tuple(map(list, zip(*find_quantities(text))))
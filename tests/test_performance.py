@@ -0,0 +1,64 @@
+"""Throughput and memory gates that hold on any machine.
+
+Absolute speeds vary between machines, so each check is a ratio against
+a reference measured in the same run: a scalar conversion against a
+trivial Python call, a batch conversion against the scalar path, and the
+batch's peak memory against the size of its output. The limits leave
+about 2-4x headroom over the measured ratios; benchmarks/regression.py
+tracks absolute numbers against a per-machine baseline.
+"""
+import timeit
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from unit_converter import batch_conversion, categories
+
+# A scalar conversion (lookup, arithmetic and ConversionResult) may cost this
+# many trivial function calls (measured: 9-16)
+MAX_SCALAR_OVERHEAD = 30
+# A batch conversion must beat the scalar path per value by this much (measured: 700-1200)
+MIN_BATCH_SPEEDUP = 200
+# Peak memory of a batch conversion, in output arrays (measured: 1.0)
+MAX_BATCH_PEAK = 1.5
+
+BATCH = np.random.default_rng(0).uniform(1, 1000, 200000)
+
+
+def best_seconds(function, number):
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def reference(value, from_unit, to_unit):
+    return value * 1.0
+
+
+@pytest.mark.parametrize("category", sorted(categories))
+def test_scalar_overhead(category):
+    convert = categories[category]["conversion_function"]
+    from_unit, to_unit = categories[category]["units"][0], categories[category]["units"][-1]
+    scalar = best_seconds(lambda: convert(12.5, from_unit, to_unit), 2000)
+    trivial = best_seconds(lambda: reference(12.5, from_unit, to_unit), 2000)
+    assert scalar / trivial < MAX_SCALAR_OVERHEAD
+
+
+@pytest.mark.parametrize("category", sorted(categories))
+def test_batch_speedup(category):
+    convert = categories[category]["conversion_function"]
+    from_unit, to_unit = categories[category]["units"][0], categories[category]["units"][-1]
+    scalar = best_seconds(lambda: convert(12.5, from_unit, to_unit), 2000)
+    batch = best_seconds(lambda: batch_conversion(BATCH, category, from_unit, to_unit), 1) / len(BATCH)
+    assert scalar / batch > MIN_BATCH_SPEEDUP
+
+
+@pytest.mark.parametrize("category", sorted(categories))
+def test_batch_peak_memory(category):
+    from_unit, to_unit = categories[category]["units"][0], categories[category]["units"][-1]
+    tracemalloc.start()
+    try:
+        batch_conversion(BATCH, category, from_unit, to_unit)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < BATCH.nbytes * MAX_BATCH_PEAK
@@ -0,0 +1,97 @@
+import pickle
+from fractions import Fraction
+
+import pytest
+
+from unit_converter import exact
+from unit_converter.plugins import PluginError, load_registry, plugin_paths
+from unit_converter.units import unit_definitions
+
+RADIATION = """
+[categories."Radiation Dose"]
+icon = "☢️"
+
+[categories."Radiation Dose".units]
+Gray = 1
+Rad = 0.01
+
+[categories.Length.units]
+Furlong = 201.168
+
+[categories.Temperature.units]
+Delisle = { factor = -0.6666666666666666, offset = 373.15 }
+"""
+
+
+@pytest.fixture
+def plugin(tmp_path, monkeypatch):
+    monkeypatch.setenv("UNIT_CONVERTER_CACHE", str(tmp_path / "cache"))
+    path = tmp_path / "radiation.toml"
+    path.write_text(RADIATION, encoding="utf-8")
+    return str(path)
+
+
+def test_load_and_cache(plugin, tmp_path):
+    registry, metadata = load_registry(unit_definitions, [plugin])
+    assert metadata == {"Radiation Dose": {"icon": "☢️", "description": ""}}
+    assert registry.factor("Length", "Furlong", "Meter") == pytest.approx(201.168)
+    assert registry.factor("Radiation Dose", "Rad", "Gray") == pytest.approx(0.01)
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    cached, _ = load_registry(unit_definitions, [plugin])
+    assert cached.units("Length") == registry.units("Length")
+    assert cached.transform("Temperature", "Delisle", "Celsius") == registry.transform(
+        "Temperature", "Delisle", "Celsius")
+
+
+@pytest.mark.parametrize("payload", [42, ("state", {}), ({"bogus": 1}, {})])
+def test_malformed_cache_is_rebuilt(plugin, tmp_path, payload):
+    registry, _ = load_registry(unit_definitions, [plugin])
+    (cache_path,) = (tmp_path / "cache").iterdir()
+    # Keep the key so the file is read, but replace the compiled registry
+    key = cache_path.read_bytes()[:32]
+    cache_path.write_bytes(key + pickle.dumps(payload))
+
+    rebuilt, metadata = load_registry(unit_definitions, [plugin])
+    assert rebuilt.units("Length") == registry.units("Length")
+    assert "Radiation Dose" in metadata
+    assert cache_path.read_bytes() != key + pickle.dumps(payload)
+
+
+def test_plugin_paths_lists_directories(plugin, tmp_path):
+    (tmp_path / "notes.txt").write_text("")
+    assert plugin_paths(str(tmp_path)) == [plugin]
+
+
+@pytest.mark.parametrize("text, message", [
+    ("[categories.Currency.units]\nBTC = 1", "can't be added"),
+    ("[categories.Length.units]\nMeter = 1", "already defined"),
+    ("[categories.Length.units]\nHop = 0", "must not be zero"),
+    ("[categories.Length.units]\nHop = { factor = 2, offset = 1 }", "plain factors"),
+    ("[categories.Length]\nicon = 'x'\n[categories.Length.units]\nHop = 2", "can't be changed"),
+    ("categories = 1", "top-level 'categories'"),
+    ("not toml", "radiation.toml"),
+])
+def test_invalid_plugins(plugin, text, message):
+    with open(plugin, "w", encoding="utf-8") as f:
+        f.write(text)
+    with pytest.raises(PluginError, match=message):
+        load_registry(unit_definitions, [plugin])
+
+
+@pytest.fixture
+def plugin_registry(plugin, monkeypatch):
+    registry, _ = load_registry(unit_definitions, [plugin])
+    monkeypatch.setattr(exact, "registry", registry)
+    exact.exact_coefficients.cache_clear()
+    yield registry
+    exact.exact_coefficients.cache_clear()
+
+
+def test_exact_mode_reads_plugin_literals(plugin_registry):
+    assert exact.exact_conversion(1, "Length", "Furlong", "Meter") == Fraction("201.168")
+    assert exact.exact_conversion(8, "Length", "Furlong", "Mile") == 1
+    assert exact.exact_conversion(100, "Radiation Dose", "Rad", "Gray") == 1
+    assert exact.exact_conversion(0, "Temperature", "Delisle", "Celsius") == 100
+    with pytest.raises(KeyError, match="unknown Length unit"):
+        exact.exact_conversion(1, "Length", "Chain", "Meter")
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from unit_converter.rate_history import HistoricalRateProvider, RateHistory
+
+
+@pytest.fixture
+def history(tmp_path):
+    # JPY is quoted from 2000, EUR only from 2009
+    path = tmp_path / "rates.csv"
+    path.write_text(
+        "date,currency,rate\n"
+        "2000-01-03,JPY,105.0\n"
+        "2001-05-01,JPY,120.0\n"
+        "2009-01-02,EUR,0.70\n"
+        "2010-01-04,EUR,0.75\n"
+    )
+    return RateHistory.from_csv(path)
+
+
+def test_as_of_lookup_uses_latest_quote_on_or_before(history):
+    assert history.rate_on("JPY", "2001-04-30") == 105.0
+    assert history.rate_on("JPY", "2001-05-01") == 120.0
+    assert history.rate_on("JPY", "2024-01-01") == 120.0
+    assert history.rate_on("USD", "1990-01-01") == 1.0
+
+
+def test_scalar_errors(history):
+    with pytest.raises(KeyError):
+        history.rate_on("EUR", "2008-12-31")
+    with pytest.raises(KeyError):
+        history.rate_on("GBP", "2010-01-01")
+
+
+def test_convert_many_matches_convert(history):
+    dates = ["2001-05-05", "2010-06-01", "2009-06-30", "2000-02-01"]
+    from_codes = ["USD", "EUR", "EUR", "JPY"]
+    to_codes = ["JPY", "USD", "JPY", "USD"]
+    values = [100.0, 100.0, 50.0, 1000.0]
+    converted = history.convert_many(values, dates, from_codes, to_codes)
+    expected = [history.convert(*row) for row in zip(values, from_codes, to_codes, dates)]
+    np.testing.assert_allclose(converted, expected, rtol=1e-15)
+
+
+def test_convert_many_staggered_start_dates(history):
+    # An early JPY row must not require an EUR rate on its date
+    converted = history.convert_many([100, 100], ["2001-05-05", "2010-06-01"], ["USD", "EUR"], ["JPY", "USD"])
+    np.testing.assert_allclose(converted, [12000.0, 100 / 0.75])
+
+
+def test_convert_many_missing_rate_names_currency_and_day(history):
+    with pytest.raises(KeyError, match="no EUR rate on or before 2001-05-05"):
+        history.convert_many([1, 1], ["2001-05-05", "2010-06-01"], "EUR", "USD")
+    with pytest.raises(KeyError, match="GBP"):
+        history.convert_many([1], ["2010-06-01"], ["GBP"], ["USD"])
+
+
+def test_historical_rate_provider(history):
+    rates = HistoricalRateProvider(history, "2005-01-01").fetch()
+    assert rates == {"USD": 1.0, "JPY": 120.0}
+
+
+def test_unknown_currency_in_convert_many(history):
+    amounts = np.array([1.0, 2.0])
+    dates = np.array(["2010-01-04", "2010-01-05"], dtype="datetime64[D]")
+    with pytest.raises(KeyError, match="no rate history for 'XYZ'"):
+        history.convert_many(amounts, dates, "XYZ", "USD")
+    with pytest.raises(KeyError, match="no rate history for 'XYZ'"):
+        history.convert_many(amounts, dates, "EUR", "XYZ")
+    with pytest.raises(KeyError, match="no rate history for 'XYZ'"):
+        history.convert_many(amounts, dates, np.array(["EUR", "XYZ"]), "USD")
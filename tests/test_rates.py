@@ -0,0 +1,60 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+from unit_converter.rates import FileRateProvider, HttpRateProvider, RateCache, StaticRateProvider
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_providers_read_json(tmp_path):
+    path = tmp_path / "rates.json"
+    path.write_text(json.dumps({"rates": {"USD": 1, "EUR": "0.9"}}))
+    assert FileRateProvider(str(path)).fetch() == {"USD": 1.0, "EUR": 0.9}
+    assert HttpRateProvider(path.as_uri()).fetch() == {"USD": 1.0, "EUR": 0.9}
+
+
+def test_cache_serves_fresh_rates_without_fetching():
+    provider = StaticRateProvider({"USD": 1.0, "EUR": 0.9})
+    cache = RateCache(provider, ttl=3600)
+    assert cache.get_rates() == {"USD": 1.0, "EUR": 0.9}
+    cache.get_rates()
+    assert provider.fetches == 1
+
+
+def test_import_does_not_load_urllib_request():
+    code = "import sys, unit_converter; print('urllib.request' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                          cwd=ROOT).stdout.strip() == "False"
+
+
+class FlakyProvider(StaticRateProvider):
+    """Serve rates once, then fail every fetch."""
+
+    def fetch(self):
+        rates = super().fetch()
+        if self.fetches > 1:
+            raise OSError("provider is down")
+        return rates
+
+
+def wait_for_refresh(cache):
+    deadline = time.monotonic() + 5
+    while cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_failed_refresh_waits_a_retry_interval():
+    provider = FlakyProvider({"USD": 1.0, "EUR": 0.9})
+    cache = RateCache(provider, ttl=0, retry_interval=0.2)
+    for _ in range(50):
+        assert cache.get_rates() == {"USD": 1.0, "EUR": 0.9}
+        wait_for_refresh(cache)
+    assert provider.fetches == 2 and cache.refresh_errors == 1
+
+    time.sleep(0.25)
+    cache.get_rates()
+    wait_for_refresh(cache)
+    assert provider.fetches == 3
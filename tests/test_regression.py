@@ -0,0 +1,73 @@
+import itertools
+import json
+import math
+import os
+
+import numpy as np
+import pytest
+
+from unit_converter import batch_conversion, categories
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "golden.json")
+# Must match GOLDEN_INPUTS in benchmarks/regression.py, which writes golden.json
+GOLDEN_INPUTS = (1.0, 12.5, -40.0, 0.0)
+ROUND_TRIP_INPUTS = (1.0, 12.5, -40.0, 0.001, 1e6)
+REL_TOL = 1e-9
+
+with open(GOLDEN_PATH, encoding="utf-8") as f:
+    GOLDEN = json.load(f)
+
+
+def close(actual, expected):
+    if math.isinf(expected) or math.isinf(actual):
+        return actual == expected
+    return math.isclose(actual, expected, rel_tol=REL_TOL, abs_tol=1e-12)
+
+
+@pytest.mark.parametrize("category", sorted(GOLDEN))
+def test_golden_values(category):
+    assert category in categories
+    convert = categories[category]["conversion_function"]
+    failures = []
+    for from_unit, row in GOLDEN[category].items():
+        for to_unit, values in row.items():
+            for value, want in zip(GOLDEN_INPUTS, values):
+                got = convert(value, from_unit, to_unit).value
+                if not close(got, want):
+                    failures.append(f"{value} {from_unit} -> {to_unit} = {got!r}, golden {want!r}")
+    assert not failures
+
+
+@pytest.mark.parametrize("category", sorted(categories))
+def test_round_trips(category):
+    convert = categories[category]["conversion_function"]
+    failures = []
+    for from_unit, to_unit in itertools.product(categories[category]["units"], repeat=2):
+        for value in ROUND_TRIP_INPUTS:
+            back = convert(convert(value, from_unit, to_unit).value, to_unit, from_unit).value
+            if not close(back, value):
+                failures.append(f"{value} {from_unit} -> {to_unit} -> back = {back!r}")
+    assert not failures
+
+
+@pytest.mark.parametrize("category", sorted(categories))
+def test_batch_matches_scalar(category):
+    convert = categories[category]["conversion_function"]
+    values = np.array([1.0, 12.5, -40.0, 0.001, 1e6])
+    for from_unit, to_unit in itertools.product(categories[category]["units"], repeat=2):
+        expected = [convert(value, from_unit, to_unit).value for value in values.tolist()]
+        np.testing.assert_allclose(batch_conversion(values, category, from_unit, to_unit), expected, rtol=1e-12)
+
+
+PER_100 = "Liters per 100 Kilometers"
+
+
+@pytest.mark.parametrize("unit", [unit for unit in categories["Fuel Economy"]["units"] if unit != PER_100])
+def test_fuel_economy_edges(unit):
+    # Zero fuel economy is infinite fuel consumption, and back again
+    convert = categories["Fuel Economy"]["conversion_function"]
+    assert convert(0.0, unit, PER_100).value == math.inf
+    assert convert(math.inf, PER_100, unit).value == 0.0
+    assert convert(0.0, PER_100, unit).value == math.inf
+    np.testing.assert_array_equal(batch_conversion([0.0], "Fuel Economy", unit, PER_100), [math.inf])
+    np.testing.assert_array_equal(batch_conversion([math.inf], "Fuel Economy", PER_100, unit), [0.0])
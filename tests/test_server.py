@@ -0,0 +1,38 @@
+import asyncio
+import json
+
+import pytest
+
+from unit_converter.server import ConversionServer, convert_many, convert_one
+
+FUEL = ("Fuel Economy", "Kilometers per Liter", "Liters per 100 Kilometers")
+
+
+def test_convert_one():
+    assert convert_one(1.0, "Length", "Mile", "Meter") == {"result": pytest.approx(1609.34)}
+    assert "formula" in convert_one(1.0, "Length", "Mile", "Meter", with_formula=True)
+    with pytest.raises(KeyError, match="unknown Length unit"):
+        convert_one(1.0, "Length", "Mile", "Parsec")
+
+
+def test_non_finite_results_are_null():
+    response = convert_one(0.0, *FUEL)
+    assert response["result"] is None and "not finite" in response["error"]
+    assert convert_many([[0, *FUEL], [5, *FUEL], ["nan", "Length", "Mile", "Meter"]]) == [None, 20.0, None]
+
+
+def test_responses_are_strict_json():
+    server = ConversionServer(workers=1)
+
+    def request(method, target, body=b""):
+        status, payload = asyncio.run(server.dispatch(method, target, body))
+        return status, json.loads(json.dumps(payload, allow_nan=False))
+
+    status, payload = request("GET", "/convert?value=0&category=Fuel+Economy"
+                                     "&from=Kilometers+per+Liter&to=Liters+per+100+Kilometers")
+    assert status == 200 and payload["result"] is None
+    status, payload = request("POST", "/batch", json.dumps({"items": [[0, *FUEL], [1, "Length", "Mile", "Meter"]]}))
+    assert payload == {"results": [None, pytest.approx(1609.34)]}
+    status, payload = request("GET", "/convert?value=1&category=Length&from=Mile&to=Parsec")
+    assert status == 400 and "Parsec" in payload["error"]
+    server.executor.shutdown()
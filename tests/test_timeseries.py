@@ -0,0 +1,85 @@
+import math
+
+import numpy as np
+import pytest
+
+from unit_converter.batch import batch_conversion
+from unit_converter.timeseries import normalize, normalize_chunks, resample, resample_chunks
+
+PSI_IN_PA = 6894.76
+
+
+def chunked(timestamps, values, size):
+    for start in range(0, len(values), size):
+        yield timestamps[start:start + size], values[start:start + size]
+
+
+def assert_windows_equal(actual, expected):
+    assert len(actual) == len(expected)
+    for got, want in zip(actual, expected):
+        assert got.start == want.start and got.count == want.count
+        np.testing.assert_allclose(got[2:], want[2:], rtol=1e-12)
+
+
+def test_normalize_unit_change_mid_stream():
+    records = [(0, 1.0, "PSI"), (1, 2.0, "PSI"), (2, 1.0, "Bar"), (3, 0.5, "Bar"), (4, 3.0, "PSI")]
+    points = list(normalize(records, "Pressure", "Pascal"))
+    assert [t for t, _ in points] == [0, 1, 2, 3, 4]
+    np.testing.assert_allclose([v for _, v in points],
+                               [PSI_IN_PA, 2 * PSI_IN_PA, 100000.0, 50000.0, 3 * PSI_IN_PA])
+
+
+def test_normalize_chunks_matches_normalize():
+    rng = np.random.default_rng(0)
+    units = np.array(["Celsius", "Fahrenheit", "Kelvin"])[rng.integers(0, 3, 1000)]
+    values = rng.uniform(-50, 300, 1000)
+    timestamps = np.arange(1000.0)
+    expected = [v for _, v in normalize(zip(timestamps, values, units), "Temperature", "Kelvin")]
+    converted = np.concatenate([v for _, v in normalize_chunks(
+        ((timestamps[i:i + 300], values[i:i + 300], units[i:i + 300]) for i in range(0, 1000, 300)),
+        "Temperature", "Kelvin")])
+    np.testing.assert_allclose(converted, expected, rtol=1e-12)
+
+
+def test_reciprocal_chunk_path():
+    values = np.array([5.0, 0.0, 20.0, 8.0])
+    chunks = [(np.arange(2.0), values[:2], "Liters per 100 Kilometers"),
+              (np.arange(2.0, 4.0), values[2:], np.array(["Kilometers per Liter", "Liters per 100 Kilometers"]))]
+    converted = np.concatenate([v for _, v in normalize_chunks(chunks, "Fuel Economy", "Kilometers per Liter")])
+    np.testing.assert_allclose(converted, [20.0, math.inf, 20.0, 12.5])
+    expected = batch_conversion(values[:2], "Fuel Economy", "Liters per 100 Kilometers", "Kilometers per Liter")
+    np.testing.assert_array_equal(converted[:2], expected)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 10000])
+def test_resample_chunks_matches_resample(chunk_size):
+    rng = np.random.default_rng(1)
+    timestamps = np.cumsum(rng.exponential(3.0, 2000))
+    values = rng.normal(100, 20, 2000)
+    # NaN first in a window, inside a window, and a window of only NaN
+    values[[0, 50, 51, 52]] = math.nan
+    timestamps[51:53] = timestamps[50]
+    expected = list(resample(zip(timestamps.tolist(), values.tolist()), interval=60, origin=5.0))
+    actual = list(resample_chunks(chunked(timestamps, values, chunk_size), interval=60, origin=5.0))
+    assert_windows_equal(actual, expected)
+    assert all(not math.isnan(w.min) and not math.isnan(w.max) for w in expected[1:])
+
+
+def test_resample_skips_nan_in_min_and_max():
+    points = [(0, math.nan), (1, 3.0), (2, 1.0), (3, math.nan), (60, math.nan)]
+    windows = list(resample(points, interval=60))
+    assert (windows[0].count, windows[0].min, windows[0].max) == (4, 1.0, 3.0)
+    assert math.isnan(windows[0].mean)
+    assert math.isnan(windows[1].min) and math.isnan(windows[1].max)
+    assert_windows_equal(list(resample_chunks(chunked(*map(np.array, zip(*points)), 2), 60)), windows)
+
+
+def test_decreasing_timestamps():
+    points = [(0, 1.0), (70, 2.0), (10, 3.0)]
+    with pytest.raises(ValueError):
+        list(resample(points, interval=60))
+    timestamps, values = np.array([0.0, 70.0, 10.0]), np.array([1.0, 2.0, 3.0])
+    with pytest.raises(ValueError, match="must not decrease"):
+        list(resample_chunks([(timestamps, values)], interval=60))
+    with pytest.raises(ValueError, match="must not decrease"):
+        list(resample_chunks(chunked(timestamps, values, 2), interval=60))
@@ -0,0 +1,39 @@
+"""Headless unit conversion core.
+
+Importing this package only pulls in the standard library. The NumPy-based
+batch path is loaded on first use of ``batch_conversion`` or
+``mixed_conversion``.
+"""
+from .conversions import (
+    angle_conversion,
+    area_conversion,
+    categories,
+    convert_to_all,
+    currency_conversion,
+    data_conversion,
+    energy_conversion,
+    fuel_economy_conversion,
+    length_conversion,
+    power_conversion,
+    pressure_conversion,
+    speed_conversion,
+    temperature_conversion,
+    time_conversion,
+    volume_conversion,
+    weight_conversion,
+)
+from .formatting import NumberFormat, format_array, format_value, number_format
+from .humanize import humanize, humanize_array
+from .plugins import PluginError
+from .registry import Unit, UnitRegistry, registry
+from .result import ConversionResult
+from .transforms import Transform
+from .units import exchange_rates, unit_definitions
+
+
+def __getattr__(name):
+    # Keep NumPy out of the import path until a batch conversion is needed
+    if name in ("batch_conversion", "mixed_conversion"):
+        from . import batch
+        return getattr(batch, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
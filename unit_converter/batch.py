@@ -0,0 +1,90 @@
+"""Vectorized batch conversions over NumPy arrays."""
+import numpy as np
+
+from .formatting import format_value
+from .rates import get_exchange_rates
+from .registry import registry
+
+def batch_coefficients(category, from_unit, to_unit):
+    """Return (scale, offset, reciprocal) for converting from_unit to to_unit.
+
+    The result is value * scale + offset, or scale / value when reciprocal is True.
+    """
+    if category == "Currency":
+        # Exchange rates change at runtime, so read them from the rate cache
+        exchange_rates = get_exchange_rates()
+        return exchange_rates[to_unit] / exchange_rates[from_unit], 0.0, False
+    return registry.coefficients(category, from_unit, to_unit)
+
+def apply_coefficients(values, scale, offset, reciprocal, out=None):
+    """Apply resolved conversion coefficients to an array in one pass."""
+    if reciprocal:
+        # Zero values map to infinity, matching fuel_economy_conversion
+        with np.errstate(divide="ignore"):
+            return np.divide(scale, values, out=out)
+    result = np.multiply(values, scale, out=out)
+    if offset:
+        result += offset
+    return result
+
+def batch_conversion(values, category, from_unit, to_unit, with_formula=False, out=None):
+    """Convert a whole array of values between two units in one vectorized pass.
+
+    `values` can be a NumPy array, a list or any buffer of numbers. Returns a
+    float64 array (written into `out` when given), plus a formula string
+    describing the conversion when `with_formula` is True.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    scale, offset, reciprocal = batch_coefficients(category, from_unit, to_unit)
+    result = apply_coefficients(values, scale, offset, reciprocal, out=out)
+    
+    if not with_formula:
+        return result
+    
+    # Create formula text
+    if reciprocal:
+        formula = f"{to_unit} = {format_value(scale)} ÷ {from_unit}"
+    elif offset:
+        formula = f"{to_unit} = {from_unit} × {format_value(scale)} + {format_value(offset)}"
+    else:
+        formula = f"{to_unit} = {from_unit} × {format_value(scale)}"
+    
+    return result, formula
+
+def transform_table(category, to_unit):
+    """Return float arrays (a, b, c, d) of the transform from every unit of a category to to_unit."""
+    units = registry.units(category)
+    if category == "Currency":
+        exchange_rates = get_exchange_rates()
+        table = [(exchange_rates[to_unit] / exchange_rates[unit], 0.0, 0.0, 1.0) for unit in units]
+    else:
+        table = [registry.transform(category, unit, to_unit) for unit in units]
+    return tuple(np.array(column, dtype=np.float64) for column in zip(*table))
+
+def mixed_conversion(values, category, from_units, to_unit):
+    """Convert values whose source unit varies per element to a single to_unit.
+
+    `from_units` is either a sequence of unit names or an integer array of
+    positions in the category's unit list (as returned by registry.units()).
+    Every element is evaluated with its pair's closed-form transform,
+    (a * value + b) / (c * value + d), in one vectorized pass.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    from_units = np.asarray(from_units)
+    if from_units.dtype.kind in "US":
+        # Categories are small, so one comparison pass per unit beats sorting the names
+        positions = np.full(from_units.shape, -1, dtype=np.intp)
+        for position, unit in enumerate(registry.units(category)):
+            positions[from_units == unit] = position
+        if (positions < 0).any():
+            unknown = str(from_units[positions < 0][0])
+            raise KeyError(f"unknown {category} unit {unknown!r}")
+        from_units = positions
+    
+    a, b, c, d = (column[from_units] for column in transform_table(category, to_unit))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Skip zero terms so infinite values don't turn into 0 * inf = NaN
+        numerator = np.multiply(a, values, out=np.zeros_like(values), where=a != 0) + b
+        denominator = np.multiply(c, values, out=np.zeros_like(values), where=c != 0) + d
+        # Zero denominators (zero fuel economy values) map to infinity
+        return np.divide(numerator, denominator)
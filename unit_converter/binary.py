@@ -0,0 +1,173 @@
+"""Memory-mapped bulk conversion of raw float arrays and Arrow IPC files.
+
+Raw files are flat little-endian float32 or float64 arrays with no header.
+They are memory-mapped and converted chunk by chunk straight from the
+input pages into the output pages (or in place), so no parsing happens and
+no copy of the data is ever held in Python:
+
+    convert_raw("psi.f64", "Pressure", "PSI", "Pascal", output_path="pa.f64")
+    convert_raw("temps.f32", "Temperature", "Fahrenheit", "Celsius", dtype="float32")  # in place
+
+Arrow IPC files are memory-mapped too: converted columns are computed
+from zero-copy views of the input buffers, and the other columns are
+passed through without being copied into Python. Command line:
+
+    python -m unit_converter.binary psi.f64 pa.f64 --convert Pressure:PSI:Pascal
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from .batch import apply_coefficients, batch_coefficients
+from .cli import parse_column_spec
+
+# Element types by name and by raw-file extension
+RAW_DTYPES = {"float32": np.float32, "float64": np.float64}
+RAW_EXTENSIONS = {".f32": "float32", ".f64": "float64"}
+
+# Values converted per step (keeps each write-back to the page cache bounded)
+CHUNK_ELEMENTS = 1 << 22
+
+
+def raw_dtype(path, dtype=None):
+    """Return the NumPy dtype for a raw file, from the name given or the extension."""
+    if dtype is None:
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in RAW_EXTENSIONS:
+            raise ValueError(f"cannot infer the element type of {path!r}; pass dtype='float32' or 'float64'")
+        dtype = RAW_EXTENSIONS[extension]
+    return np.dtype(RAW_DTYPES[dtype]).newbyteorder("<")
+
+
+def convert_raw(input_path, category, from_unit, to_unit, output_path=None, dtype=None,
+                chunk_elements=CHUNK_ELEMENTS):
+    """Convert a raw float file through memory maps; returns the number of values.
+
+    Without output_path, or when it names the input file itself, the input
+    is rewritten in place. The output keeps the input's element type.
+    """
+    element = raw_dtype(input_path, dtype)
+    size = os.path.getsize(input_path)
+    if size % element.itemsize:
+        raise ValueError(f"{input_path!r} is not a whole number of {element.name} values")
+    length = size // element.itemsize
+    if output_path is not None and os.path.exists(output_path) and os.path.samefile(input_path, output_path):
+        # Truncating the output would wipe the input; convert on one mapping instead
+        output_path = None
+    if output_path is not None:
+        # Create the output at its final size up front so it can be mapped
+        with open(output_path, "wb") as f:
+            f.truncate(size)
+    if length == 0:
+        return 0
+
+    scale, offset, reciprocal = batch_coefficients(category, from_unit, to_unit)
+    source = np.memmap(input_path, dtype=element, mode="r" if output_path else "r+", shape=(length,))
+    target = source if output_path is None else np.memmap(output_path, dtype=element, mode="r+", shape=(length,))
+    try:
+        for start in range(0, length, chunk_elements):
+            stop = min(start + chunk_elements, length)
+            apply_coefficients(source[start:stop], scale, offset, reciprocal, out=target[start:stop])
+        target.flush()
+    finally:
+        del source, target
+    return length
+
+
+def convert_arrow(input_path, output_path, column_specs):
+    """Convert columns of an Arrow IPC file into a new IPC file; returns the row count.
+
+    column_specs are (column, category, from_unit, to_unit) tuples. Float
+    columns keep their type and other numeric columns become float64;
+    nulls stay null.
+    """
+    import pyarrow as pa
+
+    if os.path.exists(output_path) and os.path.samefile(input_path, output_path):
+        raise ValueError(f"{output_path!r} is the input file; Arrow files can't be converted in place")
+    rows = 0
+    with pa.memory_map(input_path) as source:
+        reader = pa.ipc.open_file(source)
+        schema = reader.schema
+        indexes = []
+        for column, category, from_unit, to_unit in column_specs:
+            index = schema.get_field_index(column)
+            if index < 0:
+                raise KeyError(f"column {column!r} not found in input")
+            indexes.append((index, batch_coefficients(category, from_unit, to_unit)))
+            if not pa.types.is_floating(schema.field(index).type):
+                # Converted integer columns become float64
+                schema = schema.set(index, schema.field(index).with_type(pa.float64()))
+        try:
+            with pa.ipc.new_file(output_path, schema) as writer:
+                for i in range(reader.num_record_batches):
+                    batch = reader.get_batch(i)
+                    columns = list(batch.columns)
+                    for index, (scale, offset, reciprocal) in indexes:
+                        columns[index] = convert_array(columns[index], scale, offset, reciprocal)
+                    writer.write_batch(pa.RecordBatch.from_arrays(columns, schema=schema))
+                    rows += batch.num_rows
+        except BaseException:
+            # Don't leave a partial output behind
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            raise
+    return rows
+
+
+def convert_array(array, scale, offset, reciprocal):
+    """Convert one Arrow float array, reading its values buffer without a copy."""
+    import pyarrow as pa
+
+    if not pa.types.is_floating(array.type):
+        array = array.cast(pa.float64())
+    # The values buffer is readable even where the validity bitmap marks nulls
+    values = np.frombuffer(array.buffers()[1], dtype=array.type.to_pandas_dtype(),
+                           count=len(array) + array.offset)[array.offset:]
+    result = apply_coefficients(values, scale, offset, reciprocal)
+    if array.null_count and array.offset:
+        return pa.array(result, mask=array.is_null().to_numpy(zero_copy_only=False))
+    # Reuse the validity bitmap as is and wrap the result without copying it
+    return pa.Array.from_buffers(array.type, len(array), [array.buffers()[0], pa.py_buffer(result)],
+                                 null_count=array.null_count)
+
+
+def parse_conversion(spec):
+    """Parse ``Category:From unit:To unit`` into a tuple."""
+    parts = spec.split(":")
+    if len(parts) != 3:
+        raise argparse.ArgumentTypeError(f"expected Category:From:To, got {spec!r}")
+    # Same validation as the column converter
+    _, category, from_unit, to_unit = parse_column_spec(":".join(["value"] + parts))
+    return category, from_unit, to_unit
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m unit_converter.binary",
+        description="Convert a raw float32/float64 file through memory maps.",
+    )
+    parser.add_argument("input", help="raw input file (.f32 or .f64)")
+    parser.add_argument("output", nargs="?", help="output file (default: convert the input in place)")
+    parser.add_argument("--convert", required=True, type=parse_conversion, metavar="CATEGORY:FROM:TO")
+    parser.add_argument("--dtype", choices=sorted(RAW_DTYPES), help="element type (default: from the extension)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        count = convert_raw(args.input, *args.convert, output_path=args.output, dtype=args.dtype)
+    except (KeyError, ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    gigabytes = os.path.getsize(args.input) / 1e9
+    print(f"Converted {count:,} values ({gigabytes:.2f} GB) in {elapsed:.2f} s "
+          f"({gigabytes / elapsed if elapsed > 0 else float('inf'):.2f} GB/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
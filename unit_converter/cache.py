@@ -0,0 +1,31 @@
+"""Bounded, process-wide memo of single conversions.
+
+Core modules are imported once per process, so this cache survives the
+Streamlit script reruns and is shared by every session.
+"""
+import functools
+
+from .conversions import categories
+from .formatting import DEFAULT_FORMAT
+
+CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def cached_conversion(category, from_unit, to_unit, value, number_format=DEFAULT_FORMAT):
+    """Return (result, formula) for a conversion, memoized on all its arguments."""
+    return _convert(category, from_unit, to_unit, value, number_format)
+
+
+def memoized_conversion(category, from_unit, to_unit, value, number_format=DEFAULT_FORMAT):
+    """Like cached_conversion, but bypasses the cache for live exchange rates."""
+    if category == "Currency":
+        return _convert(category, from_unit, to_unit, value, number_format)
+    return cached_conversion(category, from_unit, to_unit, value, number_format)
+
+
+def _convert(category, from_unit, to_unit, value, number_format):
+    conversion = categories[category]["conversion_function"](value, from_unit, to_unit)
+    if number_format == DEFAULT_FORMAT:
+        return conversion.value, conversion.formula
+    return conversion.value, conversion.formula_as(number_format)
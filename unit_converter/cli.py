@@ -0,0 +1,345 @@
+"""Command-line converter for whole columns of CSV, JSON Lines, Parquet and Arrow files.
+
+The input is streamed in bounded-size record batches, so files larger than
+RAM are converted with constant memory. Example:
+
+    python -m unit_converter readings.csv readings.parquet \\
+        --column pressure_psi:Pressure:PSI:Pascal \\
+        --column distance_mi:Length:Mile:Kilometer
+
+Converted columns stay float64 unless --digits, --notation or --locale is
+given, in which case they are written as formatted text. A target unit of
+``auto`` picks the most readable unit per value (see humanize) and adds a
+``<column>_unit`` column naming it:
+
+    python -m unit_converter files.csv sizes.csv --column size:Data:Byte:auto
+"""
+import argparse
+import os
+import sys
+import time
+
+from .conversions import categories
+from .formatting import LOCALES, MAX_DIGITS, NOTATIONS, format_array, number_format
+from .humanize import humanize_index
+
+# File formats by extension
+FORMATS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+}
+
+# Target unit that picks the most readable unit per value
+AUTO_UNIT = "auto"
+
+
+def parse_column_spec(spec):
+    """Parse ``column:Category:From unit:To unit`` into a tuple."""
+    parts = spec.split(":")
+    if len(parts) != 4:
+        raise argparse.ArgumentTypeError(
+            f"expected column:Category:From:To, got {spec!r}"
+        )
+    column, category, from_unit, to_unit = parts
+    if category not in categories:
+        raise argparse.ArgumentTypeError(f"unknown category {category!r}")
+    units = categories[category]["units"]
+    targets = [] if to_unit == AUTO_UNIT else [to_unit]
+    for unit in [from_unit] + targets:
+        if unit not in units:
+            raise argparse.ArgumentTypeError(f"unknown {category} unit {unit!r}")
+    if not targets:
+        try:
+            humanize_index(category, from_unit)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e))
+    return column, category, from_unit, to_unit
+
+
+def detect_format(path, override=None):
+    """Return the file format for a path, honouring an explicit override."""
+    if override:
+        return override
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"cannot infer the file format of {path!r}; use --input-format/--output-format")
+    return FORMATS[extension]
+
+
+def read_batches(path, file_format, block_size, chunk_rows):
+    """Yield pyarrow RecordBatches from the input file, one bounded chunk at a time."""
+    import pyarrow as pa
+
+    if file_format == "csv":
+        from pyarrow import csv
+        reader = csv.open_csv(path, read_options=csv.ReadOptions(block_size=block_size))
+        yield from reader
+    elif file_format == "jsonl":
+        from pyarrow import json
+        reader = json.open_json(path, read_options=json.ReadOptions(block_size=block_size))
+        yield from reader
+    elif file_format == "parquet":
+        from pyarrow import parquet
+        yield from parquet.ParquetFile(path).iter_batches(batch_size=chunk_rows)
+    elif file_format == "arrow":
+        with pa.memory_map(path) as source:
+            try:
+                reader = pa.ipc.open_file(source)
+                batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+            except pa.ArrowInvalid:
+                source.seek(0)
+                batches = pa.ipc.open_stream(source)
+            for batch in batches:
+                # Re-slice large IPC batches to keep chunks bounded
+                for offset in range(0, batch.num_rows, chunk_rows):
+                    yield batch.slice(offset, chunk_rows)
+    else:
+        raise ValueError(f"unsupported input format {file_format!r}")
+
+
+class BatchWriter:
+    """Incrementally write RecordBatches in one of the supported formats."""
+
+    def __init__(self, path, file_format):
+        self.path = path
+        self.file_format = file_format
+        self._writer = None
+        self._file = None
+
+    def write(self, batch):
+        if self._writer is None and self._file is None:
+            self._open(batch.schema)
+        if self.file_format == "jsonl":
+            self._file.write(json_lines(batch))
+        else:
+            self._writer.write(batch)
+
+    def _open(self, schema):
+        import pyarrow as pa
+
+        if self.file_format == "csv":
+            from pyarrow import csv
+            self._writer = csv.CSVWriter(self.path, schema)
+        elif self.file_format == "jsonl":
+            self._file = open(self.path, "wb")
+        elif self.file_format == "parquet":
+            from pyarrow import parquet
+            self._writer = parquet.ParquetWriter(self.path, schema)
+        elif self.file_format == "arrow":
+            self._writer = pa.ipc.new_file(self.path, schema)
+        else:
+            raise ValueError(f"unsupported output format {self.file_format!r}")
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        if self._file is not None:
+            self._file.close()
+
+
+def convert_batch(batch, column_specs, result_format=None):
+    """Return a copy of the batch with the requested columns converted.
+
+    With a result_format (a NumberFormat) the converted columns are
+    formatted into string columns.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    from .batch import batch_conversion
+    from .humanize import humanize_array
+
+    columns = list(batch.columns)
+    fields = list(batch.schema)
+    for column, category, from_unit, to_unit in column_specs:
+        index = batch.schema.get_field_index(column)
+        if index < 0:
+            raise KeyError(f"column {column!r} not found in input")
+        source = pc.cast(columns[index], pa.float64())
+        values = source.to_numpy(zero_copy_only=False)
+        nulls = source.is_null().to_numpy(zero_copy_only=False)
+        if to_unit == AUTO_UNIT:
+            result, unit_index, unit_names = humanize_array(values, category, from_unit)
+            # The ladder's names are the dictionary, so every batch shares it
+            columns.append(pa.DictionaryArray.from_arrays(pa.array(unit_index, mask=nulls), unit_names))
+            fields.append(pa.field(f"{column}_unit", columns[-1].type))
+        else:
+            result = batch_conversion(values, category, from_unit, to_unit)
+        if result_format is not None:
+            columns[index] = format_column(result, result_format, source)
+        else:
+            columns[index] = pa.array(result, mask=nulls)
+    schema = pa.schema(
+        field.with_type(columns[i].type) for i, field in enumerate(fields)
+    )
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def format_column(values, result_format, source):
+    """Format a float array into an Arrow string column, keeping the nulls of source."""
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    formatted = format_array(values, result_format)
+    # Build the string array's offsets and data straight from the fixed-width buffer
+    table = formatted.view(np.uint8).reshape(len(formatted), formatted.dtype.itemsize)
+    filled = table != 0
+    offsets = np.zeros(len(formatted) + 1, dtype=np.int32)
+    np.cumsum(filled.sum(axis=1), out=offsets[1:])
+    column = pa.StringArray.from_buffers(
+        len(formatted), pa.py_buffer(offsets), pa.py_buffer(table[filled]))
+    if source.null_count:
+        column = pc.if_else(source.is_null(), pa.scalar(None, pa.string()), column)
+    return column
+
+
+def json_lines(batch):
+    """Render a RecordBatch as JSON Lines (UTF-8 bytes), one object per row.
+
+    Each column is rendered to JSON text with Arrow kernels and the lines
+    are joined column-wise, so no Python object is built per row.
+    Non-finite floats are written as null, since JSON has no Infinity/NaN.
+    """
+    import json
+
+    import numpy as np
+    import pyarrow.compute as pc
+
+    if batch.num_columns == 0:
+        return b"{}\n" * batch.num_rows
+    parts = []
+    for i, (field, column) in enumerate(zip(batch.schema, batch.columns)):
+        parts.append(("{" if i == 0 else ", ") + json.dumps(field.name) + ": ")
+        parts.append(json_column(column))
+    parts.append("}\n")
+    lines = pc.binary_join_element_wise(*parts, "")
+    # The lines are contiguous in the string array's data buffer
+    offsets = np.frombuffer(lines.buffers()[1], dtype=np.int32, count=len(lines) + 1, offset=lines.offset * 4)
+    return memoryview(lines.buffers()[2])[offsets[0]:offsets[-1]]
+
+
+def json_column(array):
+    """Render an Arrow array as a string array of JSON values ("null" for nulls)."""
+    import json
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if pa.types.is_dictionary(array.type):
+        array = array.dictionary_decode()
+    if pa.types.is_floating(array.type):
+        array = pc.if_else(pc.is_finite(array), array, pa.scalar(None, array.type))
+        text = pc.cast(array, pa.string())
+        # Keep integral values recognisable as floats ("2" -> "2.0")
+        integral = pc.match_substring_regex(text, r"^-?\d+$")
+        text = pc.if_else(integral, pc.binary_join_element_wise(text, ".0", ""), text)
+    elif pa.types.is_integer(array.type) or pa.types.is_boolean(array.type):
+        text = pc.cast(array, pa.string())
+    elif pa.types.is_string(array.type) or pa.types.is_large_string(array.type):
+        text = json_strings(pc.cast(array, pa.string()))
+    else:
+        # Dates, timestamps and nested values, rendered as json.dumps(default=str) does
+        text = pa.array([json.dumps(value, default=str) for value in array.to_pylist()], pa.string())
+    return pc.fill_null(text, "null")
+
+
+def json_strings(array):
+    """Quote and escape a string array as JSON strings (nulls stay null)."""
+    import json
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if pc.any(pc.match_substring_regex(array, r'[\x00-\x1f"\\]')).as_py():
+        if pc.any(pc.match_substring_regex(array, r"[\x00-\x08\x0b\x0c\x0e-\x1f]")).as_py():
+            # Rare control characters: let json escape them
+            return pa.array([None if value is None else json.dumps(value, ensure_ascii=False)
+                             for value in array.to_pylist()], pa.string())
+        for old, new in (("\\", "\\\\"), ('"', '\\"'), ("\n", "\\n"), ("\r", "\\r"), ("\t", "\\t")):
+            array = pc.replace_substring(array, old, new)
+    return pc.binary_join_element_wise('"', array, '"', "")
+
+
+def convert_file(input_path, output_path, column_specs, input_format=None,
+                 output_format=None, block_size=16 << 20, chunk_rows=1 << 16,
+                 result_format=None):
+    """Stream input_path through the column conversions into output_path.
+
+    Returns the number of rows written.
+    """
+    reader = read_batches(input_path, detect_format(input_path, input_format), block_size, chunk_rows)
+    writer = BatchWriter(output_path, detect_format(output_path, output_format))
+    rows = 0
+    try:
+        for batch in reader:
+            writer.write(convert_batch(batch, column_specs, result_format))
+            rows += batch.num_rows
+    finally:
+        writer.close()
+    return rows
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m unit_converter",
+        description="Convert columns of a CSV, JSON Lines, Parquet or Arrow file between units.",
+    )
+    parser.add_argument("input", help="input file")
+    parser.add_argument("output", help="output file")
+    parser.add_argument(
+        "-c", "--column", dest="columns", action="append", required=True,
+        type=parse_column_spec, metavar="COLUMN:CATEGORY:FROM:TO",
+        help="column to convert, e.g. pressure_psi:Pressure:PSI:Pascal, or size:Data:Byte:auto (repeatable)",
+    )
+    choices = sorted(set(FORMATS.values()))
+    parser.add_argument("--input-format", choices=choices, help="override the input format")
+    parser.add_argument("--output-format", choices=choices, help="override the output format")
+    parser.add_argument(
+        "--block-size", type=int, default=16 << 20,
+        help="bytes read per chunk for CSV/JSON Lines input (default: 16 MiB)",
+    )
+    parser.add_argument(
+        "--chunk-rows", type=int, default=1 << 16,
+        help="rows per chunk for Parquet/Arrow input (default: 65536)",
+    )
+    parser.add_argument(
+        "--digits", type=int, choices=range(1, MAX_DIGITS + 1), metavar="N",
+        help="write converted values as text with N significant digits",
+    )
+    parser.add_argument("--notation", choices=NOTATIONS, help="notation for text output (default: general)")
+    parser.add_argument("--locale", choices=sorted(LOCALES), help="separators for text output (default: plain)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        parser.error("the file converter requires pyarrow (pip install pyarrow)")
+
+    result_format = None
+    if (args.digits, args.notation, args.locale) != (None, None, None):
+        result_format = number_format(args.digits or 6, args.notation or "general", args.locale or "plain")
+
+    start = time.perf_counter()
+    try:
+        rows = convert_file(
+            args.input, args.output, args.columns,
+            input_format=args.input_format, output_format=args.output_format,
+            block_size=args.block_size, chunk_rows=args.chunk_rows, result_format=result_format,
+        )
+    except (KeyError, ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    rate = rows / elapsed if elapsed > 0 else float("inf")
+    print(f"Converted {rows:,} rows in {elapsed:.2f} s ({rate:,.0f} rows/sec)", file=sys.stderr)
+    return 0
@@ -0,0 +1,262 @@
+"""Single-value conversion functions and the category table."""
+from . import metrics
+from .formatting import DEFAULT_FORMAT, format_value
+from .registry import plugin_categories, registry
+from .result import ConversionResult
+from .transforms import evaluate
+from .rates import get_exchange_rates
+
+# Define formula renderers (only called when a result's formula is accessed)
+def factor_formula(result, category, value, from_unit, to_unit, number_format=DEFAULT_FORMAT):
+    # Create formula text
+    formula = f"{value} {from_unit} = {format_value(result, number_format)} {to_unit}"
+    if from_unit != to_unit:
+        from_factor = format_value(registry.unit(category, from_unit).factor, number_format)
+        to_factor = format_value(registry.unit(category, to_unit).factor, number_format)
+        formula += f" (Conversion: {value} × {from_factor} ÷ {to_factor})"
+    
+    return formula
+
+def temperature_formula(result, value, from_unit, to_unit, number_format=DEFAULT_FORMAT):
+    shown = format_value(result, number_format)
+    if from_unit == "Celsius" and to_unit == "Fahrenheit":
+        return f"{value}°C = ({value} × 9/5) + 32 = {shown}°F"
+    elif from_unit == "Celsius" and to_unit == "Kelvin":
+        return f"{value}°C = {value} + 273.15 = {shown}K"
+    elif from_unit == "Fahrenheit" and to_unit == "Celsius":
+        return f"{value}°F = ({value} - 32) × 5/9 = {shown}°C"
+    elif from_unit == "Fahrenheit" and to_unit == "Kelvin":
+        return f"{value}°F = ({value} - 32) × 5/9 + 273.15 = {shown}K"
+    elif from_unit == "Kelvin" and to_unit == "Celsius":
+        return f"{value}K = {value} - 273.15 = {shown}°C"
+    elif from_unit == "Kelvin" and to_unit == "Fahrenheit":
+        return f"{value}K = ({value} - 273.15) × 9/5 + 32 = {shown}°F"
+    elif from_unit == to_unit:
+        return f"{value} {from_unit} = {result} {to_unit}"
+    else:  # Rankine, Réaumur and other scales
+        return f"{value} {from_unit} = {shown} {to_unit} (Conversion through kelvin)"
+
+def angle_formula(result, value, from_unit, to_unit, number_format=DEFAULT_FORMAT):
+    formula = f"{value} {from_unit} = {format_value(result, number_format)} {to_unit}"
+    if from_unit != to_unit:
+        formula += " (Conversion through radians)"
+    
+    return formula
+
+def plain_formula(result, value, from_unit, to_unit, number_format=DEFAULT_FORMAT):
+    return f"{value} {from_unit} = {format_value(result, number_format)} {to_unit}"
+
+def currency_formula(result, exchange_rates, value, from_unit, to_unit, number_format=DEFAULT_FORMAT):
+    formula = f"{value} {from_unit} = {format_value(result, number_format)} {to_unit}"
+    if from_unit != to_unit:
+        formula += f" (Via USD: {value}/{exchange_rates[from_unit]} × {exchange_rates[to_unit]})"
+    
+    return formula
+
+# Define conversion functions
+def length_conversion(value, from_unit, to_unit):
+    # Convert through meters using the precomputed factor matrix
+    result = value * registry.factor("Length", from_unit, to_unit)
+    return ConversionResult(result, factor_formula, "Length", value, from_unit, to_unit)
+
+def weight_conversion(value, from_unit, to_unit):
+    # Convert through grams using the precomputed factor matrix
+    result = value * registry.factor("Weight/Mass", from_unit, to_unit)
+    return ConversionResult(result, factor_formula, "Weight/Mass", value, from_unit, to_unit)
+
+def temperature_conversion(value, from_unit, to_unit):
+    # Apply the pair's closed-form transform (composed through kelvin)
+    a, b, c, d = registry.transform("Temperature", from_unit, to_unit)
+    result = (a * value + b) / d
+    
+    return ConversionResult(result, temperature_formula, value, from_unit, to_unit)
+
+def area_conversion(value, from_unit, to_unit):
+    # Convert through square meters using the precomputed factor matrix
+    result = value * registry.factor("Area", from_unit, to_unit)
+    return ConversionResult(result, factor_formula, "Area", value, from_unit, to_unit)
+
+def volume_conversion(value, from_unit, to_unit):
+    # Convert through milliliters using the precomputed factor matrix
+    result = value * registry.factor("Volume", from_unit, to_unit)
+    return ConversionResult(result, factor_formula, "Volume", value, from_unit, to_unit)
+
+def time_conversion(value, from_unit, to_unit):
+    # Convert through seconds using the precomputed factor matrix
+    result = value * registry.factor("Time", from_unit, to_unit)
+    return ConversionResult(result, factor_formula, "Time", value, from_unit, to_unit)
+
+def speed_conversion(value, from_unit, to_unit):
+    # Convert through meters per second using the precomputed factor matrix
+    result = value * registry.factor("Speed", from_unit, to_unit)
+    return ConversionResult(result, factor_formula, "Speed", value, from_unit, to_unit)
+
+def pressure_conversion(value, from_unit, to_unit):
+    # Convert through pascals using the precomputed factor matrix
+    result = value * registry.factor("Pressure", from_unit, to_unit)
+    return ConversionResult(result, factor_formula, "Pressure", value, from_unit, to_unit)
+
+def energy_conversion(value, from_unit, to_unit):
+    # Convert through joules using the precomputed factor matrix
+    result = value * registry.factor("Energy", from_unit, to_unit)
+    return ConversionResult(result, factor_formula, "Energy", value, from_unit, to_unit)
+
+def power_conversion(value, from_unit, to_unit):
+    # Convert through watts using the precomputed factor matrix
+    result = value * registry.factor("Power", from_unit, to_unit)
+    return ConversionResult(result, factor_formula, "Power", value, from_unit, to_unit)
+
+def data_conversion(value, from_unit, to_unit):
+    # Convert through bytes using the precomputed factor matrix
+    result = value * registry.factor("Data", from_unit, to_unit)
+    return ConversionResult(result, factor_formula, "Data", value, from_unit, to_unit)
+
+def angle_conversion(value, from_unit, to_unit):
+    # Convert through radians using the precomputed factor matrix
+    result = value * registry.factor("Angle", from_unit, to_unit)
+    return ConversionResult(result, angle_formula, value, from_unit, to_unit)
+
+def fuel_economy_conversion(value, from_unit, to_unit):
+    # Apply the pair's closed-form transform (composed through kilometers per liter)
+    result = evaluate(registry.transform("Fuel Economy", from_unit, to_unit), value)
+    
+    return ConversionResult(result, plain_formula, value, from_unit, to_unit)
+
+def currency_conversion(value, from_unit, to_unit):
+    # Exchange rates come from the rate cache, which refreshes in the background
+    exchange_rates = get_exchange_rates()
+    
+    # Convert to USD first, then to target currency
+    usd_amount = value / exchange_rates[from_unit]
+    result = usd_amount * exchange_rates[to_unit]
+    
+    return ConversionResult(result, currency_formula, exchange_rates, value, from_unit, to_unit)
+
+def plugin_conversion(category):
+    """Return the conversion function of a category added by a plugin file."""
+    if registry.linear(category):
+        def conversion(value, from_unit, to_unit):
+            # Convert through the base unit using the precomputed factor matrix
+            result = value * registry.factor(category, from_unit, to_unit)
+            return ConversionResult(result, factor_formula, category, value, from_unit, to_unit)
+    else:
+        def conversion(value, from_unit, to_unit):
+            # Apply the pair's closed-form transform
+            result = evaluate(registry.transform(category, from_unit, to_unit), value)
+            return ConversionResult(result, plain_formula, value, from_unit, to_unit)
+    return conversion
+
+def convert_to_all(value, category, from_unit):
+    """Convert a value to every unit of its category in one pass.
+
+    Returns a dict of unit -> value in display order, computed from the
+    from_unit row of the precomputed conversion matrix.
+    """
+    units = registry.units(category)
+    if category == "Currency":
+        exchange_rates = get_exchange_rates()
+        usd_amount = value / exchange_rates[from_unit]
+        return {unit: usd_amount * exchange_rates[unit] for unit in units}
+    if registry.linear(category):
+        return dict(zip(units, [value * scale for scale in registry.row(category, from_unit)]))
+    return dict(zip(units, [evaluate(transform, value) for transform in registry.transforms_from(category, from_unit)]))
+
+# Define conversion categories and their units
+categories = {
+    "Length": {
+        "units": registry.units("Length"),
+        "conversion_function": length_conversion,
+        "icon": "📏",
+        "description": "Length is a measure of distance. In this converter, all length units are converted through meters as the base unit."
+    },
+    "Weight/Mass": {
+        "units": registry.units("Weight/Mass"),
+        "conversion_function": weight_conversion,
+        "icon": "⚖️",
+        "description": "Weight (or mass) is a measure of how heavy an object is. All weight units are converted through grams as the base unit."
+    },
+    "Temperature": {
+        "units": registry.units("Temperature"),
+        "conversion_function": temperature_conversion,
+        "icon": "🌡️",
+        "description": "Temperature is a measure of how hot or cold something is. Temperature conversions use specific formulas rather than simple multiplication."
+    },
+    "Area": {
+        "units": registry.units("Area"),
+        "conversion_function": area_conversion,
+        "icon": "📐",
+        "description": "Area is a measure of the size of a surface. All area units are converted through square meters as the base unit."
+    },
+    "Volume": {
+        "units": registry.units("Volume"),
+        "conversion_function": volume_conversion,
+        "icon": "🧪",
+        "description": "Volume is a measure of the three-dimensional space occupied by a substance. All volume units are converted through milliliters as the base unit."
+    },
+    "Time": {
+        "units": registry.units("Time"),
+        "conversion_function": time_conversion,
+        "icon": "⏱️",
+        "description": "Time is a measure of duration. All time units are converted through seconds as the base unit."
+    },
+    "Speed": {
+        "units": registry.units("Speed"),
+        "conversion_function": speed_conversion,
+        "icon": "🚀",
+        "description": "Speed is a measure of how quickly something moves. All speed units are converted through meters per second as the base unit."
+    },
+    "Pressure": {
+        "units": registry.units("Pressure"),
+        "conversion_function": pressure_conversion,
+        "icon": "🔄",
+        "description": "Pressure is force per unit area. All pressure units are converted through pascals as the base unit."
+    },
+    "Energy": {
+        "units": registry.units("Energy"),
+        "conversion_function": energy_conversion,
+        "icon": "⚡",
+        "description": "Energy is the capacity to do work. All energy units are converted through joules as the base unit."
+    },
+    "Power": {
+        "units": registry.units("Power"),
+        "conversion_function": power_conversion,
+        "icon": "💪",
+        "description": "Power is the rate at which energy is transferred. All power units are converted through watts as the base unit."
+    },
+    "Data": {
+        "units": registry.units("Data"),
+        "conversion_function": data_conversion,
+        "icon": "💾",
+        "description": "Data storage units measure digital information. All data units are converted through bytes as the base unit."
+    },
+    "Angle": {
+        "units": registry.units("Angle"),
+        "conversion_function": angle_conversion,
+        "icon": "📐",
+        "description": "Angle measures rotation or orientation. All angle units are converted through radians as the base unit."
+    },
+    "Fuel Economy": {
+        "units": registry.units("Fuel Economy"),
+        "conversion_function": fuel_economy_conversion,
+        "icon": "⛽",
+        "description": "Fuel economy measures the efficiency of fuel consumption. Units are converted through kilometers per liter as an intermediate step."
+    },
+    "Currency": {
+        "units": registry.units("Currency"),
+        "conversion_function": currency_conversion,
+        "icon": "💰",
+        "description": "Currency conversion is based on exchange rates. Note: These rates are approximations and may not reflect current market values."
+    }
+}
+
+# Add the categories defined in plugin files (units added to built-in categories are already in registry.units())
+for category, info in plugin_categories.items():
+    categories[category] = {
+        "units": registry.units(category),
+        "conversion_function": plugin_conversion(category),
+        "icon": info["icon"],
+        "description": info["description"],
+    }
+
+# Time the conversion functions and formula renderers when UNIT_CONVERTER_METRICS is set
+metrics.instrument_categories(categories, globals())
@@ -0,0 +1,181 @@
+"""Dimensional analysis for compound and derived units.
+
+Each unit is represented as a factor to SI plus an exponent vector over the
+base dimensions (length, mass, time, temperature, data, angle). Compound
+expressions such as ``kg/m³``, ``N·m``, ``GB/s`` or ``Kilogram/Cubic Meter``
+are built by multiplying those, reusing the factors from the unit registry
+and the aliases from the quantity parser.
+
+    dimensional_conversion(1, "kg/m³", "g/L")       # 1.0
+    dimensional_conversion(1, "N·m", "Joule")       # 1.0
+    dimensional_conversion(1, "kg*m**2", "g·cm²")   # 10000000.0
+
+Powers are written ``m^2``, ``m**2`` or ``m²``. Resolved (from, to) pairs
+are cached as conversion plans, so repeating a conversion costs one dict
+lookup and one multiply. Plain units of the same category (including
+Temperature and Fuel Economy) use the category coefficients, so existing
+conversions give the same results. Currency pairs are planned too, but
+their rate is read from the exchange rates on every call.
+"""
+import functools
+import re
+from collections import namedtuple
+
+from .conversions import categories
+from .parser import alias_index
+from .rates import get_exchange_rates
+from .registry import registry
+
+DIMENSIONS = ("L", "M", "T", "Θ", "D", "A")
+
+Dimensioned = namedtuple("Dimensioned", ["factor", "dimension"])
+ConversionPlan = namedtuple("ConversionPlan", ["scale", "offset", "reciprocal"])
+CurrencyPair = namedtuple("CurrencyPair", ["from_unit", "to_unit"])
+
+
+def dimension(**exponents):
+    """Build an exponent vector, e.g. dimension(L=1, T=-1) for speed."""
+    return tuple(exponents.get(symbol, 0) for symbol in DIMENSIONS)
+
+
+# Dimension of each category and the factor from its base unit to SI
+category_dimensions = {
+    "Length": (dimension(L=1), 1.0),
+    "Weight/Mass": (dimension(M=1), 0.001),  # grams -> kilograms
+    "Area": (dimension(L=2), 1.0),
+    "Volume": (dimension(L=3), 1e-6),  # milliliters -> cubic meters
+    "Time": (dimension(T=1), 1.0),
+    "Speed": (dimension(L=1, T=-1), 1.0),
+    "Pressure": (dimension(M=1, L=-1, T=-2), 1.0),
+    "Energy": (dimension(M=1, L=2, T=-2), 1.0),
+    "Power": (dimension(M=1, L=2, T=-3), 1.0),
+    "Data": (dimension(D=1), 1.0),  # bytes
+    "Angle": (dimension(A=1), 1.0),
+    "Fuel Economy": (dimension(L=-2), 1e6),  # km/L -> m/m³
+}
+
+# Derived units that have no category of their own
+derived_units = {
+    "Newton": Dimensioned(1.0, dimension(M=1, L=1, T=-2)),
+    "N": Dimensioned(1.0, dimension(M=1, L=1, T=-2)),
+    "Hertz": Dimensioned(1.0, dimension(T=-1)),
+    "Hz": Dimensioned(1.0, dimension(T=-1)),
+}
+
+SUPERSCRIPTS = {"²": 2, "³": 3}
+# A lone "*" multiplies; "**" is left to POWER
+OPERATORS = re.compile(r"\s*((?<!\*)\*(?!\*)|[·⋅/])\s*")
+POWER = re.compile(r"(.+?)(?:\^|\*\*)?(-?\d+|[²³])")
+
+
+def format_dimension(vector):
+    """Render an exponent vector such as (1, 0, -1, 0, 0, 0) as "L·T^-1"."""
+    parts = [symbol if exp == 1 else f"{symbol}^{exp}" for symbol, exp in zip(DIMENSIONS, vector) if exp]
+    return "·".join(parts) or "dimensionless"
+
+
+def lookup_unit(name):
+    """Return (category, unit) for a display name or alias, or None."""
+    if name in alias_index:
+        unit, category = alias_index[name]
+        return category, unit
+    for category, data in categories.items():
+        if name in data["units"]:
+            return category, name
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_atom(name):
+    """Return the Dimensioned value of a single (non-compound) unit."""
+    if name in derived_units:
+        return derived_units[name]
+    found = lookup_unit(name)
+    if found is None:
+        raise ValueError(f"unknown unit {name!r}")
+    category, unit_name = found
+    if category not in category_dimensions and category != "Temperature":
+        raise ValueError(f"{unit_name!r} ({category}) cannot be used in compound units")
+    unit = registry.unit(category, unit_name)
+    if unit.reciprocal or unit.offset:
+        raise ValueError(f"{unit_name!r} is not a linear unit and cannot be used in compound units")
+    if category == "Temperature":
+        # Absolute scales (Kelvin, Rankine) are plain multiples of kelvin
+        return Dimensioned(unit.factor, dimension(Θ=1))
+    vector, si_factor = category_dimensions[category]
+    return Dimensioned(unit.factor * si_factor, vector)
+
+
+@functools.lru_cache(maxsize=None)
+def resolve(expression):
+    """Parse a unit expression like "kg·m/s^2" into its Dimensioned value."""
+    expression = expression.strip()
+    if lookup_unit(expression) or expression in derived_units:
+        return resolve_atom(expression)
+
+    factor = 1.0
+    vector = [0] * len(DIMENSIONS)
+    sign = 1
+    # Everything after the first "/" is in the denominator
+    for token in OPERATORS.split(expression):
+        if token in ("*", "·", "⋅"):
+            continue
+        if token == "/":
+            sign = -1
+            continue
+        if token == "1":
+            continue
+        if not token:
+            raise ValueError(f"malformed unit expression {expression!r}")
+        power = 1
+        if not (lookup_unit(token) or token in derived_units):
+            match = POWER.fullmatch(token)
+            if match:
+                token, exponent = match.groups()
+                power = SUPERSCRIPTS.get(exponent) or int(exponent)
+        atom = resolve_atom(token)
+        factor *= atom.factor ** (sign * power)
+        for i, exp in enumerate(atom.dimension):
+            vector[i] += sign * power * exp
+    return Dimensioned(factor, tuple(vector))
+
+
+@functools.lru_cache(maxsize=4096)
+def static_plan(from_expr, to_expr):
+    """Resolve and cache the ConversionPlan for from_expr to to_expr.
+
+    Currency pairs resolve to a CurrencyPair, since their rate changes.
+    """
+    source = lookup_unit(from_expr)
+    target = lookup_unit(to_expr)
+    if source and target and source[0] == target[0] == "Currency":
+        return CurrencyPair(source[1], target[1])
+    if source and target and source[0] == target[0] and source[0] in registry.categories():
+        # Same category: reuse its coefficients (handles affine and reciprocal units)
+        return ConversionPlan(*registry.coefficients(source[0], source[1], target[1]))
+
+    from_unit = resolve(from_expr)
+    to_unit = resolve(to_expr)
+    if from_unit.dimension != to_unit.dimension:
+        raise ValueError(
+            f"cannot convert {from_expr!r} ({format_dimension(from_unit.dimension)}) "
+            f"to {to_expr!r} ({format_dimension(to_unit.dimension)})"
+        )
+    return ConversionPlan(from_unit.factor / to_unit.factor, 0.0, False)
+
+
+def conversion_plan(from_expr, to_expr):
+    """Return the coefficients for converting from_expr to to_expr."""
+    plan = static_plan(from_expr, to_expr)
+    if isinstance(plan, CurrencyPair):
+        rates = get_exchange_rates()
+        return ConversionPlan(rates[plan.to_unit] / rates[plan.from_unit], 0.0, False)
+    return plan
+
+
+def dimensional_conversion(value, from_expr, to_expr):
+    """Convert a value between two (possibly compound) unit expressions."""
+    scale, offset, reciprocal = conversion_plan(from_expr, to_expr)
+    if reciprocal:
+        return scale / value if value != 0 else float('inf')
+    return value * scale + offset
@@ -0,0 +1,270 @@
+"""Exact conversions with rational factors taken from the unit definitions.
+
+The float tables in ``units.py`` hold rounded factors (1 mile = 1609.34 m).
+This module keeps the exact definitions (1 mile = 1609.344 m, 1 lb =
+453.59237 g, ...) as ``Fraction`` values, so results don't drift when large
+datasets are round-tripped. Pick the mode per call:
+
+    convert(1, "Length", "Mile", "Meter")                      # float (default)
+    convert(1, "Length", "Mile", "Meter", precision="exact")   # Fraction(201168, 125)
+    convert(1, "Length", "Mile", "Meter", precision="decimal") # Decimal('1609.344')
+
+The float path simply calls the existing conversion function, so its speed
+is unchanged. Units added by plugin files are exact as written in the file.
+"""
+import functools
+from decimal import Decimal, localcontext
+from fractions import Fraction
+
+from .conversions import categories
+from .rates import get_exchange_rates
+from .registry import registry
+
+PRECISIONS = ("float", "exact", "decimal")
+
+# Decimal digits used for results in "decimal" mode
+DECIMAL_DIGITS = 34
+
+# π to 50 digits; angles through radians are the only irrational factors
+PI = Fraction("3.14159265358979323846264338327950288419716939937511")
+
+# Exact building blocks from the international definitions
+FOOT = Fraction("0.3048")
+POUND = Fraction("0.45359237")  # kilograms
+GRAVITY = Fraction("9.80665")
+FOOT_POUND = FOOT * POUND * GRAVITY
+BTU = Fraction("1055.05585262")  # International Table BTU in joules
+GALLON_US = Fraction("3785.411784")  # milliliters
+MILE_KM = Fraction("1.609344")
+
+# Define exact unit definitions, mirroring unit_definitions in units.py
+exact_definitions = {
+    # Conversion factors to meters
+    "Length": {
+        "Meter": Fraction(1),
+        "Kilometer": Fraction(1000),
+        "Centimeter": Fraction(1, 100),
+        "Millimeter": Fraction(1, 1000),
+        "Mile": MILE_KM * 1000,
+        "Yard": FOOT * 3,
+        "Foot": FOOT,
+        "Inch": FOOT / 12,
+        "Nautical Mile": Fraction(1852)
+    },
+    # Conversion factors to grams
+    "Weight/Mass": {
+        "Kilogram": Fraction(1000),
+        "Gram": Fraction(1),
+        "Milligram": Fraction(1, 1000),
+        "Pound": POUND * 1000,
+        "Ounce": POUND * 1000 / 16,
+        "Ton (Metric)": Fraction(1000000),
+        "Ton (US)": POUND * 1000 * 2000,
+        "Stone": POUND * 1000 * 14
+    },
+    # Temperature scale and offset to kelvin (kelvin = value * scale + offset)
+    "Temperature": {
+        "Celsius": (Fraction(1), Fraction("273.15")),
+        "Fahrenheit": (Fraction(5, 9), Fraction("273.15") - Fraction(32 * 5, 9)),
+        "Kelvin": (Fraction(1), Fraction(0)),
+        "Rankine": (Fraction(5, 9), Fraction(0)),
+        "Réaumur": (Fraction(5, 4), Fraction("273.15"))
+    },
+    # Conversion factors to square meters
+    "Area": {
+        "Square Meter": Fraction(1),
+        "Square Kilometer": Fraction(1000000),
+        "Square Mile": (MILE_KM * 1000) ** 2,
+        "Hectare": Fraction(10000),
+        "Acre": (MILE_KM * 1000) ** 2 / 640,
+        "Square Foot": FOOT ** 2,
+        "Square Inch": (FOOT / 12) ** 2,
+        "Square Yard": (FOOT * 3) ** 2
+    },
+    # Conversion factors to milliliters
+    "Volume": {
+        "Cubic Meter": Fraction(1000000),
+        "Liter": Fraction(1000),
+        "Milliliter": Fraction(1),
+        "Gallon (US)": GALLON_US,
+        "Gallon (UK)": Fraction("4546.09"),
+        "Quart (US)": GALLON_US / 4,
+        "Pint (US)": GALLON_US / 8,
+        "Cup": GALLON_US / 16,
+        "Fluid Ounce (US)": GALLON_US / 128,
+        "Tablespoon": GALLON_US / 256,
+        "Teaspoon": GALLON_US / 768,
+        "Cubic Inch": (FOOT * 100 / 12) ** 3,
+        "Cubic Foot": (FOOT * 100) ** 3
+    },
+    # Conversion factors to seconds
+    "Time": {
+        "Second": Fraction(1),
+        "Minute": Fraction(60),
+        "Hour": Fraction(3600),
+        "Day": Fraction(86400),
+        "Week": Fraction(604800),
+        "Month (30 days)": Fraction(2592000),
+        "Year (365 days)": Fraction(31536000),
+        "Millisecond": Fraction(1, 10**3),
+        "Microsecond": Fraction(1, 10**6),
+        "Nanosecond": Fraction(1, 10**9)
+    },
+    # Conversion factors to meters per second
+    "Speed": {
+        "Meter/Second": Fraction(1),
+        "Kilometer/Hour": Fraction(1000, 3600),
+        "Mile/Hour": MILE_KM * 1000 / 3600,
+        "Foot/Second": FOOT,
+        "Knot": Fraction(1852, 3600),
+        "Mach (at sea level)": Fraction("340.29")
+    },
+    # Conversion factors to pascals
+    "Pressure": {
+        "Pascal": Fraction(1),
+        "Kilopascal": Fraction(1000),
+        "Bar": Fraction(100000),
+        "PSI": POUND * GRAVITY / (FOOT / 12) ** 2,
+        "Atmosphere": Fraction(101325),
+        "Torr": Fraction(101325, 760),
+        "Millimeter of Mercury": Fraction("133.322387415")
+    },
+    # Conversion factors to joules
+    "Energy": {
+        "Joule": Fraction(1),
+        "Kilojoule": Fraction(1000),
+        "Calorie": Fraction("4.184"),
+        "Kilocalorie": Fraction(4184),
+        "Watt-hour": Fraction(3600),
+        "Kilowatt-hour": Fraction(3600000),
+        "Electronvolt": Fraction("1.602176634e-19"),
+        "British Thermal Unit": BTU,
+        "Foot-pound": FOOT_POUND
+    },
+    # Conversion factors to watts
+    "Power": {
+        "Watt": Fraction(1),
+        "Kilowatt": Fraction(1000),
+        "Megawatt": Fraction(1000000),
+        "Horsepower": FOOT_POUND * 550,
+        "Foot-pound/minute": FOOT_POUND / 60,
+        "BTU/hour": BTU / 3600
+    },
+    # Conversion factors to bytes (using binary prefixes)
+    "Data": {
+        "Bit": Fraction(1, 8),
+        "Byte": Fraction(1),
+        "Kilobyte (KB)": Fraction(1024),
+        "Megabyte (MB)": Fraction(1024**2),
+        "Gigabyte (GB)": Fraction(1024**3),
+        "Terabyte (TB)": Fraction(1024**4),
+        "Petabyte (PB)": Fraction(1024**5),
+        "Kibibyte (KiB)": Fraction(1024),
+        "Mebibyte (MiB)": Fraction(1024**2),
+        "Gibibyte (GiB)": Fraction(1024**3),
+        "Tebibyte (TiB)": Fraction(1024**4),
+        "Pebibyte (PiB)": Fraction(1024**5)
+    },
+    # Conversion factors to radians
+    "Angle": {
+        "Degree": PI / 180,
+        "Radian": Fraction(1),
+        "Gradian": PI / 200,
+        "Minute of Arc": PI / (180 * 60),
+        "Second of Arc": PI / (180 * 3600),
+        "Turn/Revolution": PI * 2
+    },
+    # Conversion factors to kilometers per liter
+    # ("Liters per 100 Kilometers" is the reciprocal: kpl = 100 / value)
+    "Fuel Economy": {
+        "Miles per Gallon (US)": MILE_KM / (GALLON_US / 1000),
+        "Miles per Gallon (UK)": MILE_KM / Fraction("4.54609"),
+        "Kilometers per Liter": Fraction(1),
+        "Liters per 100 Kilometers": (Fraction(100), Fraction(0), True)
+    }
+}
+
+
+def exact_spec(spec):
+    """Normalize an exact_definitions entry to (factor, offset, reciprocal)."""
+    if not isinstance(spec, tuple):
+        return spec, Fraction(0), False
+    if len(spec) == 2:
+        return spec[0], spec[1], False
+    return spec
+
+
+def to_fraction(value):
+    """Convert a number to a Fraction, reading floats by their decimal repr."""
+    if isinstance(value, float):
+        return Fraction(repr(value))
+    return Fraction(value)
+
+
+def exact_unit(category, name):
+    """Return the exact (factor, offset, reciprocal) of a unit.
+
+    Plugin units have no exact_definitions entry; the registry keeps their
+    literal factor and offset as floats, which are read back by their repr.
+    """
+    table = exact_definitions.get(category, {})
+    if name in table:
+        return exact_spec(table[name])
+    try:
+        unit = registry.unit(category, name)
+    except KeyError:
+        raise KeyError(f"unknown {category} unit {name!r}")
+    return to_fraction(unit.factor), to_fraction(unit.offset), unit.reciprocal
+
+
+@functools.lru_cache(maxsize=None)
+def exact_coefficients(category, from_unit, to_unit):
+    """Return exact (scale, offset, reciprocal) for converting from_unit to to_unit."""
+    from_factor, from_offset, from_reciprocal = exact_unit(category, from_unit)
+    to_factor, to_offset, to_reciprocal = exact_unit(category, to_unit)
+    if to_reciprocal and not from_reciprocal:
+        return to_factor / from_factor, Fraction(0), True
+    return (
+        from_factor / to_factor,
+        (from_offset - to_offset) / to_factor,
+        from_reciprocal != to_reciprocal,
+    )
+
+
+def exact_conversion(value, category, from_unit, to_unit):
+    """Convert a value exactly and return a Fraction.
+
+    Raises ZeroDivisionError for a zero fuel economy value converted to or
+    from "Liters per 100 Kilometers" (the float path returns infinity).
+    """
+    value = to_fraction(value)
+    if category == "Currency":
+        # Live rates are decimal quotes; read them exactly from their repr
+        exchange_rates = get_exchange_rates()
+        return value / to_fraction(exchange_rates[from_unit]) * to_fraction(exchange_rates[to_unit])
+
+    scale, offset, reciprocal = exact_coefficients(category, from_unit, to_unit)
+    if reciprocal:
+        return scale / value
+    return value * scale + offset
+
+
+def convert(value, category, from_unit, to_unit, precision="float"):
+    """Convert a value in the chosen precision mode.
+
+    "float" returns a float from the regular conversion functions, "exact"
+    a Fraction and "decimal" a Decimal rounded to DECIMAL_DIGITS digits.
+    """
+    if precision == "float":
+        return categories[category]["conversion_function"](value, from_unit, to_unit).value
+    if precision == "exact":
+        return exact_conversion(value, category, from_unit, to_unit)
+    if precision == "decimal":
+        try:
+            result = exact_conversion(value, category, from_unit, to_unit)
+        except ZeroDivisionError:
+            return Decimal("Infinity")
+        with localcontext() as context:
+            context.prec = DECIMAL_DIGITS
+            return Decimal(result.numerator) / Decimal(result.denominator)
+    raise ValueError(f"precision must be one of {PRECISIONS}, got {precision!r}")
@@ -0,0 +1,310 @@
+"""Number formatting for conversion results.
+
+A NumberFormat sets the significant figures, the notation and the decimal
+and grouping separators:
+
+    format_value(1234567.891)                                  # '1.23457e+06' (same as :.6g)
+    format_value(1234567.891, number_format(9, locale="de"))   # '1.234.567,89'
+    format_value(0.000123456, number_format(4, "engineering")) # '123.5e-06'
+    format_value(1.602e-19, number_format(4, "si"))            # '160.2z'
+
+Notations:
+
+* ``general`` behaves like ``%g``: fixed or scientific depending on the
+  exponent, trailing zeros removed;
+* ``scientific`` always shows one digit before the point and every
+  significant figure;
+* ``engineering`` uses exponents that are multiples of three;
+* ``si`` is engineering with an SI prefix in place of the exponent
+  (quecto to quetta; beyond that it falls back to the exponent).
+
+format_array() is the bulk path for exports: it formats a whole NumPy
+array into a preallocated fixed-width byte buffer (UTF-8) with array
+arithmetic instead of one Python format call per value, and
+format_lines() packs the result into newline-separated bytes.
+"""
+import math
+from collections import namedtuple
+
+NumberFormat = namedtuple("NumberFormat", ["digits", "notation", "decimal", "group"])
+
+DEFAULT_FORMAT = NumberFormat(6, "general", ".", "")
+
+NOTATIONS = ("general", "scientific", "engineering", "si")
+
+# Decimal and grouping separators by locale name
+LOCALES = {
+    "plain": (".", ""),
+    "en": (".", ","),
+    "de": (",", "."),
+    "fr": (",", "\u202f"),
+    "ch": (".", "’"),
+}
+
+# SI prefixes by power of ten
+SI_PREFIXES = {
+    -30: "q", -27: "r", -24: "y", -21: "z", -18: "a", -15: "f", -12: "p", -9: "n", -6: "µ", -3: "m",
+    0: "", 3: "k", 6: "M", 9: "G", 12: "T", 15: "P", 18: "E", 21: "Z", 24: "Y", 27: "R", 30: "Q",
+}
+
+# Most significant figures a float64 carries (and the bulk path's int64 mantissa holds)
+MAX_DIGITS = 17
+
+# Rows formatted per step by format_array (bounds the temporary arrays)
+CHUNK_ROWS = 1 << 14
+
+
+def number_format(digits=6, notation="general", locale="plain"):
+    """Return a validated NumberFormat."""
+    if not 1 <= digits <= MAX_DIGITS:
+        raise ValueError(f"digits must be between 1 and {MAX_DIGITS}, got {digits}")
+    if notation not in NOTATIONS:
+        raise ValueError(f"unknown notation {notation!r}; expected one of {', '.join(NOTATIONS)}")
+    if locale not in LOCALES:
+        raise ValueError(f"unknown locale {locale!r}; expected one of {', '.join(LOCALES)}")
+    decimal, group = LOCALES[locale]
+    return NumberFormat(digits, notation, decimal, group)
+
+
+def exponent_text(exponent):
+    # Same exponent style as Python's %e and %g
+    return f"e{exponent:+03d}"
+
+
+def localize(text, number_format):
+    """Swap in the format's decimal separator and group the integer digits."""
+    decimal, group = number_format.decimal, number_format.group
+    if decimal == "." and not group:
+        return text
+    body, e, exponent = text.partition("e")
+    sign = "-" if body.startswith("-") else ""
+    body = body.lstrip("-")
+    # An SI prefix is the only non-numeric tail
+    suffix = body.lstrip("0123456789.")
+    body = body[:len(body) - len(suffix)]
+    integer, point, fraction = body.partition(".")
+    if group and len(integer) > 3:
+        head = len(integer) % 3 or 3
+        integer = integer[:head] + "".join(group + integer[i:i + 3] for i in range(head, len(integer), 3))
+    return sign + integer + (decimal if point else "") + fraction + suffix + e + exponent
+
+
+def format_value(value, number_format=DEFAULT_FORMAT):
+    """Format one number; the default format matches ``f"{value:.6g}"``."""
+    digits, notation = number_format.digits, number_format.notation
+    if notation == "general":
+        return localize(format(value, f".{digits}g"), number_format)
+    if notation == "scientific" or not math.isfinite(value):
+        return localize(format(value, f".{digits - 1}e"), number_format)
+
+    # Engineering and SI: move the point so the exponent is a multiple of three
+    mantissa, _, exponent = format(value, f".{digits - 1}e").partition("e")
+    sign = "-" if mantissa.startswith("-") else ""
+    figures = mantissa.lstrip("-").replace(".", "")
+    exponent = int(exponent)
+    shift = exponent % 3
+    figures = figures.ljust(shift + 1, "0")
+    integer, fraction = figures[:shift + 1], figures[shift + 1:]
+    exponent -= shift
+    if notation == "si" and exponent in SI_PREFIXES:
+        suffix = SI_PREFIXES[exponent]
+    else:
+        suffix = exponent_text(exponent)
+    return localize(sign + integer + ("." + fraction if fraction else "") + suffix, number_format)
+
+
+def format_width(number_format=DEFAULT_FORMAT):
+    """Return the bytes per value that format_array() needs for a format."""
+    digits = number_format.digits
+    decimal = len(number_format.decimal.encode())
+    group = len(number_format.group.encode())
+    # Sign, up to digits + 2 integer figures (engineering pads) with group
+    # separators, the decimal separator, up to 3 leading zeros ("0.000") and
+    # the fraction, then "e-308" or a prefix
+    integer = digits + 2
+    return 1 + integer + (integer - 1) // 3 * group + decimal + 4 + digits + 5
+
+
+def format_array(values, number_format=DEFAULT_FORMAT, out=None):
+    """Format an array of numbers into a fixed-width bytes array (UTF-8).
+
+    Gives the same text as format_value() for each element. Values too close
+    to a rounding boundary for float arithmetic to settle (rare below 15
+    significant figures, most values above) are formatted one at a time.
+    Pass `out` (a bytes array with at least format_width() bytes per
+    element, e.g. ``np.empty(n, f"S{format_width(fmt)}")``) to reuse a
+    buffer. Decode with ``np.char.decode(result, "utf-8")`` to get str.
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+    width = format_width(number_format)
+    if out is None:
+        out = np.empty(values.shape, dtype=f"S{width}")
+    elif out.dtype.kind != "S" or out.dtype.itemsize < width or out.shape != values.shape:
+        raise ValueError(f"out must be a bytes array of shape {values.shape} with at least {width} bytes per item")
+    buffer = out.reshape(-1).view(np.uint8).reshape(values.size, out.dtype.itemsize)
+    flat = values.reshape(-1)
+    for start in range(0, flat.size, CHUNK_ROWS):
+        stop = min(start + CHUNK_ROWS, flat.size)
+        buffer[start:stop] = 0
+        _format_chunk(np, flat[start:stop], number_format, buffer[start:stop])
+    return out
+
+
+def format_lines(values, number_format=DEFAULT_FORMAT, separator="\n"):
+    """Format an array into one bytes string, each value followed by separator."""
+    import numpy as np
+
+    formatted = format_array(np.ravel(values), number_format)
+    width = formatted.dtype.itemsize
+    separator = separator.encode()
+    # Append the separator after each fixed-width row, then squeeze out the padding
+    table = np.zeros((len(formatted), width + len(separator)), dtype=np.uint8)
+    table[:, :width] = formatted.view(np.uint8).reshape(len(formatted), width)
+    table[:, width:] = np.frombuffer(separator, dtype=np.uint8)
+    return table[table != 0].tobytes()
+
+
+def _format_chunk(np, values, number_format, buffer):
+    digits, notation = number_format.digits, number_format.notation
+    decimal = np.frombuffer(number_format.decimal.encode(), dtype=np.uint8)
+    group = np.frombuffer(number_format.group.encode(), dtype=np.uint8)
+    rows, row_width = buffer.shape
+    finite = np.isfinite(values)
+    magnitude = np.where(finite, np.abs(values), 0.0)
+
+    # Decompose |value| into an integer mantissa of `digits` figures and a
+    # decimal exponent: magnitude ~= mantissa * 10 ** (exponent - digits + 1)
+    with np.errstate(divide="ignore"):
+        exponent = np.floor(np.log10(magnitude))
+    exponent = np.where(magnitude > 0, exponent, 0).astype(np.int64)
+
+    def scale(exponent):
+        power = exponent - (digits - 1)
+        # Dividing by an exact power of ten rounds once; tiny values need two steps
+        down = magnitude / 10.0 ** np.clip(power, 0, 308)
+        up = magnitude * 10.0 ** np.clip(-power, 0, 300) * 10.0 ** np.clip(-power - 300, 0, 300)
+        return np.where(power >= 0, down, up)
+
+    scaled = scale(exponent)
+    # log10 can land one off next to powers of ten
+    low = (scaled < 10.0 ** (digits - 1)) & (magnitude > 0)
+    high = scaled >= 10.0 ** digits
+    if low.any() or high.any():
+        exponent = exponent - low + high
+        scaled = np.where(low | high, scale(exponent), scaled)
+    # The scaling is only good to a few ulps: values that close to a rounding
+    # boundary are redone by the scalar path at the end. Test before the carry
+    # below, since a tie that rounds up may carry (99999.95 -> 100000).
+    ambiguous = np.abs(scaled - np.floor(scaled) - 0.5) <= scaled * 1e-15
+    # Rounding up can carry into an extra figure (9.9999996 -> 10.0000)
+    carry = np.rint(scaled) >= 10.0 ** digits
+    if carry.any():
+        exponent = exponent + carry
+        scaled = np.where(carry, scale(exponent), scaled)
+        ambiguous |= np.abs(scaled - np.floor(scaled) - 0.5) <= scaled * 1e-15
+    mantissa = np.rint(scaled)
+
+    # Figures of the mantissa, most significant first, padded with zeros for
+    # engineering; count the trailing zeros on the way (%g drops them)
+    figures = np.zeros((rows, digits + 2), dtype=np.uint8)
+    remaining = mantissa.astype(np.int64)
+    trailing_zeros = np.zeros(rows, dtype=np.int64)
+    in_zeros = np.ones(rows, dtype=bool)
+    for i in range(digits - 1, -1, -1):
+        remaining, figures[:, i] = np.divmod(remaining, 10)
+        in_zeros &= figures[:, i] == 0
+        trailing_zeros += in_zeros
+
+    # Layout of each row: [sign][lead "0" + decimal + zeros][integer figures
+    # with group separators][decimal][fraction figures][suffix]
+    lead_zeros = np.full(rows, -1, dtype=np.int64)  # -1: no "0." lead
+    suffix_exponent = exponent.copy()
+    has_suffix = np.ones(rows, dtype=bool)
+    if notation == "general":
+        kept = np.maximum(digits - trailing_zeros, 1)
+        fixed = (exponent >= -4) & (exponent < digits)
+        integer = np.where(fixed, np.maximum(exponent + 1, 0), 1)
+        fraction = np.where(fixed & (exponent < 0), kept, np.maximum(kept - integer, 0))
+        lead_zeros = np.where(fixed & (exponent < 0), -exponent - 1, -1)
+        has_suffix = ~fixed
+    elif notation == "scientific":
+        integer = np.ones(rows, dtype=np.int64)
+        fraction = np.full(rows, digits - 1, dtype=np.int64)
+    else:
+        shift = exponent % 3
+        suffix_exponent = exponent - shift
+        integer = shift + 1
+        fraction = np.maximum(digits - integer, 0)
+
+    # Suffix text for each distinct exponent (an SI prefix or "e+NN")
+    lowest = int(suffix_exponent.min())
+    suffix_index = suffix_exponent - lowest
+    texts = [
+        (SI_PREFIXES[e] if notation == "si" and e in SI_PREFIXES else exponent_text(e)).encode()
+        for e in range(lowest, int(suffix_exponent.max()) + 1)
+    ]
+    suffix_bytes = np.zeros((len(texts), max(map(len, texts))), dtype=np.uint8)
+    suffix_length = np.array([len(text) for text in texts], dtype=np.int64)
+    for i, text in enumerate(texts):
+        suffix_bytes[i, :len(text)] = np.frombuffer(text, dtype=np.uint8)
+    suffix_length = np.where(has_suffix, suffix_length[suffix_index], 0)
+
+    row_start = np.arange(rows, dtype=np.int64) * row_width
+    negative = np.signbit(values) & finite
+    position = negative.astype(np.int64)
+    flat = buffer.reshape(-1)
+    flat[row_start[negative]] = ord("-")
+
+    # "0" + decimal + zeros for fixed values below one
+    lead = lead_zeros >= 0
+    flat[(row_start + position)[lead]] = ord("0")
+    _scatter(np, flat, (row_start + position + 1)[lead], decimal)
+    for i in range(3):
+        zero = lead & (lead_zeros > i)
+        flat[(row_start + position + 1 + len(decimal) + i)[zero]] = ord("0")
+    position = position + np.where(lead, 1 + len(decimal) + lead_zeros, 0)
+
+    # Figures: each is shifted right by the group separators before it and,
+    # in the fraction, by the decimal separator. Every row gets all its
+    # figures; the ones past its end are overwritten or cleared below
+    column = np.arange(digits + 2, dtype=np.int64)[None, :]
+    point = (integer > 0) & (fraction > 0)
+    offset = (row_start + position)[:, None] + column
+    if len(decimal):
+        offset += (column >= integer[:, None]) * (point * len(decimal))[:, None]
+    groups = np.maximum(integer - 1, 0) // 3 if len(group) else np.zeros(rows, dtype=np.int64)
+    first_group = integer - 3 * groups
+    if groups.any():
+        offset += np.clip((column - first_group[:, None]) // 3 + 1, 0, groups[:, None]) * len(group)
+    flat[offset] = figures + ord("0")
+
+    # Group separators, then the decimal separator
+    for g in range(int(groups.max(initial=0))):
+        has_group = groups > g
+        before = first_group + 3 * g
+        _scatter(np, flat, (row_start + position + before + g * len(group))[has_group], group)
+    after_integer = row_start + position + integer + groups * len(group)
+    _scatter(np, flat, after_integer[point], decimal)
+
+    # Suffix, then clear everything after it
+    end = after_integer + point * len(decimal) + fraction
+    flat[end[:, None] + np.arange(suffix_bytes.shape[1], dtype=np.int64)] = suffix_bytes[suffix_index]
+    buffer *= np.arange(row_width) < (end - row_start + suffix_length)[:, None]
+
+    # inf and nan take the whole row
+    if not finite.all():
+        special = np.where(np.isnan(values), b"nan", np.where(values > 0, b"inf", b"-inf"))
+        buffer.view(f"S{row_width}").reshape(-1)[~finite] = special[~finite]
+
+    for row in np.flatnonzero(ambiguous & finite).tolist():
+        text = format_value(float(values[row]), number_format).encode()
+        buffer[row] = 0
+        buffer[row, :len(text)] = np.frombuffer(text, dtype=np.uint8)
+
+
+def _scatter(np, flat, positions, text):
+    # Write the bytes of a (possibly multi-byte) separator at each position
+    for i, byte in enumerate(text.tolist()):
+        flat[positions + i] = byte
@@ -0,0 +1,233 @@
+"""Persistent conversion history and favorites in a local SQLite database.
+
+Conversions are queued with record() and written by a background thread in
+batched transactions, so the Streamlit render path never waits on disk.
+Alongside the raw history, a small per-pair summary table keeps use counts
+and last-use times, which makes the "recent" and "frequent" queries index
+lookups no matter how many millions of history rows have piled up.
+
+    store = HistoryStore("conversion_history.db")
+    store.record("Length", "Mile", "Kilometer", 12.5, 20.1168)
+    store.frequent("Length", limit=5)  # [("Mile", "Kilometer", 1), ...]
+
+A batch that fails to write (say the database is locked for longer than
+the busy timeout) is logged and dropped; the writer keeps going.
+"""
+import logging
+import math
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = os.environ.get("UNIT_CONVERTER_HISTORY", "conversion_history.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    used_at REAL NOT NULL,
+    category TEXT NOT NULL,
+    from_unit TEXT NOT NULL,
+    to_unit TEXT NOT NULL,
+    value REAL NOT NULL,
+    result REAL
+);
+CREATE INDEX IF NOT EXISTS history_category ON history (category, used_at);
+CREATE INDEX IF NOT EXISTS history_pair ON history (category, from_unit, to_unit);
+
+CREATE TABLE IF NOT EXISTS pair_usage (
+    category TEXT NOT NULL,
+    from_unit TEXT NOT NULL,
+    to_unit TEXT NOT NULL,
+    uses INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (category, from_unit, to_unit)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS pair_usage_recent ON pair_usage (category, last_used);
+CREATE INDEX IF NOT EXISTS pair_usage_frequent ON pair_usage (category, uses);
+
+CREATE TABLE IF NOT EXISTS favorites (
+    category TEXT NOT NULL,
+    from_unit TEXT NOT NULL,
+    to_unit TEXT NOT NULL,
+    added_at REAL NOT NULL,
+    PRIMARY KEY (category, from_unit, to_unit)
+) WITHOUT ROWID;
+"""
+
+INSERT_HISTORY = (
+    "INSERT INTO history (used_at, category, from_unit, to_unit, value, result) VALUES (?, ?, ?, ?, ?, ?)"
+)
+UPSERT_USAGE = """
+INSERT INTO pair_usage (category, from_unit, to_unit, uses, last_used) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (category, from_unit, to_unit)
+DO UPDATE SET uses = uses + excluded.uses, last_used = max(last_used, excluded.last_used)
+"""
+
+
+def connect(path):
+    """Open a connection in WAL mode so readers never block the writer."""
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class HistoryStore:
+    """SQLite history and favorites with a batched background writer."""
+
+    def __init__(self, path=DEFAULT_PATH, batch_size=500, flush_interval=1.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._local = threading.local()
+        self.written = 0
+        self.failed = 0
+
+        with connect(path) as connection:
+            connection.executescript(SCHEMA)
+        self._writer = threading.Thread(target=self._write_loop, name="history-writer", daemon=True)
+        self._writer.start()
+
+    def record(self, category, from_unit, to_unit, value, result):
+        """Queue one conversion for writing; returns immediately.
+
+        The value must be finite; a non-finite result is stored as NULL.
+        """
+        if not math.isfinite(value):
+            raise ValueError(f"cannot record the non-finite value {value!r}")
+        if result is not None and not math.isfinite(result):
+            result = None
+        self._queue.put((time.time(), category, from_unit, to_unit, value, result))
+
+    def flush(self):
+        """Block until everything recorded so far is on disk (or failed to write)."""
+        if not self._writer.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self):
+        """Flush pending rows and stop the writer thread."""
+        self._queue.put(None)
+        self._writer.join()
+
+    def _write_loop(self):
+        connection = connect(self.path)
+        try:
+            while True:
+                item = self._queue.get()
+                rows, waiters, stop = [], [], False
+                # Gather whatever else arrives within the flush interval, up to a batch
+                deadline = time.monotonic() + self.flush_interval
+                while True:
+                    if item is None:
+                        stop = True
+                    elif isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        rows.append(item)
+                    if stop or waiters or len(rows) >= self.batch_size:
+                        break
+                    try:
+                        item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    except queue.Empty:
+                        break
+                try:
+                    if rows:
+                        self._write(connection, rows)
+                except Exception:
+                    # Drop the batch rather than the thread, or record() would queue forever
+                    logger.exception("could not write %d history rows to %s", len(rows), self.path)
+                    self.failed += len(rows)
+                finally:
+                    for waiter in waiters:
+                        waiter.set()
+                if stop:
+                    return
+        finally:
+            connection.close()
+
+    def _write(self, connection, rows):
+        usage = {}
+        for used_at, category, from_unit, to_unit, _value, _result in rows:
+            key = (category, from_unit, to_unit)
+            uses, _ = usage.get(key, (0, 0.0))
+            usage[key] = (uses + 1, used_at)
+        with connection:
+            connection.executemany(INSERT_HISTORY, rows)
+            connection.executemany(UPSERT_USAGE, [key + value for key, value in usage.items()])
+        self.written += len(rows)
+
+    @property
+    def _reader(self):
+        # One connection per reading thread; WAL lets reads run during writes
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = connect(self.path)
+        return connection
+
+    def recent(self, category, limit=10):
+        """Return the most recently used (from_unit, to_unit) pairs of a category."""
+        return self._reader.execute(
+            "SELECT from_unit, to_unit FROM pair_usage WHERE category = ? ORDER BY last_used DESC LIMIT ?",
+            (category, limit),
+        ).fetchall()
+
+    def frequent(self, category, limit=10):
+        """Return the most used (from_unit, to_unit, uses) of a category."""
+        return self._reader.execute(
+            "SELECT from_unit, to_unit, uses FROM pair_usage WHERE category = ? ORDER BY uses DESC LIMIT ?",
+            (category, limit),
+        ).fetchall()
+
+    def history(self, category=None, limit=50):
+        """Return the latest history rows, optionally for one category."""
+        columns = "used_at, category, from_unit, to_unit, value, result"
+        if category is None:
+            return self._reader.execute(
+                f"SELECT {columns} FROM history ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return self._reader.execute(
+            f"SELECT {columns} FROM history WHERE category = ? ORDER BY used_at DESC LIMIT ?",
+            (category, limit),
+        ).fetchall()
+
+    def add_favorite(self, category, from_unit, to_unit):
+        """Mark a unit pair as a favorite (favorites are rare, so this writes directly)."""
+        with self._reader as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO favorites VALUES (?, ?, ?, ?)", (category, from_unit, to_unit, time.time())
+            )
+
+    def remove_favorite(self, category, from_unit, to_unit):
+        """Remove a unit pair from the favorites."""
+        with self._reader as connection:
+            connection.execute(
+                "DELETE FROM favorites WHERE category = ? AND from_unit = ? AND to_unit = ?",
+                (category, from_unit, to_unit),
+            )
+
+    def favorites(self, category=None):
+        """Return favorite pairs as (category, from_unit, to_unit), oldest first."""
+        if category is None:
+            return self._reader.execute(
+                "SELECT category, from_unit, to_unit FROM favorites ORDER BY added_at"
+            ).fetchall()
+        return self._reader.execute(
+            "SELECT category, from_unit, to_unit FROM favorites WHERE category = ? ORDER BY added_at",
+            (category,),
+        ).fetchall()
+
+    def preferred_pair(self, category):
+        """Return the pair to preselect for a category: first favorite, else most used, else None."""
+        favorites = self.favorites(category)
+        if favorites:
+            return favorites[0][1:]
+        frequent = self.frequent(category, limit=1)
+        return frequent[0][:2] if frequent else None
@@ -0,0 +1,152 @@
+"""Pick the most readable unit for each value ("humanize").
+
+A value is shown in the largest unit of the category's ladder that keeps
+it at or above 1, so 1073741824 Byte becomes 1 Gibibyte (GiB) and
+90 Minute becomes 1.5 Hour:
+
+    humanize(1073741824, "Data", "Byte")      # (1.0, 'Gibibyte (GiB)')
+    humanize(0.25, "Time", "Second")          # (250.0, 'Millisecond')
+    values, unit_index, names = humanize_array(sizes, "Data", "Byte")
+
+Ladders stay within one unit system: the ladder is the one that holds
+the from unit (2 Mile gives 2 Mile, 2000 Meter gives 2 Kilometer), or
+the category's first ladder for units in none of them.
+
+Each (category, from unit, ladder) gets a precomputed index: the ladder
+sorted by factor, the threshold of each unit expressed in the from unit
+and the multiplier into it. Choosing a unit is then a binary search
+(bisect for one value, searchsorted for a column of a long ladder)
+instead of a trial conversion into every unit; short ladders are
+scanned with one vectorized comparison per threshold, which is cheaper
+than a per-element search. Values below the smallest unit (and zero or
+NaN) use the smallest unit.
+"""
+import bisect
+import functools
+from collections import namedtuple
+
+from .registry import registry
+from .units import unit_definitions
+
+HumanizeIndex = namedtuple("HumanizeIndex", ["names", "thresholds", "scales"])
+
+# Default ladders per category, one per unit system (the first is used for
+# units in none of them). Built-in categories not listed (Speed) have no
+# ladder; plugin categories use all their units, one per factor.
+# Data uses the binary units (the KB..PB units here are also powers of 1024).
+HUMANIZE_UNITS = {
+    "Length": (
+        ("Millimeter", "Centimeter", "Meter", "Kilometer"),
+        ("Inch", "Foot", "Mile"),
+    ),
+    "Weight/Mass": (
+        ("Milligram", "Gram", "Kilogram", "Ton (Metric)"),
+        ("Ounce", "Pound", "Ton (US)"),
+    ),
+    "Area": (
+        ("Square Meter", "Hectare", "Square Kilometer"),
+        ("Square Inch", "Square Foot", "Acre", "Square Mile"),
+    ),
+    "Volume": (
+        ("Milliliter", "Liter", "Cubic Meter"),
+        ("Teaspoon", "Tablespoon", "Fluid Ounce (US)", "Cup", "Pint (US)", "Quart (US)", "Gallon (US)"),
+    ),
+    "Pressure": (("Pascal", "Kilopascal", "Bar"),),
+    "Energy": (("Joule", "Kilojoule", "Kilowatt-hour"),),
+    "Power": (("Watt", "Kilowatt", "Megawatt"),),
+    "Angle": (("Second of Arc", "Minute of Arc", "Degree"),),
+    "Data": (
+        ("Byte", "Kibibyte (KiB)", "Mebibyte (MiB)", "Gibibyte (GiB)", "Tebibyte (TiB)", "Pebibyte (PiB)"),
+    ),
+    "Time": (
+        ("Nanosecond", "Microsecond", "Millisecond", "Second", "Minute", "Hour", "Day", "Year (365 days)"),
+    ),
+}
+
+# Elements per step of humanize_array (keeps the temporaries in cache)
+HUMANIZE_CHUNK = 1 << 16
+
+# Ladders up to this many units are scanned linearly by humanize_array;
+# longer ones (large plugin categories) use a binary search per element
+SCAN_UNITS = 16
+
+
+def ladder_units(category, from_unit=None):
+    """Return the default humanize ladder of a category for values in from_unit."""
+    if category in HUMANIZE_UNITS:
+        ladders = HUMANIZE_UNITS[category]
+        return next((ladder for ladder in ladders if from_unit in ladder), ladders[0])
+    if category in unit_definitions:
+        raise ValueError(f"cannot humanize {category} values: the category has no unit ladder")
+    ladder = {}
+    for name in registry.units(category):
+        # The first unit in display order wins among equal factors
+        ladder.setdefault(registry.unit(category, name).factor, name)
+    return tuple(ladder.values())
+
+
+@functools.lru_cache(maxsize=256)
+def humanize_index(category, from_unit, units=None):
+    """Return the HumanizeIndex for converting from_unit values along a ladder.
+
+    units is a tuple of unit names (default: ladder_units(category,
+    from_unit)); they are sorted by size here, so any order works.
+    """
+    if not registry.linear(category) or category == "Currency":
+        raise ValueError(f"cannot humanize {category} values: the category has no fixed factors")
+    names = ladder_units(category, from_unit) if units is None else tuple(units)
+    if not names:
+        raise ValueError("humanize needs at least one unit")
+    names = tuple(sorted(names, key=lambda name: registry.unit(category, name).factor))
+    # One ladder unit expressed in from_unit: values at or above it use that unit
+    thresholds = tuple(registry.factor(category, name, from_unit) for name in names)
+    scales = tuple(registry.factor(category, from_unit, name) for name in names)
+    return HumanizeIndex(names, thresholds, scales)
+
+
+def humanize(value, category, from_unit, units=None):
+    """Return (value, unit) with value converted to its most readable unit."""
+    index = humanize_index(category, from_unit, None if units is None else tuple(units))
+    magnitude = abs(value) if value == value else 0.0
+    position = max(bisect.bisect_right(index.thresholds, magnitude) - 1, 0)
+    return value * index.scales[position], index.names[position]
+
+
+def humanize_array(values, category, from_unit, units=None, out=None):
+    """Vectorized humanize(): pick a unit per element of a whole column.
+
+    Returns (values, unit_index, names): the float64 values converted to
+    their units (written into out when given), each element's position in
+    names as an integer array, and the ladder's unit names sorted by size.
+    """
+    import numpy as np
+
+    index = humanize_index(category, from_unit, None if units is None else tuple(units))
+    values = np.asarray(values, dtype=np.float64)
+    if out is None:
+        out = np.empty_like(values)
+    thresholds = np.array(index.thresholds)
+    scales = np.array(index.scales)
+    short = len(index.names) <= SCAN_UNITS
+    unit_index = np.empty(values.shape, dtype=np.int8 if short else np.intp)
+    flat_values, flat_out, flat_index = values.reshape(-1), out.reshape(-1), unit_index.reshape(-1)
+    magnitude = np.empty(min(flat_values.size, HUMANIZE_CHUNK))
+    for start in range(0, flat_values.size, HUMANIZE_CHUNK):
+        stop = min(start + HUMANIZE_CHUNK, flat_values.size)
+        chunk = flat_values[start:stop]
+        np.abs(chunk, out=magnitude[:stop - start])
+        if short:
+            # Ladders are short, so counting the thresholds passed beats a per-element search
+            positions = flat_index[start:stop]
+            positions[:] = 0
+            for threshold in index.thresholds[1:]:
+                positions += magnitude[:stop - start] >= threshold
+        else:
+            # NaN sorts after every threshold; send it to the smallest unit like zero
+            chunk_magnitude = np.nan_to_num(magnitude[:stop - start], nan=0.0)
+            positions = np.searchsorted(thresholds, chunk_magnitude, side="right")
+            positions -= 1
+            np.maximum(positions, 0, out=positions)
+            flat_index[start:stop] = positions
+        np.multiply(chunk, scales[positions], out=flat_out[start:stop])
+    return out, unit_index, index.names
@@ -0,0 +1,186 @@
+"""Opt-in call counts, latency histograms and error counts for the hot paths.
+
+Instrumentation is off unless the UNIT_CONVERTER_METRICS environment
+variable is set (to anything but "" or "0") before the package is imported.
+When it is off, instrument() hands back the original function, so there is
+no wrapper and no overhead at all. When it is on, every ``*_conversion``
+function, the formula renderers and the Streamlit ``main()`` are timed:
+
+    UNIT_CONVERTER_METRICS=1 streamlit run app.py           # ?diagnostics=1 shows the panel
+    UNIT_CONVERTER_METRICS=1 python -m unit_converter.server  # GET /metrics
+
+Metrics are rendered in the Prometheus text format by render(), and are
+written to the file named by UNIT_CONVERTER_METRICS_FILE at exit.
+"""
+import atexit
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+
+enabled = os.environ.get("UNIT_CONVERTER_METRICS", "") not in ("", "0")
+
+# Histogram bucket upper bounds in seconds (1 µs to 1 s)
+BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 0.1, 1.0)
+
+
+class Histogram:
+    """Latency histogram plus call and error counters for one label set."""
+
+    __slots__ = ("counts", "total", "calls", "errors", "lock")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.calls = 0
+        self.errors = 0
+        self.lock = threading.Lock()
+
+    def observe(self, seconds, failed=False):
+        with self.lock:
+            self.counts[bisect_left(BUCKETS, seconds)] += 1
+            self.total += seconds
+            self.calls += 1
+            if failed:
+                self.errors += 1
+
+    def quantile(self, q):
+        """Estimate a quantile from the buckets (upper bound of its bucket)."""
+        target = q * self.calls
+        seen = 0
+        for bound, count in zip(BUCKETS + (float('inf'),), self.counts):
+            seen += count
+            if seen >= target and count:
+                return bound
+        return 0.0
+
+
+# (metric name, sorted label items) -> Histogram
+histograms = {}
+_registry_lock = threading.Lock()
+
+
+def histogram(name, **labels):
+    """Return the Histogram for a metric name and label set, creating it on first use."""
+    key = (name, tuple(sorted(labels.items())))
+    found = histograms.get(key)
+    if found is None:
+        with _registry_lock:
+            found = histograms.setdefault(key, Histogram())
+    return found
+
+
+def instrument(function, name, **labels):
+    """Wrap a function with a timer, or return it unchanged when metrics are off."""
+    if not enabled:
+        return function
+    stats = histogram(name, **labels)
+    clock = time.perf_counter
+
+    @functools.wraps(function)
+    def timed(*args, **kwargs):
+        start = clock()
+        try:
+            result = function(*args, **kwargs)
+        except BaseException:
+            stats.observe(clock() - start, failed=True)
+            raise
+        stats.observe(clock() - start)
+        return result
+
+    return timed
+
+
+def instrument_categories(categories, namespace):
+    """Time every category's conversion function and the formula renderers in namespace.
+
+    The module-level names in namespace are replaced too, so direct imports
+    and the category table share the same wrapper.
+    """
+    if not enabled:
+        return
+    wrapped = {}
+    for category, data in categories.items():
+        function = data["conversion_function"]
+        wrapped[function.__name__] = data["conversion_function"] = instrument(
+            function, "unit_converter_conversion_seconds", category=category
+        )
+    for name, value in list(namespace.items()):
+        if name in wrapped:
+            namespace[name] = wrapped[name]
+        elif name.endswith("_formula") and callable(value):
+            namespace[name] = instrument(value, "unit_converter_formula_seconds", renderer=name)
+
+
+def reset():
+    """Clear every recorded value."""
+    with _registry_lock:
+        for stats in histograms.values():
+            with stats.lock:
+                stats.counts = [0] * (len(BUCKETS) + 1)
+                stats.total = 0.0
+                stats.calls = stats.errors = 0
+
+
+def escape_label(value):
+    """Escape a label value as the text format requires (backslash, quote, newline)."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels, **extra):
+    items = list(labels) + list(extra.items())
+    if not items:
+        return ""
+    return "{" + ",".join(f'{key}="{escape_label(value)}"' for key, value in items) + "}"
+
+
+def render():
+    """Return every metric in the Prometheus text exposition format."""
+    lines = []
+    for name in sorted({name for name, _ in histograms}):
+        base = name.removesuffix("_seconds")
+        lines.append(f"# TYPE {name} histogram")
+        errors = []
+        for (metric, labels), stats in sorted(histograms.items()):
+            if metric != name:
+                continue
+            cumulative = 0
+            for bound, count in zip(BUCKETS, stats.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{format_labels(labels, le=f'{bound:g}')} {cumulative}")
+            lines.append(f"{name}_bucket{format_labels(labels, le='+Inf')} {stats.calls}")
+            lines.append(f"{name}_sum{format_labels(labels)} {stats.total:.9f}")
+            lines.append(f"{name}_count{format_labels(labels)} {stats.calls}")
+            errors.append(f"{base}_errors_total{format_labels(labels)} {stats.errors}")
+        lines.append(f"# TYPE {base}_errors_total counter")
+        lines.extend(errors)
+    return "\n".join(lines) + "\n"
+
+
+def summary():
+    """Return one row per called label set: calls, errors, mean and p50/p99 in microseconds."""
+    rows = []
+    for (name, labels), stats in sorted(histograms.items()):
+        if not stats.calls:
+            continue
+        rows.append({
+            "metric": name.removeprefix("unit_converter_").removesuffix("_seconds"),
+            "labels": ", ".join(f"{key}={value}" for key, value in labels),
+            "calls": stats.calls,
+            "errors": stats.errors,
+            "mean_us": stats.total / stats.calls * 1e6,
+            "p50_us": stats.quantile(0.5) * 1e6,
+            "p99_us": stats.quantile(0.99) * 1e6,
+        })
+    return rows
+
+
+def dump(path):
+    """Write the Prometheus text to a file."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(render())
+
+
+if enabled and os.environ.get("UNIT_CONVERTER_METRICS_FILE"):
+    atexit.register(dump, os.environ["UNIT_CONVERTER_METRICS_FILE"])
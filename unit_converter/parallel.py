@@ -0,0 +1,118 @@
+"""Multi-core batch conversion over shared-memory buffers.
+
+Input values are placed in a ``multiprocessing.shared_memory`` block once;
+worker processes attach to it by name and convert their slice in place, so
+the data itself is never pickled. Only the block name, slice bounds and the
+resolved conversion coefficients travel to the workers.
+
+    with ParallelConverter(workers=8) as converter:
+        result = converter.convert(values, "Pressure", "PSI", "Pascal")
+
+For the largest jobs, allocate the data in a SharedArray up front and use
+convert_inplace() to avoid even the initial copy.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .batch import apply_coefficients, batch_coefficients
+
+# Don't split work into slices smaller than this many values
+MIN_CHUNK = 1 << 20
+
+
+class SharedArray:
+    """A float64 NumPy array backed by a named shared-memory block."""
+
+    def __init__(self, length):
+        self.length = length
+        self.shm = shared_memory.SharedMemory(create=True, size=max(length, 1) * 8)
+        self.array = np.ndarray((length,), dtype=np.float64, buffer=self.shm.buf)
+
+    @classmethod
+    def from_values(cls, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        shared = cls(len(values))
+        shared.array[:] = values
+        return shared
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def close(self):
+        """Release the block (the array must not be used afterwards)."""
+        self.array = None
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def convert_slice(name, length, start, stop, scale, offset, reciprocal):
+    """Worker task: convert array[start:stop] of a shared block in place."""
+    # Workers share the parent's resource tracker, which owns the block
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        array = np.ndarray((length,), dtype=np.float64, buffer=shm.buf)
+        view = array[start:stop]
+        apply_coefficients(view, scale, offset, reciprocal, out=view)
+        del array, view
+    finally:
+        shm.close()
+    return stop - start
+
+
+class ParallelConverter:
+    """Shard conversions across a reusable pool of worker processes."""
+
+    def __init__(self, workers=None, chunk_size=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    def slices(self, length):
+        """Split [0, length) into contiguous (start, stop) slices."""
+        chunk = self.chunk_size or max(MIN_CHUNK, -(-length // (self.workers * 4)))
+        return [(start, min(start + chunk, length)) for start in range(0, length, chunk)]
+
+    def convert_inplace(self, shared, category, from_unit, to_unit):
+        """Convert every value of a SharedArray in place across the pool."""
+        # Resolve coefficients here so workers see the parent's exchange rates
+        scale, offset, reciprocal = batch_coefficients(category, from_unit, to_unit)
+        futures = [
+            self.pool.submit(convert_slice, shared.name, shared.length, start, stop, scale, offset, reciprocal)
+            for start, stop in self.slices(shared.length)
+        ]
+        # Let every slice finish before raising, so no worker is still using the block
+        wait(futures)
+        for future in futures:
+            future.result()
+        return shared.array
+
+    def convert(self, values, category, from_unit, to_unit):
+        """Convert an array in parallel and return a new float64 array."""
+        with SharedArray.from_values(values) as shared:
+            self.convert_inplace(shared, category, from_unit, to_unit)
+            return shared.array.copy()
+
+    def close(self):
+        self.pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def parallel_conversion(values, category, from_unit, to_unit, workers=None):
+    """One-shot parallel conversion (starts and stops a worker pool)."""
+    with ParallelConverter(workers=workers) as converter:
+        return converter.convert(values, category, from_unit, to_unit)
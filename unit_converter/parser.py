@@ -0,0 +1,256 @@
+"""Parse free-text quantities such as "12.5 mi", "3 kWh", "72°F" or "500 MiB".
+
+Every unit name from the categories table, its plural and lowercase forms,
+the abbreviation in parentheses (``"Mebibyte (MiB)"`` -> ``MiB``) and the
+common symbols in ``abbreviations`` are compiled once into a single regular
+expression. The aliases are arranged as a trie, so matching a unit costs
+one pass over its characters instead of trying every unit in turn.
+
+    parse_quantity("disk usage 500 MiB")  # Quantity(500.0, "Mebibyte (MiB)", "Data")
+    parse_bulk(open("app.log").read())     # one C-level scan over the whole text
+"""
+import re
+from collections import namedtuple
+
+from .conversions import categories
+
+Quantity = namedtuple("Quantity", ["value", "unit", "category"])
+
+# Common symbols and abbreviations (matched case-sensitively)
+abbreviations = {
+    "Length": {
+        "Meter": ["m", "metre", "metres"],
+        "Kilometer": ["km", "kilometre", "kilometres"],
+        "Centimeter": ["cm"],
+        "Millimeter": ["mm"],
+        "Mile": ["mi"],
+        "Yard": ["yd", "yds"],
+        "Foot": ["ft", "feet", "'"],
+        "Inch": ["in", "inches", '"'],
+        "Nautical Mile": ["nmi", "NM"],
+    },
+    "Weight/Mass": {
+        "Kilogram": ["kg", "kgs"],
+        "Gram": ["g"],
+        "Milligram": ["mg"],
+        "Pound": ["lb", "lbs"],
+        "Ounce": ["oz"],
+        "Ton (Metric)": ["t", "tonne", "tonnes"],
+        "Ton (US)": ["ton", "tons"],
+        "Stone": ["st"],
+    },
+    "Temperature": {
+        "Celsius": ["°C", "℃", "degC", "C"],
+        "Fahrenheit": ["°F", "℉", "degF", "F"],
+        "Kelvin": ["K"],
+        "Rankine": ["°R", "degR"],
+        "Réaumur": ["°Ré", "°Re"],
+    },
+    "Area": {
+        "Square Meter": ["m²", "m2", "sq m"],
+        "Square Kilometer": ["km²", "km2", "sq km"],
+        "Square Mile": ["mi²", "mi2", "sq mi"],
+        "Hectare": ["ha"],
+        "Acre": ["ac", "acres"],
+        "Square Foot": ["ft²", "ft2", "sq ft", "square feet"],
+        "Square Inch": ["in²", "in2", "sq in"],
+        "Square Yard": ["yd²", "yd2", "sq yd"],
+    },
+    "Volume": {
+        "Cubic Meter": ["m³", "m3"],
+        "Liter": ["L", "l", "litre", "litres"],
+        "Milliliter": ["mL", "ml"],
+        "Gallon (US)": ["gal", "gallon", "gallons", "Gallon", "Gallons"],
+        "Gallon (UK)": ["imp gal"],
+        "Quart (US)": ["qt"],
+        "Pint (US)": ["pt"],
+        "Cup": ["cups"],
+        "Fluid Ounce (US)": ["fl oz"],
+        "Tablespoon": ["tbsp"],
+        "Teaspoon": ["tsp"],
+        "Cubic Inch": ["in³", "in3", "cu in"],
+        "Cubic Foot": ["ft³", "ft3", "cu ft"],
+    },
+    "Time": {
+        "Second": ["s", "sec", "secs"],
+        "Minute": ["min", "mins"],
+        "Hour": ["h", "hr", "hrs"],
+        "Day": ["d"],
+        "Week": ["wk", "wks"],
+        "Month (30 days)": ["mo", "month", "months"],
+        "Year (365 days)": ["y", "yr", "yrs", "year", "years"],
+        "Millisecond": ["ms"],
+        "Microsecond": ["µs", "μs", "us"],  # micro sign and Greek mu
+        "Nanosecond": ["ns"],
+    },
+    "Speed": {
+        "Meter/Second": ["m/s"],
+        "Kilometer/Hour": ["km/h", "kph", "kmh"],
+        "Mile/Hour": ["mph", "mi/h"],
+        "Foot/Second": ["ft/s", "fps"],
+        "Knot": ["kn", "kt", "knots"],
+        "Mach (at sea level)": ["Mach"],
+    },
+    "Pressure": {
+        "Pascal": ["Pa"],
+        "Kilopascal": ["kPa"],
+        "Bar": ["bar"],
+        "PSI": ["psi"],
+        "Atmosphere": ["atm"],
+        "Torr": ["torr"],
+        "Millimeter of Mercury": ["mmHg"],
+    },
+    "Energy": {
+        "Joule": ["J"],
+        "Kilojoule": ["kJ"],
+        "Calorie": ["cal"],
+        "Kilocalorie": ["kcal"],
+        "Watt-hour": ["Wh"],
+        "Kilowatt-hour": ["kWh"],
+        "Electronvolt": ["eV"],
+        "British Thermal Unit": ["BTU", "Btu"],
+        "Foot-pound": ["ft-lb", "ft·lbf", "ft-lbf"],
+    },
+    "Power": {
+        "Watt": ["W"],
+        "Kilowatt": ["kW"],
+        "Megawatt": ["MW"],
+        "Horsepower": ["hp"],
+        "Foot-pound/minute": ["ft-lb/min"],
+        "BTU/hour": ["BTU/h", "BTU/hr"],
+    },
+    "Data": {
+        "Bit": ["b", "bit", "bits"],
+        "Byte": ["B", "bytes"],
+    },
+    "Angle": {
+        "Degree": ["°", "deg"],
+        "Radian": ["rad"],
+        "Gradian": ["grad", "gon"],
+        "Minute of Arc": ["arcmin", "′"],
+        "Second of Arc": ["arcsec", "″"],
+        "Turn/Revolution": ["turn", "turns", "rev", "revs"],
+    },
+    "Fuel Economy": {
+        "Miles per Gallon (US)": ["mpg"],
+        "Miles per Gallon (UK)": ["mpg (UK)", "mpg UK"],
+        "Kilometers per Liter": ["km/L", "km/l", "kpl"],
+        "Liters per 100 Kilometers": ["L/100km", "l/100km", "L/100 km"],
+    },
+}
+
+NUMBER = r"[-+]?(?:\d{1,3}(?:,\d{3})+(?:\.\d*)?|\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+
+# Aliases that are also common words ("3 in the box"): only units when a
+# number or the end of the line follows ("12 in", "12 in x 8 in")
+WORD_ALIASES = ("in",)
+
+
+def build_alias_index():
+    """Map every alias to its (unit, category), abbreviations taking priority."""
+    index = {}
+    for category, units in abbreviations.items():
+        for unit, aliases in units.items():
+            for alias in aliases:
+                index.setdefault(alias, (unit, category))
+    # Names with a qualifier in parentheses, e.g. "Mebibyte (MiB)" or "Gallon (US)"
+    qualified = {}
+    for category, data in categories.items():
+        for unit in data["units"]:
+            match = re.fullmatch(r"(.*?) \((.+)\)", unit)
+            if match:
+                qualified.setdefault(match.group(1), []).append(unit)
+    for category, data in categories.items():
+        for unit in data["units"]:
+            names = [unit]
+            match = re.fullmatch(r"(.*?) \((.+)\)", unit)
+            if match:
+                base, qualifier = match.groups()
+                # "Mebibyte" alone only when no other unit shares the base name
+                if len(qualified[base]) == 1:
+                    names.append(base)
+                # "MiB" but not "US", "UK" or descriptive qualifiers
+                if re.fullmatch(r"[A-Z][A-Za-z]{1,3}", qualifier) and qualifier not in ("US", "UK"):
+                    names.append(qualifier)
+            for name in names:
+                for alias in (name, name + "s", name.lower(), name.lower() + "s"):
+                    index.setdefault(alias, (unit, category))
+    return index
+
+
+def node_pattern(node):
+    """Return a regex for one trie node, trying longer continuations first."""
+    branches = [re.escape(char) + node_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    ends_here = "" in node
+    if len(branches) == 1 and not ends_here:
+        return branches[0]
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if ends_here else group
+
+
+def trie_pattern(words):
+    """Compile a list of literal words into a trie-shaped regex."""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return node_pattern(trie)
+
+
+# Build the index and the combined pattern once at import time
+alias_index = build_alias_index()
+word_aliases = "|".join(re.escape(alias) + r"(?=[^\S\n]*(?:[-+.]?\d|$))" for alias in WORD_ALIASES)
+quantity_pattern = re.compile(
+    rf"(?<![\w.])(?P<value>{NUMBER})\s?"
+    rf"(?P<unit>{trie_pattern([alias for alias in alias_index if alias not in WORD_ALIASES])}|{word_aliases})"
+    r"(?![\w²³/])",
+    re.MULTILINE,
+)
+
+
+def parse_quantity(text):
+    """Return the first Quantity in a string, or raise ValueError."""
+    match = quantity_pattern.search(text)
+    if match is None:
+        raise ValueError(f"no quantity with a known unit in {text!r}")
+    value, unit = match.group("value", "unit")
+    unit, category = alias_index[unit]
+    return Quantity(float(value.replace(",", "")), unit, category)
+
+
+def find_quantities(text):
+    """Return every Quantity found in a string."""
+    return [
+        Quantity(float(value.replace(",", "")), *alias_index[unit])
+        for value, unit in quantity_pattern.findall(text)
+    ]
+
+
+def parse_many(lines):
+    """Yield the first Quantity of each line, or None when a line has none."""
+    search = quantity_pattern.search
+    index = alias_index
+    for line in lines:
+        match = search(line)
+        if match is None:
+            yield None
+        else:
+            value, unit = match.group("value", "unit")
+            unit, category = index[unit]
+            yield Quantity(float(value.replace(",", "")), unit, category)
+
+
+def parse_bulk(text):
+    """Scan a whole text blob in one pass; return parallel (values, units, categories) lists."""
+    values, units, category_names = [], [], []
+    index = alias_index
+    for value, unit in quantity_pattern.findall(text):
+        unit, category = index[unit]
+        values.append(float(value.replace(",", "")))
+        units.append(unit)
+        category_names.append(category)
+    return values, units, category_names
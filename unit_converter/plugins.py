@@ -0,0 +1,245 @@
+"""Units and categories loaded from declarative TOML or JSON files.
+
+A plugin file adds new categories, or new units to existing ones:
+
+    # radiation.toml
+    [categories."Radiation Dose"]
+    icon = "☢️"
+    description = "Absorbed dose. All units are converted through grays."
+
+    [categories."Radiation Dose".units]
+    Gray = 1
+    Rad = 0.01
+    Milligray = 0.001
+
+    [categories.Length.units]
+    Furlong = 201.168
+
+JSON files have the same layout (``{"categories": {...}}``). As in
+unit_definitions, a unit is its factor to the category's base unit, or a
+table with ``factor``, ``offset`` and ``reciprocal`` for affine or
+reciprocal units, which only new categories and the categories that
+already have such units (Temperature, Fuel Economy) accept.
+
+The files are listed in UNIT_CONVERTER_PLUGINS (files or directories of
+``*.toml`` / ``*.json``, separated by os.pathsep). They are validated and
+compiled into the unit registry, which is saved to a binary cache in
+UNIT_CONVERTER_CACHE (default ``~/.cache/unit_converter``). Later
+startups with the same file contents load the cache instead of parsing
+the files and rebuilding the factor matrices.
+"""
+import hashlib
+import json
+import math
+import os
+import pickle
+import tempfile
+
+# Bump when the compiled format changes, so old caches are rebuilt
+CACHE_VERSION = 1
+
+PLUGIN_EXTENSIONS = (".toml", ".json")
+
+# Each category keeps an n×n factor matrix, so its size is bounded
+MAX_CATEGORY_UNITS = 1000
+
+# Built-in categories whose units can't be extended from files
+FIXED_CATEGORIES = ("Currency",)  # units follow the exchange rates
+
+
+class PluginError(ValueError):
+    """A plugin file is unreadable or does not describe valid units."""
+
+
+def plugin_paths(spec=None):
+    """Return the plugin files named by spec (default: UNIT_CONVERTER_PLUGINS), in load order.
+
+    Directories contribute their *.toml and *.json files in name order.
+    """
+    if spec is None:
+        spec = os.environ.get("UNIT_CONVERTER_PLUGINS", "")
+    paths = []
+    for entry in spec.split(os.pathsep):
+        if not entry:
+            continue
+        if os.path.isdir(entry):
+            paths.extend(
+                os.path.join(entry, name) for name in sorted(os.listdir(entry))
+                if name.lower().endswith(PLUGIN_EXTENSIONS)
+            )
+        else:
+            paths.append(entry)
+    return [os.path.abspath(path) for path in paths]
+
+
+def cache_directory():
+    """Return the directory that holds compiled registry caches."""
+    default = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "unit_converter")
+    return os.environ.get("UNIT_CONVERTER_CACHE") or default
+
+
+def parse_plugin(path, data):
+    """Parse the bytes of a plugin file into its categories table."""
+    try:
+        if path.lower().endswith(".json"):
+            document = json.loads(data)
+        else:
+            try:
+                import tomllib
+            except ImportError:  # Python < 3.11
+                import tomli as tomllib
+            document = tomllib.loads(data.decode("utf-8"))
+    except ImportError:
+        raise PluginError(f"{path}: reading TOML files needs Python 3.11+ or the tomli package")
+    except ValueError as e:  # JSON, TOML and UTF-8 errors are all ValueErrors
+        raise PluginError(f"{path}: {e}")
+    if not isinstance(document, dict) or not isinstance(document.get("categories"), dict):
+        raise PluginError(f"{path}: expected a top-level 'categories' table")
+    return document["categories"]
+
+
+def unit_entry(where, spec):
+    """Validate one unit and return its unit_definitions entry."""
+    if isinstance(spec, dict):
+        unknown = set(spec) - {"factor", "offset", "reciprocal"}
+        if unknown:
+            raise PluginError(f"{where}: unknown keys {sorted(unknown)}")
+        if "factor" not in spec:
+            raise PluginError(f"{where}: missing 'factor'")
+        factor, offset, reciprocal = spec["factor"], spec.get("offset", 0), spec.get("reciprocal", False)
+    else:
+        factor, offset, reciprocal = spec, 0, False
+    for name, number in (("factor", factor), ("offset", offset)):
+        if isinstance(number, bool) or not isinstance(number, (int, float)) or not math.isfinite(number):
+            raise PluginError(f"{where}: {name} must be a finite number, got {number!r}")
+    if factor == 0:
+        raise PluginError(f"{where}: factor must not be zero")
+    if not isinstance(reciprocal, bool):
+        raise PluginError(f"{where}: reciprocal must be true or false, got {reciprocal!r}")
+    if reciprocal:
+        return (factor, offset, True)
+    if offset:
+        return (factor, offset)
+    return factor
+
+
+def merge_plugin(path, table, definitions, metadata, builtin):
+    """Validate a plugin's categories and merge them into definitions (in place)."""
+    for category, body in table.items():
+        where = f"{path}: category {category!r}"
+        if not category.strip():
+            raise PluginError(f"{path}: category names must not be empty")
+        if not isinstance(body, dict):
+            raise PluginError(f"{where}: expected a table")
+        if category in FIXED_CATEGORIES:
+            raise PluginError(f"{where}: units of this category can't be added from files")
+        unknown = set(body) - {"units", "icon", "description"}
+        if unknown:
+            raise PluginError(f"{where}: unknown keys {sorted(unknown)}")
+        units = body.get("units")
+        if not isinstance(units, dict) or not units:
+            raise PluginError(f"{where}: expected a non-empty 'units' table")
+        for key in ("icon", "description"):
+            if key in body and not isinstance(body[key], str):
+                raise PluginError(f"{where}: {key} must be a string")
+
+        if category not in definitions:
+            definitions[category] = {}
+            metadata[category] = {"icon": body.get("icon", "📦"), "description": body.get("description", "")}
+        elif category in builtin and ("icon" in body or "description" in body):
+            raise PluginError(f"{where}: icon and description of built-in categories can't be changed")
+        table = definitions[category]
+        # Only categories that already convert through transforms may gain offset or reciprocal units
+        plain_only = category in builtin and not any(isinstance(spec, tuple) for spec in builtin[category].values())
+        for name, spec in units.items():
+            unit_where = f"{where}, unit {name!r}"
+            if not name.strip():
+                raise PluginError(f"{where}: unit names must not be empty")
+            if name in table:
+                raise PluginError(f"{unit_where}: already defined")
+            entry = unit_entry(unit_where, spec)
+            if plain_only and isinstance(entry, tuple):
+                raise PluginError(f"{unit_where}: {category} units must be plain factors")
+            table[name] = entry
+        if len(table) > MAX_CATEGORY_UNITS:
+            raise PluginError(f"{where}: more than {MAX_CATEGORY_UNITS} units")
+
+
+def compile_plugins(sources, builtin):
+    """Validate (path, bytes) sources and return (definitions, metadata) with the plugins merged in.
+
+    metadata maps each new category to its icon and description.
+    """
+    definitions = {category: dict(table) for category, table in builtin.items()}
+    metadata = {}
+    for path, data in sources:
+        merge_plugin(path, parse_plugin(path, data), definitions, metadata, builtin)
+    return definitions, metadata
+
+
+def load_registry(builtin, paths=None):
+    """Return (registry, metadata) for the built-in definitions plus the plugin files.
+
+    Without plugin files this is just UnitRegistry(builtin). Otherwise the
+    compiled registry comes from the cache when the built-in definitions
+    and every file are unchanged, and is compiled and cached if not.
+    """
+    from .registry import UnitRegistry
+
+    paths = plugin_paths() if paths is None else paths
+    if not paths:
+        return UnitRegistry(builtin), {}
+    sources = []
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                sources.append((path, f.read()))
+        except OSError as e:
+            raise PluginError(f"{path}: {e}")
+
+    key = hashlib.sha256(repr((CACHE_VERSION, builtin)).encode())
+    for path, data in sources:
+        key.update(path.encode() + b"\0" + hashlib.sha256(data).digest())
+    # One cache file per set of plugin paths, holding the key of the contents it was built from
+    name = hashlib.sha256("\0".join(paths).encode()).hexdigest()[:16]
+    cache_path = os.path.join(cache_directory(), f"registry-{name}.pickle")
+    compiled = read_cache(cache_path, key.digest())
+    if compiled is not None:
+        try:
+            state, metadata = compiled
+            return UnitRegistry.from_compiled(state), metadata
+        except Exception:
+            # A payload that unpickles but has the wrong shape is rebuilt like a damaged file
+            pass
+
+    definitions, metadata = compile_plugins(sources, builtin)
+    registry = UnitRegistry(definitions)
+    write_cache(cache_path, key.digest(), (registry.compiled(), metadata))
+    return registry, metadata
+
+
+def read_cache(path, key):
+    """Return the cached payload if the file exists and was built for key, else None."""
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(key)) != key:
+                return None
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        # A missing, stale or damaged cache is rebuilt
+        return None
+
+
+def write_cache(path, key, payload):
+    """Write the payload atomically; a cache that can't be written is skipped."""
+    temporary = None
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+    except OSError:
+        if temporary is not None and os.path.exists(temporary):
+            os.remove(temporary)
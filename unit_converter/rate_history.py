@@ -0,0 +1,225 @@
+"""Historical exchange rates with as-of date lookups.
+
+Rates are loaded from local CSV files, either in long form
+
+    date,currency,rate
+    2024-01-02,EUR,0.9112
+
+or wide form, with one column per currency (``date,EUR,GBP,...``). Like
+``exchange_rates``, a rate is the number of units per US dollar. Each
+currency keeps a sorted array of dates, so finding the rate in force on a
+given day (the latest quote on or before it) is a binary search:
+
+    history = RateHistory.from_csv("rates.csv")
+    history.convert(100, "EUR", "JPY", "2019-06-30")
+    history.convert_many(amounts, dates, from_codes, to_codes)  # NumPy columns
+    set_rate_provider(HistoricalRateProvider(history, "2019-06-30"))
+
+Per-day lookups are cached, and the vectorized path resolves each distinct
+(day, currency) only once however many transactions share it.
+"""
+import csv
+import datetime
+import functools
+
+import numpy as np
+
+from .rates import RateProvider
+
+# The base currency every rate is quoted against
+BASE_CURRENCY = "USD"
+
+
+def to_day(date):
+    """Return a date (date, datetime, datetime64 or ISO string) as numpy datetime64[D]."""
+    if isinstance(date, datetime.datetime):
+        date = date.date()
+    return np.datetime64(date, "D")
+
+
+class RateHistory:
+    """Per-currency sorted rate series with as-of lookups."""
+
+    def __init__(self):
+        self._days = {}   # currency -> sorted datetime64[D] array
+        self._rates = {}  # currency -> float64 array aligned with _days
+        # Same-day lookups are served from per-instance caches
+        self.rate_on = functools.lru_cache(maxsize=65536)(self._rate_on)
+        self.rates_on = functools.lru_cache(maxsize=1024)(self._rates_on)
+
+    @classmethod
+    def from_csv(cls, *paths):
+        """Load one or more long- or wide-form CSV files."""
+        history = cls()
+        for path in paths:
+            history.load_csv(path)
+        return history
+
+    def load_csv(self, path):
+        """Add the quotes in a CSV file (later files override the same day)."""
+        quotes = {}
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = [name.strip() for name in next(reader)]
+            long_form = [name.lower() for name in header] == ["date", "currency", "rate"]
+            for row in reader:
+                if not row:
+                    continue
+                if long_form:
+                    quotes.setdefault(row[1].strip(), []).append((row[0], float(row[2])))
+                else:
+                    for currency, rate in zip(header[1:], row[1:]):
+                        if rate.strip():
+                            quotes.setdefault(currency, []).append((row[0], float(rate)))
+        for currency, series in quotes.items():
+            dates, rates = zip(*series)
+            self.add(currency, dates, rates)
+
+    def add(self, currency, dates, rates):
+        """Merge quotes for one currency into its sorted series."""
+        days = np.asarray(dates, dtype="datetime64[D]")
+        rates = np.asarray(rates, dtype=np.float64)
+        if currency in self._days:
+            days = np.concatenate((self._days[currency], days))
+            rates = np.concatenate((self._rates[currency], rates))
+        # Sort by day; for duplicate days keep the quote added last
+        order = np.argsort(days, kind="stable")
+        days, rates = days[order], rates[order]
+        keep = np.append(days[1:] != days[:-1], True)
+        self._days[currency] = days[keep]
+        self._rates[currency] = rates[keep]
+        self.rate_on.cache_clear()
+        self.rates_on.cache_clear()
+
+    def currencies(self):
+        """Return the currency codes with history (plus the base currency)."""
+        return sorted(set(self._days) | {BASE_CURRENCY})
+
+    def date_range(self, currency):
+        """Return the first and last quoted day of a currency."""
+        days = self._days[currency]
+        return days[0], days[-1]
+
+    def _rate_on(self, currency, day):
+        """Return the rate in force on a day: the latest quote on or before it."""
+        if currency == BASE_CURRENCY:
+            return 1.0
+        if currency not in self._days:
+            raise KeyError(f"no rate history for {currency!r}")
+        days = self._days[currency]
+        index = int(np.searchsorted(days, to_day(day), side="right")) - 1
+        if index < 0:
+            raise KeyError(f"no {currency} rate on or before {day}")
+        return float(self._rates[currency][index])
+
+    def _rates_on(self, day):
+        """Return {currency: rate} for every currency quoted on or before a day."""
+        rates = {BASE_CURRENCY: 1.0}
+        for currency in self._days:
+            try:
+                rates[currency] = self.rate_on(currency, day)
+            except KeyError:
+                continue
+        return rates
+
+    def convert(self, value, from_currency, to_currency, date):
+        """Convert an amount at the rates in force on a date."""
+        day = str(to_day(date))
+        return value / self.rate_on(from_currency, day) * self.rate_on(to_currency, day)
+
+    def rates_for(self, currency, days):
+        """Vectorized rate_on(): return the rates of one currency for an array of days."""
+        days = np.asarray(days, dtype="datetime64[D]")
+        if currency == BASE_CURRENCY:
+            return np.ones(days.shape)
+        if currency not in self._days:
+            raise KeyError(f"no rate history for {currency!r}")
+        indexes = np.searchsorted(self._days[currency], days, side="right") - 1
+        if len(indexes) and indexes.min() < 0:
+            first = days[indexes < 0].min()
+            raise KeyError(f"no {currency} rate on or before {first}")
+        return self._rates[currency][indexes]
+
+    def convert_many(self, values, dates, from_currencies, to_currencies):
+        """Convert a column of transactions, each at the rates of its own date.
+
+        from_currencies and to_currencies are arrays of codes or single codes
+        shared by every row. Returns a float64 array.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        days = np.asarray(dates, dtype="datetime64[D]").reshape(values.shape)
+        if not values.size:
+            return values.copy()
+        # Look up each day once into a (day, currency) table, then gather the rows
+        first, last = days.min(), days.max()
+        span = int((last - first) // np.timedelta64(1, "D")) + 1
+        if span <= max(values.size, 4096):
+            table_days = np.arange(first, last + np.timedelta64(1, "D"))
+            day_index = days.view(np.int64) - first.astype(np.int64)
+        else:
+            table_days, day_index = np.unique(days, return_inverse=True)
+            day_index = day_index.reshape(values.shape)
+        codes, from_index = self._currency_index(from_currencies, values.shape, [])
+        codes, to_index = self._currency_index(to_currencies, values.shape, codes)
+        table = np.empty((len(table_days), len(codes)))
+        for column, currency in enumerate(codes):
+            table[:, column] = self._rates_or_nan(currency, table_days)
+        # Flat positions into the table are cheaper to gather than 2-D indexes
+        day_index *= len(codes)
+        table = table.ravel()
+        from_rates = table.take(day_index + from_index)
+        to_rates = table.take(day_index + to_index)
+        # Only cells a row actually uses must exist: a currency may start later than the first row
+        for rates, index in ((from_rates, from_index), (to_rates, to_index)):
+            missing = np.isnan(rates)
+            if missing.any():
+                row = np.flatnonzero(missing.ravel())[0]
+                currency = codes[index.ravel()[row]]
+                raise KeyError(f"no {currency} rate on or before {days.ravel()[row]}")
+        return values / from_rates * to_rates
+
+    def _rates_or_nan(self, currency, days):
+        """Like rates_for(), but NaN for days before the currency's first quote."""
+        if currency == BASE_CURRENCY:
+            return np.ones(days.shape)
+        indexes = np.searchsorted(self._days[currency], days, side="right") - 1
+        rates = self._rates[currency].take(np.maximum(indexes, 0))
+        rates[indexes < 0] = np.nan
+        return rates
+
+    def _currency_index(self, currencies, shape, codes):
+        """Return (codes, position of each row's currency in codes), extending codes."""
+        codes = list(codes)
+        if isinstance(currencies, str):
+            if currencies not in self.currencies():
+                raise KeyError(f"no rate history for {currencies!r}")
+            if currencies not in codes:
+                codes.append(currencies)
+            return codes, np.full(shape, codes.index(currencies), dtype=np.intp)
+        currencies = np.asarray(currencies).reshape(shape)
+        index = np.zeros(shape, dtype=np.intp)
+        matched = 0
+        # One comparison pass per known code is much cheaper than sorting the column
+        for currency in self.currencies():
+            rows = currencies == currency
+            count = np.count_nonzero(rows)
+            if count:
+                if currency not in codes:
+                    codes.append(currency)
+                np.copyto(index, codes.index(currency), where=rows)
+                matched += count
+        if matched < currencies.size:
+            unknown = currencies[~np.isin(currencies, self.currencies())]
+            raise KeyError(f"no rate history for {str(unknown.flat[0])!r}")
+        return codes, index
+
+
+class HistoricalRateProvider(RateProvider):
+    """Serve the rates in force on a fixed date, for set_rate_provider()."""
+
+    def __init__(self, history, date):
+        self.history = history
+        self.day = str(to_day(date))
+
+    def fetch(self):
+        return dict(self.history.rates_on(self.day))
@@ -0,0 +1,207 @@
+"""Exchange-rate providers and an in-process TTL cache for currency conversion.
+
+Rates are expressed per US dollar, like ``exchange_rates``. Conversions read
+from ``rate_cache``, which serves cached rates, refreshes stale ones in the
+background (stale-while-revalidate) and can keep itself warm with a
+periodic refresh thread, so conversions never wait on file or network I/O
+once the cache is filled.
+
+    from unit_converter.rates import HttpRateProvider, set_rate_provider
+    set_rate_provider(HttpRateProvider("https://example.com/rates.json"),
+                      ttl=3600, refresh_interval=900)
+"""
+import json
+import threading
+import time
+
+from .units import exchange_rates
+
+
+class RateProvider:
+    """Source of exchange rates; subclasses implement fetch()."""
+
+    def fetch(self):
+        """Return a dict of currency code -> units per US dollar."""
+        raise NotImplementedError
+
+
+def parse_rates(data):
+    """Accept either {"USD": 1.0, ...} or {"rates": {...}} and return floats."""
+    rates = data.get("rates", data)
+    return {currency: float(rate) for currency, rate in rates.items()}
+
+
+class StaticRateProvider(RateProvider):
+    """Serve a fixed set of canned rates (the built-in table by default)."""
+
+    def __init__(self, rates=None):
+        self.rates = dict(exchange_rates if rates is None else rates)
+        self.fetches = 0
+
+    def fetch(self):
+        self.fetches += 1
+        return dict(self.rates)
+
+
+class FileRateProvider(RateProvider):
+    """Read rates from a local JSON file."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def fetch(self):
+        with open(self.path, encoding="utf-8") as f:
+            return parse_rates(json.load(f))
+
+
+class HttpRateProvider(RateProvider):
+    """Fetch rates from an HTTP endpoint that returns JSON."""
+
+    def __init__(self, url, timeout=10):
+        self.url = url
+        self.timeout = timeout
+
+    def fetch(self):
+        # Imported here: urllib.request costs more than the rest of the package import
+        import urllib.request
+
+        with urllib.request.urlopen(self.url, timeout=self.timeout) as response:
+            return parse_rates(json.load(response))
+
+
+class RateCache:
+    """TTL cache in front of a RateProvider with stale-while-revalidate.
+
+    Fresh rates are served directly. Once older than ``ttl`` seconds they are
+    still served while a background refresh runs. Only the very first lookup
+    (an empty cache) fetches synchronously. After a failed refresh the stale
+    rates are kept and the provider isn't asked again for ``retry_interval``
+    seconds.
+    """
+
+    def __init__(self, provider, ttl=3600, retry_interval=60):
+        self.provider = provider
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+        self._rates = None
+        self._fetched_at = 0.0
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._stop = threading.Event()
+        self._thread = None
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.last_refresh_seconds = 0.0
+        self.total_refresh_seconds = 0.0
+
+    def get_rates(self):
+        """Return the current rates dict without blocking on I/O when possible."""
+        rates = self._rates
+        if rates is None:
+            self.misses += 1
+            self.refresh()
+            return self._rates
+        now = time.monotonic()
+        if now - self._fetched_at > self.ttl:
+            self.stale_hits += 1
+            if now >= self._retry_at:
+                self._refresh_in_background()
+        else:
+            self.hits += 1
+        return rates
+
+    def refresh(self):
+        """Fetch rates from the provider now and update the cache."""
+        start = time.perf_counter()
+        try:
+            rates = self.provider.fetch()
+        except Exception:
+            with self._lock:
+                self.refresh_errors += 1
+                self._retry_at = time.monotonic() + self.retry_interval
+            if self._rates is None:
+                raise
+            return
+        finally:
+            elapsed = time.perf_counter() - start
+            self.last_refresh_seconds = elapsed
+            self.total_refresh_seconds += elapsed
+        with self._lock:
+            self._rates = rates
+            self._fetched_at = time.monotonic()
+            self.refreshes += 1
+
+    def _refresh_in_background(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(target=run, name="rate-refresh", daemon=True).start()
+
+    def start_background_refresh(self, interval):
+        """Refresh every ``interval`` seconds on a daemon thread."""
+        self.stop_background_refresh()
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(interval):
+                self.refresh()
+
+        if self._rates is None:
+            self.refresh()
+        self._thread = threading.Thread(target=run, name="rate-refresh-loop", daemon=True)
+        self._thread.start()
+
+    def stop_background_refresh(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def stats(self):
+        """Return hit/miss/refresh counters."""
+        refreshes = self.refreshes or 1
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+            "last_refresh_seconds": self.last_refresh_seconds,
+            "mean_refresh_seconds": self.total_refresh_seconds / refreshes,
+        }
+
+
+# Shared cache used by currency_conversion (the built-in table by default)
+rate_cache = RateCache(StaticRateProvider())
+
+
+def set_rate_provider(provider, ttl=3600, refresh_interval=None, retry_interval=60):
+    """Swap the provider behind currency conversions and return the new cache.
+
+    With ``refresh_interval`` set, a daemon thread keeps the rates warm so
+    conversions never wait on the provider.
+    """
+    global rate_cache
+    rate_cache.stop_background_refresh()
+    rate_cache = RateCache(provider, ttl=ttl, retry_interval=retry_interval)
+    if refresh_interval:
+        rate_cache.start_background_refresh(refresh_interval)
+    return rate_cache
+
+
+def get_exchange_rates():
+    """Return the current rates from the shared cache."""
+    return rate_cache.get_rates()
@@ -0,0 +1,247 @@
+"""Precompiled, immutable unit registry shared by all conversions.
+
+The registry holds the built-in unit_definitions plus any units loaded from
+plugin files (see plugins.py).
+"""
+from array import array
+from collections import namedtuple
+from itertools import chain
+
+from .plugins import load_registry
+from .transforms import Transform, as_transform, between, closed_form
+from .units import unit_definitions
+
+# Unit registry
+Unit = namedtuple("Unit", ["id", "name", "category", "factor", "offset", "reciprocal"])
+
+# Categories with more units than this keep their pair transforms packed as floats
+PACKED_TRANSFORM_UNITS = 64
+
+def unit_spec(spec):
+    """Normalize a unit_definitions entry to (factor, offset, reciprocal)."""
+    if not isinstance(spec, tuple):
+        return float(spec), 0.0, False
+    if len(spec) == 2:
+        return float(spec[0]), float(spec[1]), False
+    if len(spec) == 3:
+        return float(spec[0]), float(spec[1]), bool(spec[2])
+    # An (a, b, c, d) transform: base = (a * value + b) / (c * value + d)
+    a, b, c, d = closed_form(as_transform(spec))
+    if c == 0:
+        return a / d, b / d, False
+    if d == 0:
+        return b / c, a / c, True
+    raise ValueError(f"unit transform {spec!r} is neither affine nor reciprocal")
+
+def transform_coefficients(transform):
+    """Express a float Transform as (scale, offset, reciprocal) when it is affine or reciprocal."""
+    a, b, c, d = transform
+    if c == 0:
+        return a / d, b / d, False
+    if a == 0 and d == 0:
+        return b / c, 0.0, True
+    raise ValueError(f"transform {tuple(transform)} is neither affine nor reciprocal")
+
+class TransformTable:
+    """Read-only sequence of a category's pair Transforms, packed four floats each."""
+    __slots__ = ("coefficients",)
+
+    def __init__(self, coefficients):
+        self.coefficients = coefficients
+
+    def __len__(self):
+        return len(self.coefficients) // 4
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return tuple(self[i] for i in range(*k.indices(len(self))))
+        i = 4 * (k if k >= 0 else k + len(self))
+        return Transform(*self.coefficients[i:i + 4])
+
+def pair_transform(source, target):
+    """Return closed_form(between(source, target)) for two exact unit transforms."""
+    if source.b == source.c == target.b == target.c == 0 and source.d == target.d == 1:
+        # Two plain factors: the normalized transform is the reduced ratio
+        ratio = source.a / target.a
+        return Transform(float(ratio.numerator), 0.0, 0.0, float(ratio.denominator))
+    return closed_form(between(source, target))
+
+class UnitRegistry:
+    """Immutable table of every unit, built once from the unit definitions.
+
+    Units get consecutive integer IDs grouped by category, and every category
+    has a precomputed from→to factor matrix, so a conversion is an index
+    lookup plus one multiply.
+
+    Categories with offset or reciprocal units (Temperature, Fuel Economy)
+    also keep each pair's closed-form Transform, composed exactly from the
+    units' transforms to the base unit.
+    """
+    __slots__ = ("_definitions", "_units", "_ids", "_starts", "_sizes", "_names", "_scales", "_transforms")
+
+    def __init__(self, definitions):
+        units = []
+        ids = {}
+        starts = {}
+        sizes = {}
+        names = {}
+        scales = {}
+        transforms = {}
+        
+        for category, table in definitions.items():
+            start = len(units)
+            for name, spec in table.items():
+                factor, offset, reciprocal = unit_spec(spec)
+                ids[(category, name)] = len(units)
+                units.append(Unit(len(units), name, category, factor, offset, reciprocal))
+            
+            # Precompute the from→to matrix (row = from unit, column = to unit)
+            members = units[start:]
+            n = len(members)
+            scale = array("d", bytes(8 * n * n))
+            if any(isinstance(spec, tuple) for spec in table.values()):
+                # Compose every pair exactly, then keep the float closed form
+                exact = [as_transform(spec) for spec in table.values()]
+                pairs = tuple(pair_transform(a, b) for a in exact for b in exact)
+                for k, pair in enumerate(pairs):
+                    try:
+                        scale[k] = transform_coefficients(pair)[0]
+                    except ValueError:
+                        scale[k] = float('nan')
+                if n > PACKED_TRANSFORM_UNITS:
+                    pairs = TransformTable(array("d", chain.from_iterable(pairs)))
+                transforms[category] = pairs
+            else:
+                for i, a in enumerate(members):
+                    for j, b in enumerate(members):
+                        scale[i * n + j] = a.factor / b.factor
+            
+            starts[category] = start
+            sizes[category] = n
+            names[category] = tuple(unit.name for unit in members)
+            scales[category] = scale
+        
+        set_slot = object.__setattr__
+        set_slot(self, "_definitions", definitions)
+        set_slot(self, "_units", tuple(units))
+        set_slot(self, "_ids", ids)
+        set_slot(self, "_starts", starts)
+        set_slot(self, "_sizes", sizes)
+        set_slot(self, "_names", names)
+        set_slot(self, "_scales", scales)
+        set_slot(self, "_transforms", transforms)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("UnitRegistry is immutable")
+
+    def __reduce__(self):
+        return UnitRegistry, (self._definitions,)
+
+    def compiled(self):
+        """Return the built tables as plain data, for from_compiled() (used by the plugin cache)."""
+        transforms = {
+            category: pairs.coefficients if isinstance(pairs, TransformTable) else [tuple(pair) for pair in pairs]
+            for category, pairs in self._transforms.items()
+        }
+        return (self._definitions, [tuple(unit) for unit in self._units], self._starts, self._sizes,
+                self._names, self._scales, transforms)
+
+    @classmethod
+    def from_compiled(cls, state):
+        """Rebuild a registry from compiled() output without recomputing any matrix."""
+        definitions, units, starts, sizes, names, scales, transforms = state
+        units = tuple(map(Unit._make, units))
+        self = object.__new__(cls)
+        set_slot = object.__setattr__
+        set_slot(self, "_definitions", definitions)
+        set_slot(self, "_units", units)
+        set_slot(self, "_ids", {(unit.category, unit.name): unit.id for unit in units})
+        set_slot(self, "_starts", starts)
+        set_slot(self, "_sizes", sizes)
+        set_slot(self, "_names", names)
+        set_slot(self, "_scales", scales)
+        set_slot(self, "_transforms", {
+            category: TransformTable(pairs) if isinstance(pairs, array) else tuple(map(Transform._make, pairs))
+            for category, pairs in transforms.items()
+        })
+        return self
+
+    def __len__(self):
+        return len(self._units)
+
+    def categories(self):
+        """Return the category names in display order."""
+        return tuple(self._starts)
+
+    def units(self, category):
+        """Return the unit names of a category in display order."""
+        return self._names[category]
+
+    def unit(self, category, name):
+        """Return the Unit record for a unit name within a category."""
+        return self._units[self._ids[(category, name)]]
+
+    def unit_by_id(self, unit_id):
+        """Return the Unit record for an integer unit ID."""
+        return self._units[unit_id]
+
+    def matrix(self, category):
+        """Return a read-only view of the category's n×n scale matrix."""
+        return memoryview(self._scales[category]).toreadonly()
+
+    def linear(self, category):
+        """Return True when every pair in the category is a plain multiplier."""
+        return category not in self._transforms
+
+    def row(self, category, from_unit):
+        """Return the multipliers from from_unit to every unit of a linear category."""
+        n = self._sizes[category]
+        i = self._ids[(category, from_unit)] - self._starts[category]
+        return self._scales[category][i * n:(i + 1) * n]
+
+    def transforms_from(self, category, from_unit):
+        """Return the Transforms from from_unit to every unit of the category."""
+        n = self._sizes[category]
+        i = self._ids[(category, from_unit)] - self._starts[category]
+        if category in self._transforms:
+            return self._transforms[category][i * n:(i + 1) * n]
+        return tuple(Transform(scale, 0.0, 0.0, 1.0) for scale in self.row(category, from_unit))
+
+    def factor(self, category, from_unit, to_unit):
+        """Return the multiplier that converts from_unit to to_unit."""
+        start = self._starts[category]
+        i = self._ids[(category, from_unit)] - start
+        j = self._ids[(category, to_unit)] - start
+        return self._scales[category][i * self._sizes[category] + j]
+
+    def transform(self, category, from_unit, to_unit):
+        """Return the closed-form Transform (a, b, c, d) converting from_unit to to_unit.
+
+        The result is (a * value + b) / (c * value + d).
+        """
+        start = self._starts[category]
+        i = self._ids[(category, from_unit)] - start
+        j = self._ids[(category, to_unit)] - start
+        k = i * self._sizes[category] + j
+        if category in self._transforms:
+            return self._transforms[category][k]
+        return Transform(self._scales[category][k], 0.0, 0.0, 1.0)
+
+    def coefficients(self, category, from_unit, to_unit):
+        """Return (scale, offset, reciprocal) for converting from_unit to to_unit.
+
+        The result is value * scale + offset, or scale / value when reciprocal
+        is True.
+        """
+        start = self._starts[category]
+        i = self._ids[(category, from_unit)] - start
+        j = self._ids[(category, to_unit)] - start
+        k = i * self._sizes[category] + j
+        if category in self._transforms:
+            return transform_coefficients(self._transforms[category][k])
+        return self._scales[category][k], 0.0, False
+
+# Build the registry once at import time, with the units of any plugin files
+# (UNIT_CONVERTER_PLUGINS); plugin_categories holds the icon and description
+# of each category they add
+registry, plugin_categories = load_registry(unit_definitions)
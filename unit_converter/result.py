@@ -0,0 +1,48 @@
+"""Conversion result with lazily rendered formula text."""
+
+
+class ConversionResult:
+    """The value of a conversion plus its formula, rendered only when accessed.
+
+    Unpacks like the ``(result, formula)`` tuple the conversion functions
+    used to return, so ``result, formula = length_conversion(...)`` still
+    works.
+    """
+    __slots__ = ("value", "_render", "_args", "_formula")
+
+    def __init__(self, value, render, *args):
+        self.value = value
+        self._render = render
+        self._args = args
+        self._formula = None
+
+    @property
+    def formula(self):
+        # Render the formula text on first access only
+        if self._formula is None:
+            self._formula = self._render(self.value, *self._args)
+        return self._formula
+
+    def formula_as(self, number_format):
+        """Render the formula with a NumberFormat (from formatting.number_format)."""
+        return self._render(self.value, *self._args, number_format=number_format)
+
+    def __iter__(self):
+        yield self.value
+        yield self.formula
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, index):
+        if index in (0, -2):
+            return self.value
+        if index in (1, -1):
+            return self.formula
+        raise IndexError("ConversionResult index out of range")
+
+    def __float__(self):
+        return float(self.value)
+
+    def __repr__(self):
+        return f"ConversionResult(value={self.value!r})"
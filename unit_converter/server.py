@@ -0,0 +1,232 @@
+"""Lightweight asyncio HTTP API over the conversion functions.
+
+Endpoints:
+
+    GET  /convert?value=1&category=Length&from=Mile&to=Meter[&formula=1]
+    POST /convert   {"value": 1, "category": "Length", "from": "Mile", "to": "Meter"}
+    POST /batch     {"items": [[1, "Length", "Mile", "Meter"], ...]}
+    GET  /stats     request and coalescing counters
+    GET  /metrics   Prometheus text (with UNIT_CONVERTER_METRICS=1)
+    GET  /health
+
+Connections are kept alive between requests (HTTP/1.1). Identical single
+conversions that arrive together are coalesced into one computation, and
+batch requests run on a worker thread pool so large batches don't block
+the event loop. Results that aren't finite (0 km/L in L/100km, say) are
+returned as null, since JSON has no Infinity or NaN; single conversions
+add an "error" field saying why. Run with:
+
+    python -m unit_converter.server --port 8000
+"""
+import argparse
+import asyncio
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from . import metrics
+from .conversions import categories
+
+MAX_BODY_BYTES = 64 << 20
+
+
+def check_units(category, from_unit, to_unit):
+    """Raise KeyError with a readable message for an unknown category or unit."""
+    if category not in categories:
+        raise KeyError(f"unknown category {category!r}")
+    for unit in (from_unit, to_unit):
+        if unit not in categories[category]["units"]:
+            raise KeyError(f"unknown {category} unit {unit!r}")
+
+
+def convert_one(value, category, from_unit, to_unit, with_formula=False):
+    """Convert a single value, returning a JSON-ready dict."""
+    check_units(category, from_unit, to_unit)
+    conversion = categories[category]["conversion_function"](value, from_unit, to_unit)
+    if not math.isfinite(conversion.value):
+        response = {"result": None, "error": f"the result is not finite ({conversion.value})"}
+    else:
+        response = {"result": conversion.value}
+    if with_formula:
+        response["formula"] = conversion.formula
+    return response
+
+
+def convert_many(items):
+    """Convert a list of (value, category, from, to) tuples, grouped by unit pair.
+
+    Results that aren't finite are None.
+    """
+    from .batch import batch_conversion
+
+    groups = {}
+    for position, item in enumerate(items):
+        if len(item) != 4:
+            raise ValueError(f"item {position} must be [value, category, from, to]")
+        groups.setdefault(tuple(item[1:]), []).append(position)
+
+    results = [None] * len(items)
+    for (category, from_unit, to_unit), positions in groups.items():
+        check_units(category, from_unit, to_unit)
+        values = [float(items[p][0]) for p in positions]
+        converted = batch_conversion(values, category, from_unit, to_unit).tolist()
+        for position, result in zip(positions, converted):
+            results[position] = result if math.isfinite(result) else None
+    return results
+
+
+class Coalescer:
+    """Merge identical single conversions that arrive in the same loop tick."""
+
+    def __init__(self):
+        self._pending = {}
+        self.requests = 0
+        self.computations = 0
+
+    def convert(self, key):
+        loop = asyncio.get_running_loop()
+        self.requests += 1
+        future = self._pending.get(key)
+        if future is None:
+            if not self._pending:
+                loop.call_soon(self._flush)
+            future = self._pending[key] = loop.create_future()
+        return future
+
+    def _flush(self):
+        pending, self._pending = self._pending, {}
+        for key, future in pending.items():
+            self.computations += 1
+            try:
+                future.set_result(convert_one(*key))
+            except Exception as e:
+                future.set_exception(e)
+
+
+class ConversionServer:
+    """HTTP/1.1 server with keep-alive, request coalescing and batch workers."""
+
+    def __init__(self, workers=None):
+        self.coalescer = Coalescer()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="convert")
+        self.batch_requests = 0
+        self.batch_items = 0
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_BYTES:
+                    status, payload = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "request body too large"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    connection = headers.get("connection", "").lower()
+                    if version == "HTTP/1.0":
+                        keep_alive = connection == "keep-alive"
+                    else:
+                        keep_alive = connection != "close"
+                    status, payload = await self.dispatch(method, target, body)
+
+                if isinstance(payload, str):
+                    data, content_type = payload.encode(), "text/plain; version=0.0.4"
+                else:
+                    data, content_type = json.dumps(payload, allow_nan=False).encode(), "application/json"
+                writer.write(
+                    f"{version} {status.value} {status.phrase}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1")
+                    + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, target, body):
+        """Route a request and return (HTTPStatus, JSON payload)."""
+        url = urlsplit(target)
+        try:
+            if url.path == "/convert" and method == "GET":
+                query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                return HTTPStatus.OK, await self.convert(query)
+            if url.path == "/convert" and method == "POST":
+                return HTTPStatus.OK, await self.convert(json.loads(body))
+            if url.path == "/batch" and method == "POST":
+                return HTTPStatus.OK, await self.batch(json.loads(body))
+            if url.path == "/stats" and method == "GET":
+                return HTTPStatus.OK, self.stats()
+            if url.path == "/metrics" and method == "GET":
+                return HTTPStatus.OK, metrics.render()
+            if url.path == "/health" and method == "GET":
+                return HTTPStatus.OK, {"status": "ok"}
+        except (KeyError, ValueError, TypeError) as e:
+            message = e.args[0] if isinstance(e, KeyError) and e.args else str(e)
+            return HTTPStatus.BAD_REQUEST, {"error": str(message)}
+        return HTTPStatus.NOT_FOUND, {"error": f"no route for {method} {url.path}"}
+
+    async def convert(self, request):
+        key = (
+            float(request["value"]),
+            request["category"],
+            request["from"],
+            request["to"],
+            str(request.get("formula", "")).lower() in ("1", "true"),
+        )
+        return await self.coalescer.convert(key)
+
+    async def batch(self, request):
+        items = request["items"]
+        self.batch_requests += 1
+        self.batch_items += len(items)
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(self.executor, convert_many, items)
+        return {"results": results}
+
+    def stats(self):
+        return {
+            "convert_requests": self.coalescer.requests,
+            "convert_computations": self.coalescer.computations,
+            "batch_requests": self.batch_requests,
+            "batch_items": self.batch_items,
+        }
+
+    async def serve(self, host="127.0.0.1", port=8000):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve unit conversions over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=None, help="batch worker threads")
+    args = parser.parse_args(argv)
+    print(f"Serving unit conversions on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(ConversionServer(workers=args.workers).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Normalize telemetry time series to one unit and downsample them.
+
+Records are (timestamp, value, unit) tuples whose unit may change partway
+through a stream (say a firmware switch from PSI to Bar). normalize()
+converts each value to a single target unit and resample() aggregates the
+result into fixed windows, both as generators in constant memory:
+
+    points = normalize(read_records(), "Pressure", "Pascal")
+    for window in resample(points, interval=60):
+        print(window.start, window.mean, window.min, window.max)
+
+Timestamps are numbers (for example Unix seconds) and must not decrease.
+A NaN value makes its window's mean NaN but is skipped by min and max
+(which are NaN only when every value in the window is).
+For large volumes, normalize_chunks() and resample_chunks() do the same
+work on NumPy arrays a chunk at a time.
+"""
+import functools
+import math
+from collections import namedtuple
+
+from .rates import get_exchange_rates
+from .registry import registry
+from .transforms import Transform, evaluate
+
+Window = namedtuple("Window", ["start", "count", "mean", "min", "max"])
+
+
+def unit_transform(category, from_unit, to_unit):
+    """Return the Transform for a pair, reading currency rates from the rate cache."""
+    if category == "Currency":
+        exchange_rates = get_exchange_rates()
+        return Transform(exchange_rates[to_unit] / exchange_rates[from_unit], 0.0, 0.0, 1.0)
+    return registry.transform(category, from_unit, to_unit)
+
+
+def converter(category, from_unit, to_unit):
+    """Return a one-argument function converting from_unit values to to_unit."""
+    transform = unit_transform(category, from_unit, to_unit)
+    a, b, c, d = transform
+    if c == 0:
+        # Affine: the same (a * value + b) / d the category function evaluates
+        return lambda value: (a * value + b) / d
+    return functools.partial(evaluate, transform)
+
+
+def normalize(records, category, to_unit):
+    """Yield (timestamp, value) with every value converted to to_unit.
+
+    The conversion is only looked up again when the unit changes, so a
+    stream costs one multiply-add per point.
+    """
+    current_unit = None
+    convert = None
+    for timestamp, value, unit in records:
+        if unit != current_unit:
+            convert = converter(category, unit, to_unit)
+            current_unit = unit
+        yield timestamp, convert(value)
+
+
+def resample(points, interval, origin=0.0):
+    """Aggregate (timestamp, value) points into Windows of `interval` seconds.
+
+    Each Window is yielded as soon as a point past its end arrives (the last
+    one when the stream ends). Windows start at origin + k * interval;
+    windows with no points are skipped.
+    """
+    window_id = None
+    count = 0
+    total = 0.0
+    low = high = 0.0
+    for timestamp, value in points:
+        point_window = math.floor((timestamp - origin) / interval)
+        if point_window != window_id:
+            if window_id is not None:
+                if point_window < window_id:
+                    raise ValueError(f"timestamp {timestamp} is earlier than the previous window")
+                yield Window(origin + window_id * interval, count, total / count, low, high)
+            window_id, count, total, low, high = point_window, 0, 0.0, value, value
+        count += 1
+        total += value
+        # A NaN low/high (from a leading NaN) gives way to the first number
+        if value < low or low != low:
+            low = value
+        if value > high or high != high:
+            high = value
+    if window_id is not None:
+        yield Window(origin + window_id * interval, count, total / count, low, high)
+
+
+def normalize_chunks(chunks, category, to_unit):
+    """Vectorized normalize(): yield (timestamps, values) arrays per chunk.
+
+    Each chunk is (timestamps, values, units), where units is one unit name
+    for the whole chunk or a per-point array of names or unit positions.
+    """
+    import numpy as np
+
+    from .batch import mixed_conversion
+
+    for timestamps, values, units in chunks:
+        values = np.asarray(values, dtype=np.float64)
+        if isinstance(units, str):
+            a, b, c, d = unit_transform(category, units, to_unit)
+            if c == 0:
+                # Same (a * value + b) / d as the scalar path, in place on a copy
+                converted = values * a
+                if b:
+                    converted += b
+                if d != 1:
+                    converted /= d
+                yield np.asarray(timestamps), converted
+                continue
+            units = np.full(len(values), registry.units(category).index(units), dtype=np.intp)
+        yield np.asarray(timestamps), mixed_conversion(values, category, units, to_unit)
+
+
+def resample_chunks(chunks, interval, origin=0.0):
+    """Vectorized resample(): aggregate (timestamps, values) array chunks into Windows.
+
+    Windows that span chunk boundaries are merged, so the output matches
+    resample() on the same points.
+    """
+    import numpy as np
+
+    pending = None  # [window id, count, total, min, max] of the still-open window
+    for timestamps, values in chunks:
+        if not len(values):
+            continue
+        ids = np.floor((np.asarray(timestamps, dtype=np.float64) - origin) / interval).astype(np.int64)
+        if (ids[1:] < ids[:-1]).any() or (pending is not None and ids[0] < pending[0]):
+            raise ValueError("timestamps must not decrease")
+        starts = np.concatenate(([0], np.flatnonzero(ids[1:] != ids[:-1]) + 1))
+        counts = np.diff(np.append(starts, len(ids)))
+        totals = np.add.reduceat(values, starts)
+        # fmin/fmax skip NaN like the comparisons in resample()
+        lows = np.fmin.reduceat(values, starts)
+        highs = np.fmax.reduceat(values, starts)
+        window_ids = ids[starts]
+
+        first = 0
+        if pending is not None:
+            if window_ids[0] == pending[0]:
+                pending[1] += int(counts[0])
+                pending[2] += float(totals[0])
+                pending[3] = float(np.fmin(pending[3], lows[0]))
+                pending[4] = float(np.fmax(pending[4], highs[0]))
+                first = 1
+            if first == len(starts):
+                continue
+            window_id, count, total, low, high = pending
+            yield Window(origin + window_id * interval, count, total / count, low, high)
+        for i in range(first, len(starts) - 1):
+            count = int(counts[i])
+            yield Window(origin + int(window_ids[i]) * interval, count, float(totals[i]) / count,
+                         float(lows[i]), float(highs[i]))
+        last = len(starts) - 1
+        pending = [int(window_ids[last]), int(counts[last]), float(totals[last]),
+                   float(lows[last]), float(highs[last])]
+    if pending is not None:
+        window_id, count, total, low, high = pending
+        yield Window(origin + window_id * interval, count, total / count, low, high)
@@ -0,0 +1,93 @@
+"""Invertible affine and reciprocal transforms between units.
+
+Every unit is described by a transform to its category's base unit,
+
+    base = (a * value + b) / (c * value + d)
+
+which covers plain factors (a, 0, 0, 1), offset scales such as Fahrenheit
+(5, 2298.35, 0, 9) and reciprocal units such as liters per 100 km
+(0, 100, 1, 0). Transforms of this form are closed under composition and
+inversion, so the conversion between any two units of a category is a
+single transform too. The registry composes each pair once, exactly in
+Fraction arithmetic, and keeps the closed-form coefficients as floats.
+"""
+import math
+from collections import namedtuple
+from fractions import Fraction
+
+Transform = namedtuple("Transform", ["a", "b", "c", "d"])
+
+IDENTITY = Transform(Fraction(1), Fraction(0), Fraction(0), Fraction(1))
+
+
+def exact(number):
+    """Return a number as a Fraction (floats are taken at their exact value)."""
+    return number if isinstance(number, Fraction) else Fraction(number)
+
+
+def as_transform(spec):
+    """Normalize a unit_definitions entry to an exact Transform.
+
+    Accepts a plain factor, (factor, offset), (factor, offset, reciprocal)
+    or an explicit (a, b, c, d) tuple.
+    """
+    if not isinstance(spec, tuple):
+        return Transform(exact(spec), Fraction(0), Fraction(0), Fraction(1))
+    if len(spec) == 2:
+        return Transform(exact(spec[0]), exact(spec[1]), Fraction(0), Fraction(1))
+    if len(spec) == 3:
+        factor, offset, reciprocal = exact(spec[0]), exact(spec[1]), spec[2]
+        if reciprocal:
+            # base = factor / value (+ offset)
+            return Transform(offset, factor, Fraction(1), Fraction(0))
+        return Transform(factor, offset, Fraction(0), Fraction(1))
+    return Transform(*map(exact, spec))
+
+
+def compose(outer, inner):
+    """Return the transform equal to outer(inner(value))."""
+    return Transform(
+        outer.a * inner.a + outer.b * inner.c,
+        outer.a * inner.b + outer.b * inner.d,
+        outer.c * inner.a + outer.d * inner.c,
+        outer.c * inner.b + outer.d * inner.d,
+    )
+
+
+def invert(transform):
+    """Return the inverse transform (value = inverse(base))."""
+    a, b, c, d = transform
+    if a * d - b * c == 0:
+        raise ValueError(f"transform {tuple(transform)} is not invertible")
+    return Transform(d, -b, -c, a)
+
+
+def normalize(transform):
+    """Scale an exact transform to coprime integer coefficients with a positive denominator."""
+    a, b, c, d = transform
+    multiple = math.lcm(a.denominator, b.denominator, c.denominator, d.denominator)
+    numbers = [int(x * multiple) for x in (a, b, c, d)]
+    divisor = math.gcd(*numbers) or 1
+    if numbers[3] < 0 or (numbers[3] == 0 and numbers[2] < 0):
+        divisor = -divisor
+    return Transform(*(Fraction(x, divisor) for x in numbers))
+
+
+def between(source, target):
+    """Return the exact transform converting source-unit values to target-unit values."""
+    return normalize(compose(invert(target), source))
+
+
+def closed_form(transform):
+    """Convert an exact transform to float coefficients for evaluation."""
+    return Transform(*map(float, transform))
+
+
+def evaluate(transform, value):
+    """Evaluate a float transform at value (a zero denominator gives infinity)."""
+    a, b, c, d = transform
+    # Skip zero terms so infinite values don't turn into 0 * inf = NaN
+    denominator = c * value + d if c else d
+    if denominator == 0:
+        return float('inf')
+    return (a * value + b if a else b) / denominator
@@ -0,0 +1,171 @@
+"""Unit definitions for every conversion category."""
+import math
+from fractions import Fraction
+
+# Exchange rates (as of a recent date)
+# In a real app, you would use an API to get current rates
+exchange_rates = {
+    "USD": 1.0,
+    "EUR": 0.92,
+    "GBP": 0.79,
+    "JPY": 149.5,
+    "CAD": 1.35,
+    "AUD": 1.52,
+    "INR": 83.1,
+    "CNY": 7.2,
+    "PKR": 278.5,  # Pakistani Rupee
+    "SAR": 3.75,    # Saudi Riyal
+    "AED": 3.67     # UAE Dirham
+}
+
+# Define unit definitions for every category, in display order.
+# A plain number is the factor to the category's base unit; a tuple is
+# (factor, offset) for affine units or (factor, offset, reciprocal) for
+# units that are inversely proportional to the base unit.
+unit_definitions = {
+    # Conversion factors to meters
+    "Length": {
+        "Meter": 1,
+        "Kilometer": 1000,
+        "Centimeter": 0.01,
+        "Millimeter": 0.001,
+        "Mile": 1609.34,
+        "Yard": 0.9144,
+        "Foot": 0.3048,
+        "Inch": 0.0254,
+        "Nautical Mile": 1852
+    },
+    # Conversion factors to grams
+    "Weight/Mass": {
+        "Kilogram": 1000,
+        "Gram": 1,
+        "Milligram": 0.001,
+        "Pound": 453.592,
+        "Ounce": 28.3495,
+        "Ton (Metric)": 1000000,
+        "Ton (US)": 907185,
+        "Stone": 6350.29
+    },
+    # Temperature transforms to kelvin: kelvin = (a * value + b) / (c * value + d)
+    "Temperature": {
+        "Celsius": (1, Fraction("273.15"), 0, 1),
+        "Fahrenheit": (5, Fraction("2298.35"), 0, 9),
+        "Kelvin": (1, 0, 0, 1),
+        "Rankine": (5, 0, 0, 9),
+        "Réaumur": (5, Fraction("1092.6"), 0, 4)
+    },
+    # Conversion factors to square meters
+    "Area": {
+        "Square Meter": 1,
+        "Square Kilometer": 1000000,
+        "Square Mile": 2590000,
+        "Hectare": 10000,
+        "Acre": 4046.86,
+        "Square Foot": 0.092903,
+        "Square Inch": 0.00064516,
+        "Square Yard": 0.836127
+    },
+    # Conversion factors to milliliters
+    "Volume": {
+        "Cubic Meter": 1000000,
+        "Liter": 1000,
+        "Milliliter": 1,
+        "Gallon (US)": 3785.41,
+        "Gallon (UK)": 4546.09,
+        "Quart (US)": 946.353,
+        "Pint (US)": 473.176,
+        "Cup": 236.588,
+        "Fluid Ounce (US)": 29.5735,
+        "Tablespoon": 14.7868,
+        "Teaspoon": 4.92892,
+        "Cubic Inch": 16.3871,
+        "Cubic Foot": 28316.8
+    },
+    # Conversion factors to seconds
+    "Time": {
+        "Second": 1,
+        "Minute": 60,
+        "Hour": 3600,
+        "Day": 86400,
+        "Week": 604800,
+        "Month (30 days)": 2592000,
+        "Year (365 days)": 31536000,
+        "Millisecond": 0.001,
+        "Microsecond": 0.000001,
+        "Nanosecond": 0.000000001
+    },
+    # Conversion factors to meters per second
+    "Speed": {
+        "Meter/Second": 1,
+        "Kilometer/Hour": 0.277778,
+        "Mile/Hour": 0.44704,
+        "Foot/Second": 0.3048,
+        "Knot": 0.514444,
+        "Mach (at sea level)": 340.29
+    },
+    # Conversion factors to pascals
+    "Pressure": {
+        "Pascal": 1,
+        "Kilopascal": 1000,
+        "Bar": 100000,
+        "PSI": 6894.76,
+        "Atmosphere": 101325,
+        "Torr": 133.322,
+        "Millimeter of Mercury": 133.322
+    },
+    # Conversion factors to joules
+    "Energy": {
+        "Joule": 1,
+        "Kilojoule": 1000,
+        "Calorie": 4.184,
+        "Kilocalorie": 4184,
+        "Watt-hour": 3600,
+        "Kilowatt-hour": 3600000,
+        "Electronvolt": 1.602176634e-19,
+        "British Thermal Unit": 1055.06,
+        "Foot-pound": 1.35582
+    },
+    # Conversion factors to watts
+    "Power": {
+        "Watt": 1,
+        "Kilowatt": 1000,
+        "Megawatt": 1000000,
+        "Horsepower": 745.7,
+        "Foot-pound/minute": 0.0225969,
+        "BTU/hour": 0.29307107
+    },
+    # Conversion factors to bytes (using binary prefixes)
+    "Data": {
+        "Bit": 0.125,
+        "Byte": 1,
+        "Kilobyte (KB)": 1024,
+        "Megabyte (MB)": 1024**2,
+        "Gigabyte (GB)": 1024**3,
+        "Terabyte (TB)": 1024**4,
+        "Petabyte (PB)": 1024**5,
+        "Kibibyte (KiB)": 1024,
+        "Mebibyte (MiB)": 1024**2,
+        "Gibibyte (GiB)": 1024**3,
+        "Tebibyte (TiB)": 1024**4,
+        "Pebibyte (PiB)": 1024**5
+    },
+    # Conversion factors to radians
+    "Angle": {
+        "Degree": math.pi/180,
+        "Radian": 1,
+        "Gradian": math.pi/200,
+        "Minute of Arc": math.pi/(180*60),
+        "Second of Arc": math.pi/(180*3600),
+        "Turn/Revolution": 2*math.pi
+    },
+    # Conversion factors to kilometers per liter
+    # ("Liters per 100 Kilometers" is the reciprocal transform: kpl = 100 / value)
+    "Fuel Economy": {
+        "Miles per Gallon (US)": 0.425144,
+        "Miles per Gallon (UK)": 0.354006,
+        "Kilometers per Liter": 1,
+        "Liters per 100 Kilometers": (0, 100, 1, 0)
+    },
+    # Conversion factors to US dollars
+    "Currency": {currency: 1 / rate for currency, rate in exchange_rates.items()}
+}